@@ -0,0 +1,53 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import unittest.mock
+
+import numpy as np
+
+from orchid import (
+    base_time_series_adapter as bca,
+    net_array,
+    project_store as loader,
+)
+
+from tests import stub_net as tsn
+
+# noinspection PyUnresolvedReferences
+from System import Double, Int64
+
+
+class StubBaseTimeSeriesAdapter(bca.BaseTimeSeriesAdapter):
+    def quantity_name_unit_map(self, project_units):
+        pass
+
+
+def test_data_points_of_1m_sample_time_series(benchmark):
+    sample_count = 1_000_000
+    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(
+        net_array.as_net_array(np.random.default_rng(1729).normal(6000.0, 250.0, sample_count), Double),
+        net_array.as_net_array(np.arange(1618221600, 1618221600 + sample_count, dtype=np.int64), Int64))
+    # Without a project, `data_points` does not cache the converted samples so each round converts all samples.
+    sut = StubBaseTimeSeriesAdapter(tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_A, 'pressio'), None)
+
+    with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                             spec=loader.as_python_time_series_arrays,
+                             return_value=stub_python_time_series_arrays_dto):
+        actual = benchmark(sut.data_points)
+
+    assert len(actual) == sample_count
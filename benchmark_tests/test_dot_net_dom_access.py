@@ -0,0 +1,59 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+from collections import namedtuple
+import uuid
+
+from orchid import (
+    dot_net_dom_access as dna,
+)
+
+
+SyntheticNetStage = namedtuple('SyntheticNetStage', ['ObjectId', 'DisplayNameWithWell', 'OrderOfCompletionOnWell'])
+
+
+class SyntheticStageAdapter(dna.IdentifiedDotNetAdapter):
+    display_name_with_well = dna.dom_property('display_name_with_well', '')
+    order_of_completion_on_well = dna.dom_property('order_of_completion_on_well', '')
+
+
+def make_synthetic_stage_adapters(count):
+    return [SyntheticStageAdapter(SyntheticNetStage(str(uuid.uuid4()), f'Synthetic-{i}', i)) for i in range(count)]
+
+
+def read_properties_resolving_names_on_each_read(adapters):
+    # The cost of reading DOM properties before resolving the .NET property name when defining the adapter class
+    for adapter in adapters:
+        dna.get_dot_net_property_value('display_name_with_well', adapter.dom_object)
+        dna.get_dot_net_property_value('order_of_completion_on_well', adapter.dom_object)
+        dna.as_object_id(dna.get_dot_net_property_value('object_id', adapter.dom_object))
+
+
+def read_properties(adapters):
+    for adapter in adapters:
+        _ = adapter.display_name_with_well
+        _ = adapter.order_of_completion_on_well
+        _ = adapter.object_id
+
+
+def test_read_dom_properties_resolving_names_on_each_read(benchmark):
+    benchmark(read_properties_resolving_names_on_each_read, make_synthetic_stage_adapters(1_000))
+
+
+def test_read_dom_properties(benchmark):
+    benchmark(read_properties, make_synthetic_stage_adapters(1_000))
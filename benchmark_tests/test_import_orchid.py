@@ -0,0 +1,38 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_in_new_interpreter(statements):
+    # Each import must run in a new interpreter; a second import in the same interpreter does nothing.
+    subprocess.run([sys.executable, '-c', statements], check=True)
+
+
+@pytest.mark.parametrize('statements', [
+    pytest.param('pass', id='interpreter_only'),
+    pytest.param('import orchid', id='import_orchid'),
+    pytest.param('import orchid; orchid.unit_registry', id='import_orchid_measurement'),
+    pytest.param('import orchid; orchid.load_project', id='import_orchid_bootstrapping_dot_net'),
+])
+def test_import_orchid(benchmark, statements):
+    benchmark.pedantic(_run_in_new_interpreter, args=(statements,), rounds=5, iterations=1)
@@ -0,0 +1,59 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+import pytest
+
+from orchid import (
+    native_data_frame_adapter as dfa,
+)
+
+from tests import stub_net as tsn
+
+# noinspection PyUnresolvedReferences
+from System import DateTimeOffset, DBNull, Double, Int32, Int64, String, TimeSpan
+# noinspection PyUnresolvedReferences
+from System.Data import DataTable
+
+
+def make_observations_data_table(row_count):
+    result = DataTable()
+    for column_name, column_type in [('Timestamp', DateTimeOffset), ('Pick Time Offset', TimeSpan),
+                                     ('Easting', Double), ('Stage Number', Int32), ('Well', String)]:
+        result.Columns.Add(column_name, column_type)
+
+    start_ticks = DateTimeOffset.UnixEpoch.AddYears(50).UtcTicks
+    for row_no in range(row_count):
+        row = result.NewRow()
+        row['Timestamp'] = DateTimeOffset(Int64(start_ticks + row_no * TimeSpan.TicksPerSecond), TimeSpan.Zero)
+        row['Pick Time Offset'] = TimeSpan.FromSeconds(row_no * 0.5)
+        row['Easting'] = DBNull.Value if row_no % 97 == 0 else 1000.0 + row_no
+        row['Stage Number'] = row_no % 50 + 1
+        row['Well'] = f'Demo_{row_no % 4 + 1}H'
+        result.Rows.Add(row)
+    return result
+
+
+@pytest.mark.slow
+def test_convert_100k_row_data_table_to_pandas_data_frame(benchmark):
+    stub_net_data_frame = tsn.create_stub_net_data_frame()
+    stub_net_data_frame.DataTable = make_observations_data_table(100_000)
+    sut = dfa.NativeDataFrameAdapterIdentified(stub_net_data_frame)
+
+    actual = benchmark(sut.pandas_data_frame)
+
+    assert actual.shape == (100_000, 5)
@@ -0,0 +1,55 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"); 
+#  you may not use this file except in compliance with the License. 
+#  You may obtain a copy of the License at 
+#
+#      http://www.apache.org/licenses/LICENSE-2.0 
+#
+#  Unless required by applicable law or agreed to in writing, software 
+#  distributed under the License is distributed on an "AS IS" BASIS, 
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. 
+#  See the License for the specific language governing permissions and 
+#  limitations under the License. 
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+
+import pytest
+
+import orchid
+from orchid import project_store as loader
+
+
+def _load_all_native_time_series():
+    load_path = orchid.training_data_path().joinpath('Project_frankNstein_Permian_UTM13_FEET.ifrac')
+    return [series.dom_object for series in orchid.load_project(str(load_path)).time_series().all_objects()]
+
+
+def _read_all_time_series_arrays(native_time_series):
+    # Read the .NET arrays directly so that the time series cache of the project does not hide the reads.
+    return [loader.as_python_time_series_arrays(series) for series in native_time_series]
+
+
+@pytest.mark.slow
+def test_read_time_series_initializing_script_adapter_per_curve(benchmark):
+    native_time_series = _load_all_native_time_series()
+
+    actual = benchmark(_read_all_time_series_arrays, native_time_series)
+
+    assert len(actual) == len(native_time_series)
+
+
+@pytest.mark.slow
+def test_read_time_series_in_session(benchmark):
+    native_time_series = _load_all_native_time_series()
+
+    def read_in_session():
+        with orchid.session():
+            return _read_all_time_series_arrays(native_time_series)
+
+    actual = benchmark(read_in_session)
+
+    assert len(actual) == len(native_time_series)
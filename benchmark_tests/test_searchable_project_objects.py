@@ -0,0 +1,65 @@
+#  Copyright 2017-2025 KAPPA
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# This file is part of Orchid and related technologies.
+#
+
+
+from collections import namedtuple
+import time
+import uuid
+
+import pytest
+
+from orchid import (
+    dom_project_object as dpo,
+    searchable_project_objects as spo,
+)
+
+
+SyntheticNetProjectObject = namedtuple('SyntheticNetProjectObject', ['ObjectId', 'Name', 'DisplayName'])
+
+
+def make_synthetic_net_project_objects(count):
+    return [SyntheticNetProjectObject(str(uuid.uuid4()), f'synthetic-{i}', f'Synthetic {i}') for i in range(count)]
+
+
+def fastest_construction_seconds(net_project_objects, repeat=5):
+    def construction_seconds():
+        start = time.perf_counter()
+        spo.SearchableProjectObjects(dpo.DomProjectObject, net_project_objects)
+        return time.perf_counter() - start
+
+    return min(construction_seconds() for _ in range(repeat))
+
+
+def test_construct_searchable_project_objects_from_10k_objects(benchmark):
+    net_project_objects = make_synthetic_net_project_objects(10_000)
+
+    actual = benchmark(spo.SearchableProjectObjects, dpo.DomProjectObject, net_project_objects)
+
+    assert len(actual) == 10_000
+
+
+@pytest.mark.slow
+def test_construct_searchable_project_objects_scales_linearly():
+    small_net_project_objects = make_synthetic_net_project_objects(1_000)
+    large_net_project_objects = make_synthetic_net_project_objects(10_000)
+
+    small_seconds = fastest_construction_seconds(small_net_project_objects)
+    large_seconds = fastest_construction_seconds(large_net_project_objects)
+
+    # Ten times the objects should take roughly ten times as long. A quadratic construction takes roughly one
+    # hundred times as long. The generous bound allows for timing noise.
+    assert large_seconds / small_seconds < 30
@@ -1,4 +1,5 @@
 import orchid
+from orchid import fiber_data_cache
 
 orchid_training_data_path = orchid.training_data_path()
 # note that you'll need to map the fiber db based on your local paths for this project
@@ -10,8 +11,19 @@ data_set = fiber_data.get_data_set()
 # Reconstructing the data table from the data_set, dates and depths
 data_set.columns = fiber_data.dates
 data_set.insert(0, "Depths", fiber_data.depths)
-# Getting the data table which takes few minutes if you don't specify start and/or end indexes
+# Getting the entire data table needs memory for the entire table; alternatively, process the table in windows
 data_table = fiber_data.get_data_table()
+for window in fiber_data.iter_data_table(chunk_rows=500,
+                                         progress=lambda read, total: print(f'Read {read} of {total} rows')):
+    print(window.describe())
+
+# Optionally cache the data set on disk; later runs memory map the cached data set instead of extracting it again
+cache = fiber_data_cache.FiberDataCache(orchid_training_data_path.joinpath('fiber_cache'))
+cached_data_set = cache.data_set(fiber_data)
+print(cached_data_set.select(min_depth=fiber_data.depths[0], max_depth=fiber_data.depths[10]).values.mean())
+# To plot a waterfall, read only the tiles of the multi-resolution pyramid needed to fill the plot
+waterfall_tiles = cache.pyramid(fiber_data).viewport(max_rows=800, max_columns=1200)
+print(waterfall_tiles.level, waterfall_tiles.mean.shape)
 
 name = fiber_data.name
 depth_unit = fiber_data.depth_unit
@@ -16,27 +16,86 @@
 #
 
 
-# Load the appropriate runtime **before** executing `import clr`
-import pythonnet
-pythonnet.load('coreclr')
-
-from .dot_net import prepare_imports
-prepare_imports()
-
-# High-level API
-from .core import load_project, save_project, optimized_but_possibly_unsafe_save
-
-# Helpful constants
-from .native_treatment_curve_adapter import TreatmentCurveTypes
-from .native_time_series_adapter import TimeSeriesCurveTypes
-from .net_date_time import UTC
-
-# Helpful functions
-from .convert import to_unit
-from .measurement import registry as unit_registry
-from .native_treatment_calculations import (median_treating_pressure, pumped_fluid_volume, total_proppant_mass)
-from .reference_origins import WellReferenceFrameXy
-from .unit_system import abbreviation, make_measurement
-
-# Only for training data
-from .configuration import training_data_path
+import importlib
+from typing import TYPE_CHECKING
+
+from . import dot_net_bootstrap, startup_timing
+
+# Importing `orchid` does not load .NET; the first import of a .NET namespace does.
+dot_net_bootstrap.install_import_hook()
+
+# The public API of the package: each name and the module (and attribute) defining it. Accessing a name imports
+# its module (and so possibly bootstraps .NET) only when first accessed.
+_LAZY_EXPORTS = {
+    # High-level API
+    'load_project': ('.core', 'load_project'),
+    'save_project': ('.core', 'save_project'),
+    'optimized_but_possibly_unsafe_save': ('.core', 'optimized_but_possibly_unsafe_save'),
+    'session': ('.core', 'session'),
+
+    # Helpful constants
+    'TreatmentCurveTypes': ('.native_treatment_curve_adapter', 'TreatmentCurveTypes'),
+    'TimeSeriesCurveTypes': ('.native_time_series_adapter', 'TimeSeriesCurveTypes'),
+    'UTC': ('.net_date_time', 'UTC'),
+
+    # Helpful functions
+    'to_unit': ('.convert', 'to_unit'),
+    'unit_registry': ('.measurement', 'registry'),
+    'median_treating_pressure': ('.native_treatment_calculations', 'median_treating_pressure'),
+    'pumped_fluid_volume': ('.native_treatment_calculations', 'pumped_fluid_volume'),
+    'total_proppant_mass': ('.native_treatment_calculations', 'total_proppant_mass'),
+    'WellReferenceFrameXy': ('.reference_origins', 'WellReferenceFrameXy'),
+    'abbreviation': ('.unit_system', 'abbreviation'),
+    'make_measurement': ('.unit_system', 'make_measurement'),
+
+    # Only for training data
+    'training_data_path': ('.configuration', 'training_data_path'),
+
+    # Configuration
+    'reload_configuration': ('.configuration', 'reload_configuration'),
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        # Scripts written before the lazy exports access submodules, like `orchid.core`, after only `import orchid`.
+        return _import_submodule(name)
+
+    with startup_timing.timed('import_api'):
+        result = getattr(importlib.import_module(module_name, __name__), attribute_name)
+    # Later accesses find the name without calling this function.
+    globals()[name] = result
+    return result
+
+
+def _import_submodule(name):
+    submodule_name = f'{__name__}.{name}'
+    try:
+        with startup_timing.timed('import_api'):
+            # Importing a submodule also binds it as an attribute of this package.
+            return importlib.import_module(submodule_name)
+    except ModuleNotFoundError as error:
+        if error.name != submodule_name:
+            raise
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from .core import load_project, save_project, optimized_but_possibly_unsafe_save, session
+    from .native_treatment_curve_adapter import TreatmentCurveTypes
+    from .native_time_series_adapter import TimeSeriesCurveTypes
+    from .net_date_time import UTC
+    from .convert import to_unit
+    from .measurement import registry as unit_registry
+    from .native_treatment_calculations import (median_treating_pressure, pumped_fluid_volume, total_proppant_mass)
+    from .reference_origins import WellReferenceFrameXy
+    from .unit_system import abbreviation, make_measurement
+    from .configuration import training_data_path, reload_configuration
@@ -14,7 +14,9 @@
 
 
 from abc import ABCMeta, abstractmethod
-from typing import Callable, Union
+import bisect
+import datetime as dt
+from typing import Callable, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -22,6 +24,8 @@ import pandas as pd
 from orchid import (
     dom_project_object as dpo,
     dot_net_dom_access as dna,
+    downsampling,
+    net_array,
     project_store as loader,
     unit_system as units,
 )
@@ -32,6 +36,13 @@ from Orchid.FractureDiagnostics.SDKFacade import ScriptAdapter
 from Orchid.FractureDiagnostics.TimeSeries import IQuantityTimeSeries
 
 
+TimePoint = Union[dt.datetime, pd.Timestamp, np.datetime64]
+"""The types of time points limiting the samples of a time series; `pendulum.DateTime` is a `datetime`."""
+
+_NET_TIME_STAMP_DTYPES = {'System.Int64': np.int64, 'System.Int32': np.int32, 'System.Double': np.float64}
+"""The `numpy` data type matching the layout of each .NET element type of the Unix time stamps."""
+
+
 class BaseTimeSeriesAdapter(dpo.DomProjectObject, metaclass=ABCMeta):
     def __init__(self, adaptee: IQuantityTimeSeries, net_project_callable: Callable):
         """
@@ -74,18 +85,141 @@ class BaseTimeSeriesAdapter(dpo.DomProjectObject, metaclass=ABCMeta):
         quantity_name_unit_map = self.quantity_name_unit_map(self.expect_project_units)
         return quantity_name_unit_map[self.sampled_quantity_name]
 
-    def data_points(self) -> pd.Series:
+    def data_points(self, start: Optional[TimePoint] = None, stop: Optional[TimePoint] = None,
+                    max_points: Optional[int] = None,
+                    method: Union[str, downsampling.DownsamplingMethod] = downsampling.DownsamplingMethod.LTTB
+                    ) -> pd.Series:
         """
         Return the time series for this curve.
 
+        This method copies the .NET arrays of sample magnitudes and time stamps in a single block each; it does
+        not convert each sample separately. When limiting the time series to a window, this method finds the
+        window by a binary search of the time stamps and converts only the samples in the window.
+
+        Args:
+            start: The earliest time of the returned samples. If `None`, return samples from the first sample.
+            stop: The latest time of the returned samples. If `None`, return samples to the last sample.
+            Time points without a time zone are assumed to be UTC.
+            max_points: The maximum number of samples returned; for example, the width of a plot in pixels. If
+            `None`, return all samples (in the window).
+            method: The method used to choose at most `max_points` samples: 'lttb' (Largest-Triangle-Three-Buckets)
+            preserves the visual shape of the curve; 'minmax' preserves the minimum and maximum of each bucket of
+            samples. Downsampling ignores samples whose magnitude is NaN.
+
+        If this curve belongs to a project, this method caches the converted samples in the time series cache of
+        the project (see `Project.time_series_cache`).
+
         Returns
             The `pandas` time `Series` for this curve.
         """
+        start_nanoseconds = _as_unix_nanoseconds(start) if start is not None else None
+        stop_nanoseconds = _as_unix_nanoseconds(stop) if stop is not None else None
+
+        def read_data_points():
+            return self._read_data_points(start_nanoseconds, stop_nanoseconds)
+
+        result = self._maybe_project_context.map_or_else(
+            lambda context: context.time_series_cache.get_or_add((self.object_id, start_nanoseconds,
+                                                                  stop_nanoseconds), read_data_points),
+            read_data_points)
+        if max_points is None or len(result) <= max_points:
+            return result
+
+        # The cache retains all samples of the window so that plots of different sizes share a single entry.
+        chosen = downsampling.downsample_indices(result.index.asi8, result.to_numpy(), max_points,
+                                                 downsampling.DownsamplingMethod(method))
+        return result.iloc[chosen]
+
+    def data_points_after(self, after: TimePoint) -> pd.Series:
+        """
+        Return the samples of this curve later than a time point; for example, the last time point already read.
+
+        Use this method to poll a curve that grows while it is observed (for example, by reloading a project
+        during an active treatment). This method finds the first newer sample by a binary search of the .NET time
+        stamps and converts only the newer samples so its cost is proportional to the number of newer samples
+        and not to the number of all samples. It neither reads nor changes the time series cache of the project.
+
+        Args:
+            after: The time point preceding the returned samples. A time point without a time zone is assumed to
+            be UTC.
+
+        Returns:
+            The `pandas` time `Series` of the samples later than `after`.
+        """
+        after_nanoseconds = _as_unix_nanoseconds(after)
         python_time_series_arrays = loader.as_python_time_series_arrays(self.dom_object)
 
-        result = pd.Series(data=np.fromiter(python_time_series_arrays.SampleMagnitudes, dtype='float'),
-                           index=pd.DatetimeIndex(np.fromiter(python_time_series_arrays.UnixTimeStampsInSeconds,
-                                                              dtype='datetime64[s]'), tz='UTC'),
-                           name=self.name)
+        net_time_stamps = python_time_series_arrays.UnixTimeStampsInSeconds
+        to_nanoseconds = _unix_time_stamp_to_nanoseconds_function(net_time_stamps)
+        window_start = bisect.bisect_right(net_time_stamps, after_nanoseconds, key=to_nanoseconds)
+        window_nanoseconds = _unix_time_stamps_to_nanoseconds(net_time_stamps, window_start)
+        return self._as_series(python_time_series_arrays.SampleMagnitudes, window_start, window_nanoseconds)
+
+    def _read_data_points(self, start_nanoseconds: Optional[int], stop_nanoseconds: Optional[int]) -> pd.Series:
+        python_time_series_arrays = loader.as_python_time_series_arrays(self.dom_object)
 
-        return result
+        # Find the window by a binary search of the .NET time stamps so that only the window is copied.
+        net_time_stamps = python_time_series_arrays.UnixTimeStampsInSeconds
+        to_nanoseconds = _unix_time_stamp_to_nanoseconds_function(net_time_stamps)
+        window_start = (bisect.bisect_left(net_time_stamps, start_nanoseconds, key=to_nanoseconds)
+                        if start_nanoseconds is not None else 0)
+        window_stop = (bisect.bisect_right(net_time_stamps, stop_nanoseconds, lo=window_start, key=to_nanoseconds)
+                       if stop_nanoseconds is not None else net_time_stamps.Length)
+        window_nanoseconds = _unix_time_stamps_to_nanoseconds(net_time_stamps, window_start,
+                                                              max(window_start, window_stop))
+        return self._as_series(python_time_series_arrays.SampleMagnitudes, window_start, window_nanoseconds)
+
+    def _as_series(self, net_sample_magnitudes, window_start: int, window_nanoseconds: np.ndarray) -> pd.Series:
+        sample_magnitudes = net_array.slice_as_numpy_array(net_sample_magnitudes, window_start,
+                                                           window_start + len(window_nanoseconds), np.float64)
+        return pd.Series(data=sample_magnitudes,
+                         index=pd.DatetimeIndex(window_nanoseconds.view('datetime64[ns]')).tz_localize('UTC'),
+                         name=self.name)
+
+
+def _as_unix_nanoseconds(time_point: TimePoint) -> int:
+    result = pd.Timestamp(time_point)
+    if result.tzinfo is None:
+        result = result.tz_localize('UTC')
+    return result.as_unit('ns').value
+
+
+def _unix_time_stamps_to_nanoseconds(net_unix_time_stamps, start: int = 0,
+                                     stop: Optional[int] = None) -> np.ndarray:
+    """
+    Copy a .NET array of Unix time stamps (in seconds) into a `numpy` array of nanoseconds since the Unix epoch.
+
+    Args:
+        net_unix_time_stamps: The .NET array of (integral or floating point) Unix time stamps in seconds.
+        start: The index of the first time stamp copied.
+        stop: The index following the last time stamp copied. If `None`, copy to the end of the array.
+
+    Returns:
+        The `np.int64` nanoseconds since the Unix epoch of each time stamp. Fractional seconds are preserved.
+    """
+    return _seconds_to_nanoseconds(net_array.slice_as_numpy_array(
+        net_unix_time_stamps, start, stop if stop is not None else net_unix_time_stamps.Length,
+        _net_time_stamp_dtype(net_unix_time_stamps)))
+
+
+def _seconds_to_nanoseconds(seconds: np.ndarray) -> np.ndarray:
+    if np.issubdtype(seconds.dtype, np.floating):
+        # Scale the whole and fractional seconds separately; scaling the time stamp itself loses precision.
+        whole_seconds = np.floor(seconds)
+        return (whole_seconds.astype(np.int64) * 1_000_000_000 +
+                np.round((seconds - whole_seconds) * 1_000_000_000).astype(np.int64))
+    return seconds.astype(np.int64) * 1_000_000_000
+
+
+def _unix_time_stamp_to_nanoseconds_function(net_unix_time_stamps) -> Callable[[Union[int, float]], int]:
+    """Return a function converting a single item of `net_unix_time_stamps` exactly as the array is converted."""
+    dtype = _net_time_stamp_dtype(net_unix_time_stamps)
+    return lambda seconds: int(_seconds_to_nanoseconds(np.array([seconds], dtype=dtype))[0])
+
+
+def _net_time_stamp_dtype(net_unix_time_stamps):
+    element_type_name = net_unix_time_stamps.GetType().GetElementType().FullName
+    try:
+        return _NET_TIME_STAMP_DTYPES[element_type_name]
+    except KeyError:
+        raise TypeError(f'Unexpected element type, {element_type_name}, of Unix time stamps.')
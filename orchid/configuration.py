@@ -19,11 +19,13 @@ import glob
 import logging
 import os
 import pathlib
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional, Tuple
 import warnings
 import toolz.curried as toolz
 import yaml
 
+from orchid import startup_timing
 from orchid.version import get_orchid_sdk_version
 
 
@@ -37,6 +39,13 @@ class ConfigurationError(Exception):
 # Constants for environment variable names
 ORCHID_ROOT_ENV_VAR = 'ORCHID_ROOT'
 ORCHID_TRAINING_DATA_ENV_VAR = 'ORCHID_TRAINING_DATA'
+# The environment variables read when calculating the configuration
+CONFIGURATION_ENV_VARS = (ORCHID_ROOT_ENV_VAR, ORCHID_TRAINING_DATA_ENV_VAR, 'ProgramFiles')
+
+
+_configuration_lock = threading.Lock()
+# The resolved configuration and the state of its sources (see `_configuration_sources_key`) when resolved
+_cached_configuration: Optional[Tuple[Tuple, Dict[str, Dict[str, Any]]]] = None
 
 
 def get_environment_configuration() -> Dict[str, Dict[str, str]]:
@@ -101,7 +110,7 @@ def get_file_configuration() -> Dict[str, Any]:
     # user-specific (and system-specific) home directory. See the Python documentation of `home()` for
     # details.
     file = {}
-    file_config_path = pathlib.Path.home().joinpath('.orchid', 'python_api.yaml')
+    file_config_path = configuration_file_path()
     if file_config_path.exists():
         with file_config_path.open('r') as in_stream:
             file = yaml.full_load(in_stream)
@@ -109,13 +118,74 @@ def get_file_configuration() -> Dict[str, Any]:
     return file
 
 
+def configuration_file_path() -> pathlib.Path:
+    """
+    Returns the path of the (optional) configuration file, `python_api.yaml`.
+
+    Returns:
+        The path of the configuration file whether or not it exists.
+    """
+    return pathlib.Path.home().joinpath('.orchid', 'python_api.yaml')
+
+
 def get_configuration() -> Dict[str, Dict[str, Any]]:
     """
     Calculate the configuration for the Python API.
 
+    Calculating the configuration searches the file system and reads the configuration file so this function
+    caches the calculated configuration. It recalculates the configuration only if the modification time of the
+    configuration file or the value of a configuration environment variable changes, or after a call to
+    `reload_configuration()`.
+
         Returns: The Python API configuration.
     """
+    global _cached_configuration
+
+    sources_key = _configuration_sources_key()
+    with _configuration_lock:
+        if _cached_configuration is not None and _cached_configuration[0] == sources_key:
+            return _copy_configuration(_cached_configuration[1])
+
+    with startup_timing.timed('resolve_configuration'):
+        result = _resolve_configuration()
+    with _configuration_lock:
+        _cached_configuration = (sources_key, result)
+    return _copy_configuration(result)
+
+
+def reload_configuration() -> Dict[str, Dict[str, Any]]:
+    """
+    Discard the cached configuration and recalculate it; for example, after installing a new version of Orchid.
+
+        Returns: The recalculated Python API configuration.
+    """
+    _discard_cached_configuration()
+    return get_configuration()
+
+
+def _discard_cached_configuration():
+    global _cached_configuration
+
+    with _configuration_lock:
+        _cached_configuration = None
+
+
+def _configuration_sources_key() -> Tuple:
+    # The state of all sources of the configuration: the modification time (if any) of the configuration file and
+    # the values of the environment variables.
+    try:
+        file_modification_time = configuration_file_path().stat().st_mtime_ns
+    except OSError:
+        file_modification_time = None
+    return (file_modification_time,) + tuple(os.environ.get(env_var) for env_var in CONFIGURATION_ENV_VARS)
+
+
+def _copy_configuration(configuration: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    # Callers may change the returned configuration without changing the cached configuration.
+    return {key: dict(child) if isinstance(child, dict) else child for key, child in configuration.items()}
+
 
+def _resolve_configuration() -> Dict[str, Dict[str, Any]]:
     fallback_configuration = get_fallback_configuration()
     file_configuration = get_file_configuration()
     env_configuration = get_environment_configuration()
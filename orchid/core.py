@@ -18,6 +18,7 @@
 #
 
 
+import contextlib
 from typing import Optional
 
 import deal
@@ -25,6 +26,7 @@ import option
 
 from orchid.project import Project
 from orchid.project_store import ProjectStore
+import orchid.script_adapter_context as sac
 
 # To support doctests only
 import shutil
@@ -56,6 +58,27 @@ def load_project(ifrac_pathname: str) -> Project:
     return result
 
 
+@contextlib.contextmanager
+def session():
+    """
+    Keep the Orchid script adapter initialized for the duration of a batch of operations.
+
+    Each operation needing the Orchid script adapter (for example, loading a project or reading the samples of a
+    time series) initializes the adapter and shuts it down when finished unless an adapter is already
+    initialized. Performing many operations within a session initializes the adapter only once.
+
+    Examples:
+        >>> load_path = orchid.training_data_path().joinpath('frankNstein_Bakken_UTM13_FEET.ifrac')
+        >>> with orchid.session():
+        ...     loaded_project = orchid.load_project(str(load_path))
+        ...     all_samples = [series.data_points() for series in loaded_project.time_series().all_objects()]
+        >>> len(all_samples) > 0
+        True
+    """
+    with sac.ScriptAdapterContext():
+        yield
+
+
 # TODO: change `ifrac_pathname` to be `str` or `pathlib.Path`
 @deal.pre(lambda project, _: project is not None)
 @deal.pre(lambda _, ifrac_pathname: ifrac_pathname is not None)
@@ -0,0 +1,111 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Defers loading the .NET runtime and the Orchid assemblies until first needed.
+
+Loading the .NET runtime and adding references to the Orchid assemblies takes time. Many uses of the `orchid`
+package (for example, reading the configuration or using the `pint` unit registry) need no .NET types at all.
+Importing `orchid` therefore only installs an import hook. The first import of a .NET namespace (for example,
+`from System import DateTime` or `from Orchid.FractureDiagnostics import IProject`), typically by an adapter
+module, bootstraps .NET and then removes the hook.
+
+Scripts import `orchid` before their own `import clr` or `from System import ...`; therefore, once `orchid` is
+imported, importing any .NET top-level name bootstraps .NET regardless of the importing module.
+"""
+
+import importlib.abc
+import sys
+import threading
+
+from orchid import startup_timing
+
+
+# The top-level names of the modules requiring the bootstrapped .NET runtime and Orchid assemblies
+DOT_NET_TOP_LEVEL_NAMES = frozenset(['clr', 'Optional', 'Orchid', 'System', 'UnitsNet'])
+
+# These modules perform the bootstrap; the hook ignores the .NET imports of these modules themselves.
+_BOOTSTRAP_MODULE_NAMES = ('orchid.script_adapter_context', 'orchid.dot_net')
+
+_bootstrap_lock = threading.RLock()
+_is_bootstrapped = False
+_is_bootstrapping = False
+
+
+def is_bootstrapped() -> bool:
+    """Return `True` if the .NET runtime and the Orchid assemblies are loaded; otherwise, `False`."""
+    return _is_bootstrapped
+
+
+def bootstrap():
+    """
+    Load the .NET runtime and add references to the Orchid assemblies unless already loaded.
+
+    Calling this function is only needed to control *when* the (possibly slow) bootstrap occurs; for example, to
+    bootstrap before timing some operation.
+    """
+    global _is_bootstrapped, _is_bootstrapping
+
+    with _bootstrap_lock:
+        if _is_bootstrapped or _is_bootstrapping:
+            return
+
+        _is_bootstrapping = True
+        try:
+            # Load the appropriate runtime **before** executing `import clr`
+            with startup_timing.timed('load_runtime'):
+                import pythonnet
+                pythonnet.load('coreclr')
+
+            with startup_timing.timed('prepare_imports'):
+                from orchid import dot_net
+                dot_net.prepare_imports()
+
+            _is_bootstrapped = True
+            uninstall_import_hook()
+        finally:
+            _is_bootstrapping = False
+
+
+class _DotNetImportHook(importlib.abc.MetaPathFinder):
+    """Bootstraps .NET before the first import of a .NET namespace but leaves finding the module to others."""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname in DOT_NET_TOP_LEVEL_NAMES and not any(map(_is_initializing, _BOOTSTRAP_MODULE_NAMES)):
+            bootstrap()
+        return None
+
+
+_import_hook = _DotNetImportHook()
+
+
+def install_import_hook():
+    """Install the hook bootstrapping .NET on the first import of a .NET namespace."""
+    with _bootstrap_lock:
+        if not _is_bootstrapped and _import_hook not in sys.meta_path:
+            sys.meta_path.insert(0, _import_hook)
+
+
+def uninstall_import_hook():
+    with _bootstrap_lock:
+        if _import_hook in sys.meta_path:
+            sys.meta_path.remove(_import_hook)
+
+
+def _is_initializing(module_name: str) -> bool:
+    # While executing the body of a module, the import system marks the specification of the module as
+    # initializing. (This flag is the source of the "partially initialized module" message.)
+    module = sys.modules.get(module_name)
+    return module is not None and getattr(getattr(module, '__spec__', None), '_initializing', False)
+
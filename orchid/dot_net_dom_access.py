@@ -15,14 +15,17 @@
 # This file is part of Orchid and related technologies.
 #
 
+import copy
+import operator
 import uuid
-from typing import Callable, Mapping, Union
+from typing import Callable, MutableMapping, Union
 
 import deal
 import option
 import toolz.curried as toolz
 
 from orchid import (
+    project_context as opc,
     unit_system as units,
 )
 
@@ -38,12 +41,11 @@ from System import Guid
 # attribute name at definition time (because `self` was only available at run-time).
 
 
-def get_dot_net_property_value(attribute_name, dom_object):
+def dot_net_property_name(attribute_name: str) -> str:
     """
-    Return the value of the DOM property whose name corresponds to `attribute_name`.
-    :param attribute_name: The Python `attribute_name`.
-    :param dom_object: The DOM object whose property is sought.
-    :return: The value of the DOM property.
+    Return the name of the DOM property corresponding to the Python `attribute_name`.
+    :param attribute_name: The Python `attribute_name`; for example, 'display_name_with_well'.
+    :return: The name of the DOM property; for example, 'DisplayNameWithWell'.
     """
     @toolz.curry
     def python_name_to_words(python_name):
@@ -55,33 +57,65 @@ def get_dot_net_property_value(attribute_name, dom_object):
     def words_to_dot_net_property_name(words):
         return ''.join(words)
 
-    @toolz.curry
-    def get_value_from_dom(dom, property_name):
-        return getattr(dom, property_name)
-
     # The function, `thread_last`, from `toolz.curried`, "splices" threads a value (the first argument)
     # through each of the remaining functions as the *last* argument to each of these functions.
     result = toolz.thread_last(attribute_name,
                                python_name_to_words,
                                capitalize_words,
-                               words_to_dot_net_property_name,
-                               get_value_from_dom(dom_object))
+                               words_to_dot_net_property_name)
     return result
 
 
-def dom_property(attribute_name, docstring):
+def get_dot_net_property_value(attribute_name, dom_object):
+    """
+    Return the value of the DOM property whose name corresponds to `attribute_name`.
+    :param attribute_name: The Python `attribute_name`.
+    :param dom_object: The DOM object whose property is sought.
+    :return: The value of the DOM property.
+    """
+    return getattr(dom_object, dot_net_property_name(attribute_name))
+
+
+def _dom_value_getter(attribute_name, transformer, cached):
+    """
+    Return a getter of the (transformed) value of the DOM property corresponding to `attribute_name`.
+
+    This function resolves the name of the DOM property when the adapter class is *defined* so that reading the
+    property only costs a single attribute lookup on the DOM object (and the call of `transformer`).
+
+    :param attribute_name: The name of the Python attribute.
+    :param transformer: A callable to transform the value returned by the .NET DOM property.
+    :param cached: If `True`, each adapter reads and transforms the DOM property only once. Only use for DOM
+    properties whose value never changes; for example, the object ID.
+    :return: A callable returning the value for an adapter.
+    """
+    read_dom_value = operator.attrgetter(dot_net_property_name(attribute_name))
+
+    def getter(self):
+        return transformer(read_dom_value(self._adaptee))
+
+    if not cached:
+        return getter
+
+    def cached_getter(self):
+        try:
+            return self._dom_values[attribute_name]
+        except KeyError:
+            return self._dom_values.setdefault(attribute_name, getter(self))
+
+    return cached_getter
+
+
+def dom_property(attribute_name, docstring, cached=False):
     """
     Return the property of the DOM corresponding to `attribute_name` with doc string.
     :param attribute_name: The name of the Python attribute.
     :param docstring: The doc string to be attached to the resulting property.
+    :param cached: If `True`, read the DOM property only once for each adapter. (Default `False`.)
     :return: The Python property wrapping the value of the DOM property.
     """
-    def getter(self):
-        result = get_dot_net_property_value(attribute_name, self._adaptee)
-        return result
-
     # Ensure no setter for the DOM properties
-    return property(fget=getter, doc=docstring, fset=None)
+    return property(fget=_dom_value_getter(attribute_name, toolz.identity, cached), doc=docstring, fset=None)
 
 
 def map_reduce_dom_property(attribute_name, docstring, mapper, reducer, initial):
@@ -98,32 +132,32 @@ def map_reduce_dom_property(attribute_name, docstring, mapper, reducer, initial)
     Returns:
         The Python property wrapping the mapped and reduced DOM (collection) property items.
     """
+    read_dom_value = operator.attrgetter(dot_net_property_name(attribute_name))
+
     def getter(self):
-        result = toolz.pipe(get_dot_net_property_value(attribute_name, self._adaptee),
+        # Reduce into a (shallow) copy of `initial` so that reducers that update the accumulator in place, like
+        # `dictionary_by_id`, never share state between invocations of this property.
+        result = toolz.pipe(read_dom_value(self._adaptee),
                             lambda container: container.Items,
                             toolz.map(mapper),
-                            lambda items: toolz.reduce(reducer, items, initial))
+                            lambda items: toolz.reduce(reducer, items, copy.copy(initial)))
         return result
 
     # Ensure no setter for the DOM properties
     return property(fget=getter, doc=docstring, fset=None)
 
 
-def transformed_dom_property(attribute_name, docstring, transformer):
+def transformed_dom_property(attribute_name, docstring, transformer, cached=False):
     """
     Return the transformed property of the DOM corresponding to `attribute_name`.
     :param attribute_name: The name of the Python attribute.
     :param docstring: The doc string to be attached to the resulting property.
     :param transformer: A callable to transform the value returned by the .NET DOM property.
+    :param cached: If `True`, read and transform the DOM property only once for each adapter. (Default `False`.)
     :return: The Python property wrapping the transformed value of the DOM property.
     """
-    def getter(self):
-        raw_result = get_dot_net_property_value(attribute_name, self._adaptee)
-        result = transformer(raw_result)
-        return result
-
     # Ensure no setter for the DOM properties
-    return property(fget=getter, doc=docstring, fset=None)
+    return property(fget=_dom_value_getter(attribute_name, transformer, cached), doc=docstring, fset=None)
 
 
 def transformed_dom_property_iterator(attribute_name, docstring, transformer):
@@ -134,9 +168,10 @@ def transformed_dom_property_iterator(attribute_name, docstring, transformer):
     :param transformer: A callable invoked on each value in the list returned by the .NET DOM property.
     :return: The Python property wrapping a Python iterator mapping values from the DOM property (collection) items.
     """
+    read_dom_value = operator.attrgetter(dot_net_property_name(attribute_name))
+
     def getter(self):
-        container = get_dot_net_property_value(attribute_name, self._adaptee)
-        result = toolz.map(transformer, container.Items)
+        result = toolz.map(transformer, read_dom_value(self._adaptee).Items)
         return result
 
     # Ensure no setter for the DOM properties
@@ -157,6 +192,8 @@ class DotNetAdapter:
             adaptee: The .NET DOM object to adapt.
         """
         self._adaptee = adaptee
+        # The values of the DOM properties read only once by this instance (see `dom_property(cached=True)`)
+        self._dom_values = {}
 
     @property
     def dom_object(self):
@@ -182,8 +219,12 @@ class IdentifiedDotNetAdapter(DotNetAdapter):
         """
         super().__init__(adaptee)
         self._net_project_callable = net_project_callable
+        # The values memoized by this instance (see `_memoized`) with the project context generation of each
+        self._memoized_values = {}
 
-    object_id = transformed_dom_property('object_id', 'The object ID of the adapted .NET DOM object.', as_object_id)
+    # The object ID of a DOM object never changes
+    object_id = transformed_dom_property('object_id', 'The object ID of the adapted .NET DOM object.', as_object_id,
+                                         cached=True)
 
     @property
     def expect_project_units(self) -> Union[units.UsOilfield, units.Metric]:
@@ -222,15 +263,66 @@ class IdentifiedDotNetAdapter(DotNetAdapter):
             [option.Option class](https://mat1g3r.github.io/option/option.html#module-option.option) allow
             derived classes to process these two situations with less likelihood of an error.
         """
-        return (option.Some(units.as_unit_system(self._net_project_callable().ProjectUnits))
+        # All the adapters of objects of a project share the (cached) unit system of that project.
+        return self._maybe_project_context.map(
+            lambda context: context.project_value(
+                'project_units', lambda: units.as_unit_system(self._net_project_callable().ProjectUnits)))
+
+    @property
+    def _maybe_project_context(self) -> option.Option[opc.ProjectContext]:
+        """
+        Return the `option.Option[ProjectContext]` of the .NET `IProject` of this instance.
+
+        Returns:
+            An `option.Some` containing the context shared by all adapters of objects of the .NET `IProject` if this
+            instance is associated with an `IProject`; otherwise, `option.NONE`.
+        """
+        return (option.Some(opc.context_for(self._net_project_callable()))
                 if self._net_project_callable
                 else option.NONE)
 
+    def _memoized(self, name: str, calculate: Callable):
+        """
+        Return a value derived from the .NET `IProject` of this instance, calculating it only if needed.
+
+        This instance recalculates the value after any change to its .NET `IProject` reported by
+        `_invalidate_project_context` (by this or any other adapter of the same project). An instance not associated
+        with an `IProject` calculates the value only once.
+
+        Args:
+            name: Identifies the value; for example, 'stages'.
+            calculate: A callable returning the value.
 
-def dictionary_by_id(accumulator: Mapping[uuid.UUID, IdentifiedDotNetAdapter], mapped_object: IdentifiedDotNetAdapter):
+        Returns:
+            The memoized value.
+        """
+        generation = self._maybe_project_context.map(lambda context: context.generation).unwrap_or(None)
+        memoized = self._memoized_values.get(name)
+        if memoized is not None and memoized[0] == generation:
+            return memoized[1]
+
+        result = calculate()
+        self._memoized_values[name] = (generation, result)
+        return result
+
+    def _invalidate_project_context(self):
+        """
+        Invalidate the state shared by all adapters of the objects of the .NET `IProject` of this instance.
+
+        Derived classes call this method after changing the .NET `IProject`.
+        """
+        if self._net_project_callable:
+            opc.invalidate(self._net_project_callable())
+
+
+def dictionary_by_id(accumulator: MutableMapping[uuid.UUID, IdentifiedDotNetAdapter],
+                     mapped_object: IdentifiedDotNetAdapter):
     """
     Return a `Mapping` resulting from adding `mapped_object` to `accumulator`.
 
+    This function updates `accumulator` in place (instead of copying it) so that reducing a collection of `n` items
+    is linear (and not quadratic) in `n`.
+
     Args:
         accumulator: The accumulated result.
         mapped_object: The `IdentifiedDotNetAdapter` to be added to `accumulator`.
@@ -238,4 +330,5 @@ def dictionary_by_id(accumulator: Mapping[uuid.UUID, IdentifiedDotNetAdapter], m
     Returns:
         The updated `Mapping`.
     """
-    return toolz.assoc(accumulator, mapped_object.object_id, mapped_object)
+    accumulator[mapped_object.object_id] = mapped_object
+    return accumulator
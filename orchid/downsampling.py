@@ -0,0 +1,133 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Functions to downsample a (time) series for plotting.
+
+Plotting a curve with many more samples than the plot has pixels is slow but shows nothing more. The functions in
+this module choose a small subset of the samples of a curve that preserves its visual shape. Each function returns
+the (sorted) indices of the chosen samples.
+"""
+
+import enum
+
+import numpy as np
+
+
+class DownsamplingMethod(enum.Enum):
+    LTTB = 'lttb'  # Largest-Triangle-Three-Buckets
+    MIN_MAX = 'minmax'  # The minimum and the maximum of each bucket
+
+
+def downsample_indices(x: np.ndarray, y: np.ndarray, max_points: int,
+                       method: DownsamplingMethod = DownsamplingMethod.LTTB) -> np.ndarray:
+    """
+    Choose at most `max_points` samples of a curve that preserve its shape.
+
+    Args:
+        x: The (increasing) x-coordinates of the samples; for example, the nanoseconds of each sample time.
+        y: The y-coordinates of the samples.
+        max_points: The maximum number of samples to choose.
+        method: The downsampling method.
+
+    Returns:
+        The sorted indices of the chosen samples. If the curve has no more than `max_points` samples, return the
+        indices of all samples.
+    """
+    if DownsamplingMethod(method) == DownsamplingMethod.LTTB:
+        return lttb_indices(x, y, max_points)
+    return min_max_indices(y, max_points)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Choose at most `max_points` samples of a curve using the Largest-Triangle-Three-Buckets algorithm.
+
+    This function always chooses the first and the last sample. It divides the remaining samples into
+    `max_points - 2` buckets and, from each bucket, chooses the sample forming the largest triangle with the sample
+    chosen from the previous bucket and the mean of the next bucket. See Sveinn Steinarsson, "Downsampling Time
+    Series for Visual Representation" (2013). This function ignores samples whose y-coordinate is not finite.
+
+    Args:
+        x: The (increasing) x-coordinates of the samples.
+        y: The y-coordinates of the samples.
+        max_points: The maximum number of samples to choose; at least 3.
+
+    Returns:
+        The sorted indices of the chosen samples.
+    """
+    if max_points < 3:
+        raise ValueError(f'Expected at least 3 points for LTTB but found {max_points}.')
+
+    finite_indices = np.flatnonzero(np.isfinite(y))
+    if len(finite_indices) <= max_points:
+        return finite_indices
+
+    # Calculate in `float64` relative to the first sample to avoid losing precision (for example, of time stamps).
+    xs = np.asarray(x[finite_indices] - x[finite_indices[0]], dtype=np.float64)
+    ys = np.asarray(y[finite_indices], dtype=np.float64)
+    bucket_edges = np.linspace(1, len(xs) - 1, max_points - 1).astype(np.int64)
+    bucket_sizes = np.diff(bucket_edges)
+    next_mean_xs = np.add.reduceat(xs[:-1], bucket_edges[:-1])[1:] / bucket_sizes[1:]
+    next_mean_ys = np.add.reduceat(ys[:-1], bucket_edges[:-1])[1:] / bucket_sizes[1:]
+    next_mean_xs = np.append(next_mean_xs, xs[-1])
+    next_mean_ys = np.append(next_mean_ys, ys[-1])
+
+    chosen = np.empty(max_points, dtype=np.int64)
+    chosen[0] = 0
+    chosen[-1] = len(xs) - 1
+    for bucket in range(max_points - 2):
+        start, stop = bucket_edges[bucket], bucket_edges[bucket + 1]
+        previous_x, previous_y = xs[chosen[bucket]], ys[chosen[bucket]]
+        # Twice the area of each triangle (the factor does not change the largest)
+        areas = np.abs((previous_x - next_mean_xs[bucket]) * (ys[start:stop] - previous_y) -
+                       (previous_x - xs[start:stop]) * (next_mean_ys[bucket] - previous_y))
+        chosen[bucket + 1] = start + np.argmax(areas)
+    return finite_indices[chosen]
+
+
+def min_max_indices(y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Choose at most `max_points` samples of a curve by choosing the minimum and the maximum of each bucket.
+
+    This function divides the samples into `max_points // 2` buckets of (nearly) equal size and chooses the
+    samples with the minimum and the maximum y-coordinate of each bucket. It preserves every peak and trough of the
+    curve. This function ignores samples whose y-coordinate is NaN.
+
+    Args:
+        y: The y-coordinates of the samples.
+        max_points: The maximum number of samples to choose; at least 2.
+
+    Returns:
+        The sorted indices of the chosen samples.
+    """
+    if max_points < 2:
+        raise ValueError(f'Expected at least 2 points for min-max but found {max_points}.')
+
+    if len(y) <= max_points:
+        return np.flatnonzero(~np.isnan(y))
+
+    bucket_starts = np.linspace(0, len(y), max_points // 2, endpoint=False).astype(np.int64)
+    bucket_ids = np.repeat(np.arange(len(bucket_starts)), np.diff(np.append(bucket_starts, len(y))))
+    # `fmin` and `fmax` ignore NaN values (unless all values of a bucket are NaN).
+    is_minimum = y == np.fmin.reduceat(y, bucket_starts)[bucket_ids]
+    is_maximum = y == np.fmax.reduceat(y, bucket_starts)[bucket_ids]
+    return np.union1d(_first_index_in_each_bucket(is_minimum, bucket_ids),
+                      _first_index_in_each_bucket(is_maximum, bucket_ids))
+
+
+def _first_index_in_each_bucket(is_candidate: np.ndarray, bucket_ids: np.ndarray) -> np.ndarray:
+    candidate_indices = np.flatnonzero(is_candidate)
+    _, first_candidates = np.unique(bucket_ids[candidate_indices], return_index=True)
+    return candidate_indices[first_candidates]
@@ -0,0 +1,202 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+An opt-in, on-disk cache of fiber data sets.
+
+Extracting a large fiber data set from Orchid takes time and needs memory for the entire data set. This module
+saves each extracted data set, with its depths and times, to `.npy` files. Later runs memory map these files
+instead of extracting the data set again; they read only those values actually used.
+
+For example,
+
+    cache = FiberDataCache('~/.orchid/fiber_cache')
+    cached = cache.data_set(fiber_data)
+    cached.select(min_depth=3000.0, max_depth=3100.0).values.mean()
+"""
+
+import contextlib
+import dataclasses
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Optional, Union
+
+import numpy as np
+
+from orchid import (
+    fiber_data_pyramid as fdp,
+    native_fiber_data as nfd,
+)
+
+
+VALUES_FILE_NAME = 'values.npy'
+DEPTHS_FILE_NAME = 'depths.npy'
+DATES_FILE_NAME = 'dates.npy'
+
+
+@dataclasses.dataclass(frozen=True)
+class CachedFiberDataSet:
+    """
+    A fiber data set read from the cache.
+
+    The `values` array has a row for each item of `depths` and a column for each item of `dates`. All three
+    arrays are typically memory mapped; slicing them does not read the whole data set.
+    """
+    values: np.ndarray
+    depths: np.ndarray
+    dates: np.ndarray
+
+    def select(self, min_depth: Optional[float] = None, max_depth: Optional[float] = None,
+               start_time: Optional[np.datetime64] = None,
+               stop_time: Optional[np.datetime64] = None) -> 'CachedFiberDataSet':
+        """
+        Select the values of this data set in a range of depths and a range of times.
+
+        This method assumes that both the depths and the dates of the data set are sorted in ascending order. It
+        returns views of the (memory mapped) arrays of this instance so it reads no values from disk.
+
+        Args:
+            min_depth: The smallest depth selected. If `None`, select from the first depth.
+            max_depth: The largest depth selected. If `None`, select to the last depth.
+            start_time: The earliest time selected. If `None`, select from the first time.
+            stop_time: The latest time selected. If `None`, select to the last time.
+
+        Returns:
+            The selected values with their depths and times.
+        """
+        depth_slice = _search_slice(self.depths, min_depth, max_depth)
+        date_slice = _search_slice(self.dates, start_time, stop_time)
+        return CachedFiberDataSet(self.values[depth_slice, date_slice], self.depths[depth_slice],
+                                  self.dates[date_slice])
+
+
+class FiberDataCache:
+    """
+    Caches the data sets of fiber data in a directory.
+
+    The cache identifies each data set by the path of its fiber data file, the data set name, the modification
+    time of the fiber data file and the `numpy` data type of the values. Modifying the fiber data file makes
+    its cached data sets stale; this class never reads stale data sets but does not remove them.
+    """
+
+    def __init__(self, cache_directory: Union[str, os.PathLike]):
+        """
+        Construct an instance caching data sets in a directory.
+
+        Args:
+            cache_directory: The directory containing the cached data sets. This constructor creates the
+            directory if it does not exist.
+        """
+        self._cache_directory = pathlib.Path(cache_directory).expanduser()
+        self._cache_directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_directory(self) -> pathlib.Path:
+        return self._cache_directory
+
+    def data_set(self, fiber_data: nfd.NativeFiberData, data_set_name: Optional[str] = None,
+                 dtype=np.float64) -> CachedFiberDataSet:
+        """
+        Return a data set of fiber data, extracting it from Orchid only if it is not already cached.
+
+        Args:
+            fiber_data: The fiber data containing the data set.
+            data_set_name: The name of the data set. If `None`, return the first data set.
+            dtype: The `numpy` data type of the values. Use `np.float32` to halve the memory (and disk) needed.
+
+        Returns:
+            The memory mapped data set.
+
+        Raises:
+            FileNotFoundError: If the fiber data file does not exist.
+        """
+        entry_path = self._entry_path(fiber_data, data_set_name, dtype)
+        if not entry_path.exists():
+            self._write_entry(entry_path, fiber_data, data_set_name, dtype)
+        return _read_entry(entry_path)
+
+    def pyramid(self, fiber_data: nfd.NativeFiberData, data_set_name: Optional[str] = None, dtype=np.float64,
+                factor: int = fdp.DEFAULT_FACTOR) -> fdp.FiberDataPyramid:
+        """
+        Return the multi-resolution pyramid of a data set of fiber data, building it only if it is not already
+        cached.
+
+        Args:
+            fiber_data: The fiber data containing the data set.
+            data_set_name: The name of the data set. If `None`, return the pyramid of the first data set.
+            dtype: The `numpy` data type of the values.
+            factor: The number of tiles of a level along each axis summarized by a single tile of the next level.
+
+        Returns:
+            The pyramid whose levels are memory mapped.
+        """
+        cached = self.data_set(fiber_data, data_set_name, dtype)
+        pyramid_path = self._entry_path(fiber_data, data_set_name, dtype).joinpath(f'pyramid-{factor}')
+        if not pyramid_path.exists():
+            with self._staging_directory(pyramid_path) as staging_path:
+                fdp.build(cached.values, staging_path, factor)
+        return fdp.load(cached.values, cached.depths, cached.dates, pyramid_path, factor)
+
+    def _entry_path(self, fiber_data: nfd.NativeFiberData, data_set_name: Optional[str], dtype) -> pathlib.Path:
+        fiber_file_path = pathlib.Path(fiber_data.file_path).resolve()
+        resolved_data_set_name = (data_set_name if data_set_name is not None
+                                  else fiber_data.data_sets_info[0].name)
+        key = '|'.join([str(fiber_file_path), resolved_data_set_name, str(os.stat(fiber_file_path).st_mtime_ns),
+                        np.dtype(dtype).str])
+        return self._cache_directory.joinpath(hashlib.sha256(key.encode('utf-8')).hexdigest())
+
+    def _write_entry(self, entry_path: pathlib.Path, fiber_data: nfd.NativeFiberData,
+                     data_set_name: Optional[str], dtype):
+        with self._staging_directory(entry_path) as staging_path:
+            # Copy the values directly into the memory mapped file, one band at a time, so that the data set never
+            # needs a second copy in memory.
+            values_path = staging_path.joinpath(VALUES_FILE_NAME)
+            values = fiber_data.copy_data_set_into(
+                lambda shape, values_dtype: np.lib.format.open_memmap(values_path, mode='w+', dtype=values_dtype,
+                                                                      shape=shape),
+                data_set_name, dtype)
+            # Close the memory mapped file before renaming the staging directory.
+            del values
+            np.save(staging_path.joinpath(DEPTHS_FILE_NAME), fiber_data.depths)
+            np.save(staging_path.joinpath(DATES_FILE_NAME), fiber_data.dates)
+
+    @contextlib.contextmanager
+    def _staging_directory(self, target_path: pathlib.Path):
+        # Write all files to a temporary directory, and then rename the directory, so that other processes
+        # never see a partially written entry.
+        staging_path = pathlib.Path(tempfile.mkdtemp(dir=self._cache_directory, prefix='.staging-'))
+        try:
+            yield staging_path
+            os.replace(staging_path, target_path)
+        except OSError:
+            # Another process may have written the same entry first.
+            if not target_path.exists():
+                raise
+        finally:
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+
+def _read_entry(entry_path: pathlib.Path) -> CachedFiberDataSet:
+    return CachedFiberDataSet(np.load(entry_path.joinpath(VALUES_FILE_NAME), mmap_mode='r'),
+                              np.load(entry_path.joinpath(DEPTHS_FILE_NAME), mmap_mode='r'),
+                              np.load(entry_path.joinpath(DATES_FILE_NAME), mmap_mode='r'))
+
+
+def _search_slice(sorted_items: np.ndarray, lower, upper) -> slice:
+    start = np.searchsorted(sorted_items, lower, side='left') if lower is not None else None
+    stop = np.searchsorted(sorted_items, upper, side='right') if upper is not None else None
+    return slice(start, stop)
@@ -0,0 +1,326 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+A multi-resolution pyramid of a fiber data set for plotting waterfalls.
+
+Level 0 of the pyramid is the fiber data set itself. Each value of level `k` (for `k > 0`) summarizes a tile of
+`factor ** k` depths by `factor ** k` times of the data set by its minimum, maximum and mean. Plotting a
+viewport only needs the values of the coarsest level that still has enough tiles to fill the viewport.
+
+Typically, one creates a pyramid using `fiber_data_cache.FiberDataCache.pyramid` which builds the pyramid once
+and caches it with the data set.
+"""
+
+import dataclasses
+import pathlib
+from typing import List, Optional
+
+import numpy as np
+
+
+DEFAULT_FACTOR = 4
+STATISTICS = ('minimum', 'maximum', 'mean')
+BAND_BYTES = 64 * 1024 * 1024
+
+
+@dataclasses.dataclass(frozen=True)
+class PyramidLevel:
+    """
+    The tiles of (a viewport of) a single level of a pyramid.
+
+    Each statistic has a row for each item of `depths` and a column for each item of `dates`. The depths and
+    dates are those of the first depth and time of each tile.
+    """
+    level: int
+    tile_size: int
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    depths: np.ndarray
+    dates: np.ndarray
+
+    @property
+    def shape(self):
+        return self.mean.shape
+
+    def select(self, min_depth=None, max_depth=None, start_time=None, stop_time=None) -> 'PyramidLevel':
+        """
+        Select the tiles of this level that overlap a range of depths and a range of times.
+
+        Args:
+            min_depth: The smallest depth selected. If `None`, select from the first depth.
+            max_depth: The largest depth selected. If `None`, select to the last depth.
+            start_time: The earliest time selected. If `None`, select from the first time.
+            stop_time: The latest time selected. If `None`, select to the last time.
+
+        Returns:
+            The selected tiles (as views of the tiles of this instance).
+        """
+        depth_slice = _overlapping_tiles(self.depths, min_depth, max_depth)
+        date_slice = _overlapping_tiles(self.dates, start_time, stop_time)
+        return PyramidLevel(self.level, self.tile_size,
+                            self.minimum[depth_slice, date_slice], self.maximum[depth_slice, date_slice],
+                            self.mean[depth_slice, date_slice], self.depths[depth_slice], self.dates[date_slice])
+
+
+class FiberDataPyramid:
+    """
+    Provides the tiles of a fiber data set at the resolution needed to plot a viewport.
+    """
+
+    def __init__(self, levels: List[PyramidLevel]):
+        """
+        Construct an instance from its levels.
+
+        Args:
+            levels: The levels of the pyramid from the finest (the data set itself) to the coarsest.
+        """
+        self._levels = levels
+
+    @property
+    def levels(self) -> List[PyramidLevel]:
+        return self._levels
+
+    def viewport(self, max_rows: int, max_columns: int, min_depth=None, max_depth=None,
+                 start_time=None, stop_time=None) -> PyramidLevel:
+        """
+        Return the tiles of the finest level covering a viewport with at most `max_rows` by `max_columns` tiles.
+
+        Args:
+            max_rows: The maximum number of (depth) rows returned; for example, the height of the plot in pixels.
+            max_columns: The maximum number of (time) columns returned; for example, the width of the plot in
+            pixels.
+            min_depth: The smallest depth of the viewport. If `None`, the viewport starts at the first depth.
+            max_depth: The largest depth of the viewport. If `None`, the viewport ends at the last depth.
+            start_time: The earliest time of the viewport. If `None`, the viewport starts at the first time.
+            stop_time: The latest time of the viewport. If `None`, the viewport ends at the last time.
+
+        Returns:
+            The tiles of the viewport. If even the coarsest level has too many tiles, return the tiles of the
+            coarsest level.
+        """
+        if max_rows < 1 or max_columns < 1:
+            raise ValueError(f'Expected positive viewport size but found {max_rows} by {max_columns}.')
+
+        candidate = None
+        for level in self._levels:
+            candidate = level.select(min_depth, max_depth, start_time, stop_time)
+            if candidate.shape[0] <= max_rows and candidate.shape[1] <= max_columns:
+                break
+        return candidate
+
+
+def level_count(shape, factor: int = DEFAULT_FACTOR) -> int:
+    """
+    Calculate the number of levels above level 0 of the pyramid of a data set.
+
+    Args:
+        shape: The shape of the data set.
+        factor: The number of tiles of a level along each axis summarized by a single tile of the next level.
+
+    Returns:
+        The number of levels needed so that the coarsest level has a single tile.
+    """
+    result = 0
+    tiles = max(shape)
+    while tiles > 1:
+        tiles = -(-tiles // factor)
+        result += 1
+    return result
+
+
+def build(values: np.ndarray, directory: pathlib.Path, factor: int = DEFAULT_FACTOR,
+          band_rows: Optional[int] = None):
+    """
+    Build the levels of the pyramid of a data set in a single pass over its values and save them in a directory.
+
+    This function reads `values` in bands of `band_rows` rows so it works with memory mapped data sets larger
+    than the available memory.
+
+    Args:
+        values: The (two-dimensional) values of the data set.
+        directory: The (existing) directory in which to save the levels of the pyramid.
+        factor: The number of tiles of a level along each axis summarized by a single tile of the next level.
+        band_rows: The number of rows of `values` read at a time. If `None`, read about `BAND_BYTES` of
+        statistics at a time.
+    """
+    if factor < 2:
+        raise ValueError(f'Expected factor of at least 2 but found {factor}.')
+    if band_rows is None:
+        # Each value of a band needs four 8-byte statistics.
+        band_rows = max(BAND_BYTES // (32 * max(values.shape[1], 1)) // factor, 1) * factor
+
+    accumulators = []
+    row_count, column_count = values.shape
+    for level in range(1, level_count(values.shape, factor) + 1):
+        tile_size = factor ** level
+        level_shape = (-(-row_count // tile_size), -(-column_count // tile_size))
+        accumulators.append(_LevelAccumulator(directory, level, level_shape, factor, values.dtype))
+
+    for band_start in range(0, row_count, band_rows):
+        band = np.asarray(values[band_start:band_start + band_rows], dtype=np.float64)
+        _push_band(accumulators, _TileStatistics.of_values(band))
+    _finish(accumulators)
+
+    for accumulator in accumulators:
+        accumulator.close()
+
+
+def load(values: np.ndarray, depths: np.ndarray, dates: np.ndarray, directory: pathlib.Path,
+         factor: int = DEFAULT_FACTOR) -> FiberDataPyramid:
+    """
+    Load a pyramid previously built by `build`.
+
+    Args:
+        values: The values of the data set (level 0).
+        depths: The depth of each row of `values`.
+        dates: The time of each column of `values`.
+        directory: The directory containing the saved levels.
+        factor: The factor used to build the levels.
+
+    Returns:
+        The pyramid whose levels, other than level 0, are memory mapped.
+    """
+    levels = [PyramidLevel(0, 1, values, values, values, depths, dates)]
+    for level in range(1, level_count(values.shape, factor) + 1):
+        tile_size = factor ** level
+        statistics = [np.load(_level_file_path(directory, level, statistic), mmap_mode='r')
+                      for statistic in STATISTICS]
+        levels.append(PyramidLevel(level, tile_size, *statistics, depths[::tile_size], dates[::tile_size]))
+    return FiberDataPyramid(levels)
+
+
+@dataclasses.dataclass
+class _TileStatistics:
+    """The (NaN-ignoring) statistics of a band of tiles from which to calculate the next level."""
+    minimum: np.ndarray
+    maximum: np.ndarray
+    total: np.ndarray
+    count: np.ndarray
+
+    @classmethod
+    def of_values(cls, values: np.ndarray) -> '_TileStatistics':
+        is_value = ~np.isnan(values)
+        return cls(values, values, np.where(is_value, values, 0.0), is_value.astype(np.int64))
+
+    @property
+    def row_count(self):
+        return self.total.shape[0]
+
+    def rows(self, start: int, stop: Optional[int] = None) -> '_TileStatistics':
+        return _TileStatistics(self.minimum[start:stop], self.maximum[start:stop], self.total[start:stop],
+                               self.count[start:stop])
+
+    def concatenate(self, other: '_TileStatistics') -> '_TileStatistics':
+        return _TileStatistics(*[np.concatenate([mine, others]) for mine, others in
+                                 zip(dataclasses.astuple(self), dataclasses.astuple(other))])
+
+    def reduce(self, factor: int) -> '_TileStatistics':
+        """Summarize each block of (at most) `factor` by `factor` tiles by a single tile."""
+        row_indices = np.arange(0, self.row_count, factor)
+        column_indices = np.arange(0, self.total.shape[1], factor)
+
+        def reduce_tiles(ufunc, statistic):
+            return ufunc.reduceat(ufunc.reduceat(statistic, row_indices, axis=0), column_indices, axis=1)
+
+        # `fmin` and `fmax` ignore NaN values (unless all values are NaN).
+        return _TileStatistics(reduce_tiles(np.fmin, self.minimum), reduce_tiles(np.fmax, self.maximum),
+                               reduce_tiles(np.add, self.total), reduce_tiles(np.add, self.count))
+
+    def mean(self) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 0, self.total / np.maximum(self.count, 1), np.nan)
+
+
+class _LevelAccumulator:
+    """Reduces the tiles of the level below into the tiles of a single level and writes them to disk."""
+
+    def __init__(self, directory: pathlib.Path, level: int, shape, factor: int, dtype):
+        self._factor = factor
+        self._pending: Optional[_TileStatistics] = None
+        self._next_row = 0
+        self._outputs = {statistic: np.lib.format.open_memmap(_level_file_path(directory, level, statistic),
+                                                             mode='w+', dtype=dtype, shape=shape)
+                         for statistic in STATISTICS}
+
+    def push(self, band: _TileStatistics) -> Optional[_TileStatistics]:
+        """
+        Push a band of tiles of the level below.
+
+        Args:
+            band: The band of tiles.
+
+        Returns:
+            The completed tiles of this level (if any) to push to the level above.
+        """
+        self._pending = band if self._pending is None else self._pending.concatenate(band)
+        return self._reduce(self._pending.row_count - self._pending.row_count % self._factor)
+
+    def finish(self) -> Optional[_TileStatistics]:
+        """
+        Reduce the remaining (incomplete block of) rows of the level below.
+
+        Returns:
+            The last tiles of this level (if any) to push to the level above.
+        """
+        return self._reduce(self._pending.row_count) if self._pending is not None else None
+
+    def close(self):
+        for output in self._outputs.values():
+            output.flush()
+        self._outputs.clear()
+
+    def _reduce(self, row_count: int) -> Optional[_TileStatistics]:
+        if row_count == 0:
+            return None
+
+        result = self._pending.rows(0, row_count).reduce(self._factor)
+        self._pending = self._pending.rows(row_count) if row_count < self._pending.row_count else None
+        self._write(result)
+        return result
+
+    def _write(self, tiles: _TileStatistics):
+        rows = slice(self._next_row, self._next_row + tiles.row_count)
+        self._outputs['minimum'][rows] = tiles.minimum
+        self._outputs['maximum'][rows] = tiles.maximum
+        self._outputs['mean'][rows] = tiles.mean()
+        self._next_row += tiles.row_count
+
+
+def _push_band(accumulators: List[_LevelAccumulator], band: _TileStatistics):
+    # Pass the tiles completed by each level to the level above.
+    for accumulator in accumulators:
+        band = accumulator.push(band)
+        if band is None:
+            return
+
+
+def _finish(accumulators: List[_LevelAccumulator]):
+    # Finish the levels from the finest to the coarsest so that each level receives all its tiles before finishing.
+    for index, accumulator in enumerate(accumulators):
+        remaining = accumulator.finish()
+        if remaining is not None:
+            _push_band(accumulators[index + 1:], remaining)
+
+
+def _level_file_path(directory: pathlib.Path, level: int, statistic: str) -> pathlib.Path:
+    return directory.joinpath(f'level-{level}-{statistic}.npy')
+
+
+def _overlapping_tiles(tile_starts: np.ndarray, lower, upper) -> slice:
+    # Each tile extends from its start to the start of the next tile.
+    start = max(int(np.searchsorted(tile_starts, lower, side='right')) - 1, 0) if lower is not None else None
+    stop = int(np.searchsorted(tile_starts, upper, side='right')) if upper is not None else None
+    return slice(start, stop)
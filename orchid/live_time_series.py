@@ -0,0 +1,113 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Accumulates the samples of time series polled while they grow; for example, during an active treatment.
+
+While monitoring a treatment, one periodically reloads the project to read the newly recorded samples. Reading
+each curve in full on every reload takes time proportional to the entire history of the curve. Instead,
+
+    live_series = LiveTimeSeriesCache()
+    while monitoring:
+        project = orchid.load_project(ifrac_path)
+        for curve in project.time_series().all_objects():
+            newer_samples = live_series.refresh(curve)
+        ...
+        plot(live_series.data_points(curve))
+
+converts only the samples recorded since the previous refresh. This cache identifies each curve by its object ID
+so it survives reloading the project. It assumes that samples are only appended to a curve; that is, it never
+re-reads samples earlier than the last sample already read.
+"""
+
+import threading
+from typing import Dict, List
+import uuid
+
+import pandas as pd
+
+from orchid import base_time_series_adapter as bca
+
+
+class LiveTimeSeriesCache:
+    """Accumulates the samples of each refreshed time series."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._chunks: Dict[uuid.UUID, List[pd.Series]] = {}
+
+    def refresh(self, time_series: bca.BaseTimeSeriesAdapter) -> pd.Series:
+        """
+        Read the samples of a time series recorded since its last refresh and append them to this cache.
+
+        Args:
+            time_series: The (possibly reloaded) time series to refresh.
+
+        Returns:
+            The newly read samples; on the first refresh of `time_series`, all its samples.
+        """
+        with self._lock:
+            chunks = self._chunks.get(time_series.object_id)
+            last_time_point = _last_time_point(chunks) if chunks else None
+
+        newer = (time_series.data_points_after(last_time_point) if last_time_point is not None
+                 else time_series.data_points())
+        with self._lock:
+            chunks = self._chunks.setdefault(time_series.object_id, [])
+            # Another thread may have refreshed the same time series while reading.
+            if chunks and last_time_point != _last_time_point(chunks):
+                newer = newer[newer.index > _last_time_point(chunks)]
+            if len(newer) > 0 or not chunks:
+                chunks[:] = [chunk for chunk in chunks if len(chunk) > 0] + [newer]
+        return newer.copy()
+
+    def data_points(self, time_series: bca.BaseTimeSeriesAdapter) -> pd.Series:
+        """
+        Return all the accumulated samples of a time series.
+
+        Args:
+            time_series: The time series whose samples are returned.
+
+        Returns:
+            A copy of the accumulated samples of `time_series`; an empty series if it was never refreshed.
+        """
+        with self._lock:
+            chunks = self._chunks.get(time_series.object_id)
+            if not chunks:
+                return pd.Series(data=[], index=pd.DatetimeIndex([], tz='UTC').as_unit('ns'), dtype='float64',
+                                 name=time_series.name)
+            # Concatenate the appended samples only when read (and only once).
+            if len(chunks) > 1:
+                chunks[:] = [pd.concat(chunks)]
+            return chunks[0].copy()
+
+    def discard(self, time_series: bca.BaseTimeSeriesAdapter):
+        """
+        Discard the accumulated samples of a time series; for example, if its earlier samples changed.
+
+        Args:
+            time_series: The time series whose samples are discarded.
+        """
+        with self._lock:
+            self._chunks.pop(time_series.object_id, None)
+
+    def clear(self):
+        """Discard the accumulated samples of all time series."""
+        with self._lock:
+            self._chunks.clear()
+
+
+def _last_time_point(chunks: List[pd.Series]):
+    # Only the first chunk may be empty.
+    return chunks[-1].index[-1] if len(chunks[-1]) > 0 else None
@@ -15,9 +15,10 @@
 import dataclasses
 import traceback
 import uuid
-from typing import Iterable
+from typing import Callable, Iterable, Iterator, List, Optional
 
 import functools
+import numpy as np
 import option
 import pandas as pd
 import toolz.curried as toolz
@@ -25,14 +26,21 @@ import toolz.curried as toolz
 from orchid import (
     base,
     dot_net_dom_access as dna,
-    dot_net_disposable as dnd,
+    net_array,
     net_date_time as net_dt,
 )
 
+# noinspection PyPackageRequirements
+import clr
 # noinspection PyUnresolvedReferences
-from System import DateTime, DateTimeOffset, DBNull, Guid, TimeSpan
+from System import (Array, Boolean, DateTime, DateTimeOffset, DBNull, Double, Func, Guid, Int32, Int64, Object,
+                    String, TimeSpan, Type)
 # noinspection PyUnresolvedReferences
-from System.Data import DataTable
+from System.Data import DataColumn, DataRow, DataRowCollection, DataTable
+# noinspection PyUnresolvedReferences
+from System.Linq import Enumerable
+# noinspection PyUnresolvedReferences
+from System.Linq.Expressions import Expression
 
 
 @dataclasses.dataclass
@@ -62,6 +70,8 @@ class DataFrameAdapterDateTimeError(TypeError):
 
 class DataFrameAdapterDateTimeOffsetMinValueError(ValueError):
     def __init__(self, row_no, column_name):
+        self.row_no = row_no
+        self.column_name = column_name
         super(DataFrameAdapterDateTimeOffsetMinValueError, self).__init__(
             f'Unexpectedly found `DateTimeOffset.MinValue` at'
             f' row, {row_no}, and column, "{column_name}", of Orchid `DataFrame`.')
@@ -84,14 +94,60 @@ class NativeDataFrameAdapterIdentified(dna.IdentifiedDotNetAdapter):
     def is_potentially_corrupt(self):
         return self.name.endswith(' (Potentially Corrupted)')
 
-    def pandas_data_frame(self) -> pd.DataFrame:
+    def pandas_data_frame(self, columns: Optional[Iterable[str]] = None, row_slice: Optional[slice] = None,
+                          row_filter: Optional[str] = None) -> pd.DataFrame:
         """
         Return the `pandas` `DataFrame` built from the native `IStaticDataFrame`.
 
+        By default, this method converts the entire native table. The optional arguments restrict the conversion
+        to some columns and / or rows of the native table. These restrictions are applied in .NET so that only the
+        requested values are converted. The result is equal to the result of
+        `pandas_data_frame()[columns].iloc[row_slice]` restricted to the rows matching `row_filter` except that
+        `pandas` determines the type of each column from the converted values only.
+
+        Args:
+            columns: The names of the columns to convert (in order). If `None`, convert all columns.
+            row_slice: The slice of rows to convert (by position). If `None`, convert all rows.
+            row_filter: An expression restricting the rows to convert using the syntax of the .NET
+            `DataColumn.Expression` property; for example, "[Stage Number] = 7 AND [Easting] > 1200". If `None`,
+            convert all rows.
+
         Returns:
             A `pandas` `DataFrame`.
+
+        Raises:
+            KeyError: If the native table has no column named by `columns`.
+        """
+        return table_to_data_frame(self.dom_object.DataTable, columns, row_slice, row_filter)
+
+    def iter_chunks(self, chunk_rows: int = 100_000, columns: Optional[Iterable[str]] = None,
+                    row_filter: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the native `IStaticDataFrame` as a sequence of `pandas` `DataFrame` instances of (at most)
+        `chunk_rows` rows.
+
+        Unlike `pandas_data_frame()`, this method only converts the values of a single chunk at a time so that
+        the memory needed is bounded by the size of a chunk and not by the size of the native table.
+
+        Each column has the same type in every chunk. This type is determined by the .NET type of the column
+        and the values of the entire column; for example, an integral column containing no `DBNull` values
+        produces `int64` columns, but an integral column containing even a single `DBNull` value produces
+        `float64` columns. The index of each chunk contains the positions of its rows in the native table.
+
+        Args:
+            chunk_rows: The maximum number of rows in each chunk.
+            columns: The names of the columns to convert (in order). If `None`, convert all columns.
+            row_filter: An expression restricting the rows to convert using the syntax of the .NET
+            `DataColumn.Expression` property. If `None`, convert all rows.
+
+        Yields:
+            A `pandas` `DataFrame` for each consecutive chunk of rows.
+
+        Raises:
+            KeyError: If the native table has no column named by `columns`.
+            ValueError: If `chunk_rows` is not positive.
         """
-        return _table_to_data_frame(self.dom_object.DataTable)
+        return _iter_table_chunks(self.dom_object.DataTable, chunk_rows, columns, row_filter)
 
 
 @functools.singledispatch
@@ -160,88 +216,514 @@ def _(cell_value):
     return net_dt.as_duration(cell_value)
 
 
-def _table_to_data_frame(data_table: DataTable):
+def table_to_data_frame(data_table: DataTable, column_names: Optional[Iterable[str]] = None,
+                         row_slice: Optional[slice] = None, row_filter: Optional[str] = None):
     """
     Converts a .NET `DataTable` to a `pandas` `DataFrame`.
 
+    Rather than reading the table row by row, this function reads each column of the table into a single
+    (typically `numpy`) array. Each column is read by a .NET function compiled for the type of that column so
+    that only the resulting array, and not each cell, crosses the Python / .NET boundary.
+
     Args:
         data_table: The .NET `DataTable` to convert.
+        column_names: The names of the columns to convert. If `None`, convert all columns.
+        row_slice: The slice of rows to convert. If `None`, convert all rows.
+        row_filter: The `DataColumn.Expression` restricting the rows to convert. If `None`, convert all rows.
 
     Returns:
-        The `pandas` `DataFrame` converted from the .NET `DataTable`.
-    """
-    result = toolz.pipe(data_table,
-                        _read_data_table,
-                        toolz.map(toolz.keymap(lambda e: e[1])),
-                        list,
-                        lambda rs: pd.DataFrame(data=rs),
-                        )
-    return result
+        The `pandas` `DataFrame` converted from the .NET `DataTable`. Even if no rows are converted, the result
+        has a column for each converted .NET `DataColumn`.
+    """
+    net_columns = _select_data_columns(data_table, column_names)
+    net_rows, index = _select_data_rows(data_table, row_slice, row_filter)
+    columns = {net_column.ColumnName: _at_table_rows(index, _read_data_column, net_rows, net_column)
+               for net_column in net_columns}
+    return pd.DataFrame(data=columns, index=index)
+
+
+def _iter_table_chunks(data_table: DataTable, chunk_rows: int, column_names: Optional[Iterable[str]] = None,
+                       row_filter: Optional[str] = None) -> Iterator[pd.DataFrame]:
+    """
+    Converts a .NET `DataTable` to a sequence of `pandas` `DataFrame` instances of (at most) `chunk_rows` rows.
+
+    Args:
+        data_table: The .NET `DataTable` to convert.
+        chunk_rows: The maximum number of rows in each chunk.
+        column_names: The names of the columns to convert. If `None`, convert all columns.
+        row_filter: The `DataColumn.Expression` restricting the rows to convert. If `None`, convert all rows.
+
+    Returns:
+        An iterator over the `pandas` `DataFrame` chunks.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f'Expected positive number of rows in each chunk but found {chunk_rows}.')
+
+    # Validate the arguments when called and not when the caller requests the first chunk.
+    net_columns = _select_data_columns(data_table, column_names)
+    net_rows, index = _select_data_rows(data_table, None, row_filter)
+
+    def chunk_net_rows(chunk_slice):
+        return _rows_at(net_rows, range(len(index))[chunk_slice])
+
+    def generate_chunks():
+        chunk_slices = [slice(start, start + chunk_rows) for start in range(0, len(index), chunk_rows)]
+        plans = {net_column.ColumnName: _plan_chunk_column(net_column, chunk_net_rows, chunk_slices, index)
+                 for net_column in net_columns}
+        for chunk_slice in chunk_slices:
+            net_chunk_rows = chunk_net_rows(chunk_slice)
+            chunk_index = index[chunk_slice]
+            chunk = {column_name: _at_table_rows(chunk_index, _read_chunk_column, net_chunk_rows, plan, chunk_index)
+                     for column_name, plan in plans.items()}
+            yield pd.DataFrame(data=chunk, index=chunk_index)
+
+    return generate_chunks()
+
+
+@dataclasses.dataclass
+class _ChunkColumnPlan:
+    net_column: DataColumn
+    read_column: Callable
+    dtype: object
+
+
+def _plan_chunk_column(net_column, chunk_net_rows: Callable, chunk_slices: List[slice],
+                       index: pd.Index) -> _ChunkColumnPlan:
+    """
+    Plan the conversion of a single column of every chunk so that the column has the same type in every chunk.
+
+    Planning examines the column one chunk at a time so that the memory needed is bounded by the size of a chunk.
+
+    Args:
+        net_column: The .NET `DataColumn` to convert.
+        chunk_net_rows: A callable returning the .NET array of `DataRow` instances of a chunk slice.
+        chunk_slices: The slices of each chunk.
+        index: The positions in the native table of the rows of all chunks.
+
+    Returns:
+        The function reading the column of each chunk and the type of the column of every chunk.
+    """
+    def any_chunk(predicate):
+        return any(_at_table_rows(index[chunk_slice], predicate, chunk_net_rows(chunk_slice))
+                   for chunk_slice in chunk_slices)
+
+    def has_null(net_rows):
+        return _read_null_mask(net_rows, net_column).any()
+
+    net_type_name = net_column.DataType.FullName
+    read_column = _COLUMN_READERS.get(net_type_name, _read_object_column)
+    if read_column == _read_floating_column:
+        return _ChunkColumnPlan(net_column, read_column, np.dtype(np.float64))
+
+    if read_column == _read_integral_column:
+        return _ChunkColumnPlan(net_column, read_column,
+                                np.dtype(np.float64) if any_chunk(has_null) else np.dtype(np.int64))
+
+    if read_column == _read_date_time_offset_column:
+        if any_chunk(lambda net_rows: not _read_date_time_offset_time_points(net_rows, net_column).is_representable):
+            return _ChunkColumnPlan(net_column, _read_object_column, np.dtype(object))
+        return _ChunkColumnPlan(net_column, read_column, pd.DatetimeTZDtype(tz=net_dt.UTC))
+
+    if read_column == _read_time_span_column:
+        if any_chunk(lambda net_rows: not _read_time_span_durations(net_rows, net_column).is_representable):
+            return _ChunkColumnPlan(net_column, _read_object_column, np.dtype(object))
+        return _ChunkColumnPlan(net_column, read_column, np.dtype('timedelta64[ns]'))
+
+    if read_column == _read_object_column:
+        # Without `DBNull` cells, the values of a column of (any) single .NET type have a single Python type.
+        return _ChunkColumnPlan(net_column, read_column, np.dtype(object) if any_chunk(has_null) else None)
+
+    return _ChunkColumnPlan(net_column, read_column, np.dtype(object))
+
+
+def _read_chunk_column(net_chunk_rows, plan: _ChunkColumnPlan, chunk_index) -> pd.Series:
+    # Specifying the type converts, for example, the `None` values of a chunk containing only `DBNull` cells to
+    # `NaN` or `NaT`, and prevents `pandas` inferring a different type for an `object` column.
+    return pd.Series(plan.read_column(net_chunk_rows, plan.net_column), index=chunk_index, dtype=plan.dtype)
+
+
+def _at_table_rows(row_positions, read, *args):
+    """
+    Call `read(*args)` reporting any `DateTimeOffset.MinValue` cell at its row in the native table.
+
+    The column readers report the position of a cell among the rows they read. These rows may be a chunk, a slice
+    or a filtered subset of the rows of the native table.
+
+    Args:
+        row_positions: The position in the native table of each row read by `read`.
+        read: The callable reading the rows.
+        args: The arguments of `read`.
+
+    Returns:
+        The result of `read(*args)`.
+    """
+    try:
+        return read(*args)
+    except DataFrameAdapterDateTimeOffsetMinValueError as error:
+        raise DataFrameAdapterDateTimeOffsetMinValueError(int(row_positions[error.row_no]),
+                                                          error.column_name) from None
+
+
+def _select_data_columns(data_table: DataTable, column_names: Optional[Iterable[str]]) -> List:
+    if column_names is None:
+        return list(data_table.Columns)
+
+    def find_column(column_name):
+        if not data_table.Columns.Contains(column_name):
+            raise KeyError(f'No column named "{column_name}" in Orchid `DataFrame`.')
+        return data_table.Columns[column_name]
+
+    return [find_column(column_name) for column_name in column_names]
+
+
+def _select_data_rows(data_table: DataTable, row_slice: Optional[slice], row_filter: Optional[str]):
+    """
+    Select the rows of a .NET `DataTable` to convert.
+
+    Args:
+        data_table: The .NET `DataTable` whose rows are selected.
+        row_slice: The slice of rows to select. If `None`, select all rows.
+        row_filter: The `DataColumn.Expression` restricting the rows to select. If `None`, select all rows.
+
+    Returns:
+        A tuple of the .NET array of selected `DataRow` instances and the `pandas` index of their positions.
+    """
+    net_rows = Enumerable.ToArray[DataRow](Enumerable.Cast[DataRow](data_table.Rows))
+    if row_slice is None and row_filter is None:
+        return net_rows, pd.RangeIndex(len(net_rows))
+
+    positions = range(len(net_rows))[row_slice if row_slice is not None else slice(None)]
+    if row_filter is None:
+        index = pd.RangeIndex(positions.start, positions.stop, positions.step)
+    else:
+        sliced_positions = np.arange(positions.start, positions.stop, positions.step, dtype=np.int64)
+        index = pd.Index(sliced_positions[np.isin(sliced_positions, _filter_row_positions(data_table, row_filter))])
+
+    return _rows_at(net_rows, index), index
+
+
+def _filter_row_positions(data_table: DataTable, row_filter: str) -> np.ndarray:
+    net_positions = _select(data_table.Select(row_filter), DataRow, Int32,
+                            lambda row: Expression.Call(Expression.Constant(data_table.Rows),
+                                                        _DATA_ROW_COLLECTION_INDEX_OF, row))
+    return net_array.as_numpy_array(net_positions, np.int32)
+
+
+def _rows_at(net_rows, positions):
+    net_positions = net_array.as_net_array(np.asarray(positions, dtype=np.int32), Int32)
+    return _select(net_positions, Int32, DataRow,
+                   lambda position: Expression.ArrayIndex(Expression.Constant(net_rows), position))
 
 
-def _read_data_table(data_table: DataTable) -> Iterable[dict]:
+def _read_data_column(net_rows, net_column):
     """
-    Read each row of the .NET `DataTable` into an `Iterable` of  `dicts`.
+    Read all the values of a single .NET `DataColumn`.
 
     Args:
-        data_table: The .NET `DataTable` to read.
+        net_rows: The .NET array of all the `DataRow` instances of the table.
+        net_column: The .NET `DataColumn` to read.
 
     Returns:
-        Yields a
-    """
-    # Adapted from code at
-    # https://docs.microsoft.com/en-us/dotnet/framework/data/adonet/dataset-datatable-dataview/creating-a-datareader
-    # retrieved on 18-Apr-2021.
-    with dnd.disposable(data_table.CreateDataReader()) as reader:
-        while True:
-            if reader.HasRows:
-                has_row = reader.Read()
-                while has_row:
-                    yield _table_row_to_dict(reader)
-                    has_row = reader.Read()
-            else:
-                return
-            if not reader.NextResult():
-                break
-
-
-def _table_row_to_dict(reader):
-    @toolz.curry
-    def get_value(dt_reader, cell_location):
-        _, column_name = cell_location
-        return cell_location, dt_reader[column_name]
-
-    def add_to_dict(so_far, to_accumulate):
-        column_name, cell_value = to_accumulate
-        return toolz.assoc(so_far, column_name, cell_value)
-
-    def to_dict(pairs):
-        dict_result = toolz.reduce(add_to_dict, pairs, {})
-        return dict_result
-
-    def net_value_to_python_value(cell_location_value_pair):
-        (column_no, column_name), value = cell_location_value_pair
-        try:
-            converted = dataclasses.replace(CellDto(column_no, column_name, value),
-                                            value=net_cell_value_to_pandas_cell_value(value))
-            return (converted.row, converted.column), converted.value
-        except ValueError as ve:
-            if 'DateTimeOffset.MinValue' in str(ve):
-                raise DataFrameAdapterDateTimeOffsetMinValueError(column_no, column_name)
-            else:
-                raise Exception(f"Cannot read value from dot net data table column {column_no} named {column_name}, value {value}, {traceback.format_exc()}")
-        except TypeError as te:
-            if 'System.DateTime' in str(te):
-                raise DataFrameAdapterDateTimeError(value.GetType())
-            else:
-                raise Exception(f"Cannot read value from dot net data table column {column_no} named {column_name}, value {value}, {traceback.format_exc()}")
-
-    result = toolz.pipe(
-        reader.FieldCount,
-        range,
-        toolz.map(lambda column_no: (column_no, reader.GetName(column_no))),
-        toolz.map(get_value(reader)),
-        to_dict,
-        toolz.itemmap(net_value_to_python_value),
-    )
+        A sequence (typically a `numpy` or `pandas` array) containing the converted value of each row.
+    """
+    read_column = _COLUMN_READERS.get(net_column.DataType.FullName, _read_object_column)
+    return read_column(net_rows, net_column)
+
+
+def _read_floating_column(net_rows, net_column):
+    is_null = _read_null_mask(net_rows, net_column)
+    if is_null.all():
+        return _null_column(is_null)
+
+    result = net_array.as_numpy_array(_select_values(net_rows, net_column, Double), np.float64)
+    result[is_null] = np.nan
+    return result
+
+
+def _read_integral_column(net_rows, net_column):
+    is_null = _read_null_mask(net_rows, net_column)
+    if is_null.all():
+        return _null_column(is_null)
+
+    values = net_array.as_numpy_array(_select_values(net_rows, net_column, Int64), np.int64)
+    if not is_null.any():
+        return values
+
+    # Like `pandas`, represent missing integral values by converting the column to floating point values.
+    result = values.astype(np.float64)
+    result[is_null] = np.nan
     return result
+
+
+def _read_string_column(net_rows, net_column):
+    # A `DBNull` cell selects the default (`null`) `String` which Python.NET converts to `None`.
+    return list(_select_values(net_rows, net_column, String))
+
+
+def _read_guid_column(net_rows, net_column):
+    is_null = _read_null_mask(net_rows, net_column)
+    # The memory layout of a .NET `Guid` is the "little-endian" byte sequence expected by `uuid.UUID`.
+    guid_bytes = net_array.as_numpy_array(_select_values(net_rows, net_column, Guid), np.dtype('V16'))
+    return [None if null else uuid.UUID(bytes_le=guid.tobytes()) for guid, null in zip(guid_bytes, is_null)]
+
+
+def _read_date_time_column(net_rows, net_column):
+    is_null = _read_null_mask(net_rows, net_column)
+    if not is_null.all():
+        raise DataFrameAdapterDateTimeError(net_column.DataType)
+
+    return _null_column(is_null)
+
+
+def _read_date_time_offset_column(net_rows, net_column):
+    time_points = _read_date_time_offset_time_points(net_rows, net_column)
+    if not time_points.is_time_point.any() or not time_points.is_representable:
+        # `pandas` cannot represent these values as a (UTC) `datetime64` column. Convert each cell and let
+        # `pandas` determine the type of the column.
+        return _read_object_column(net_rows, net_column)
+
+    nanoseconds = np.where(time_points.is_time_point, (time_points.millisecond_ticks - _UNIX_EPOCH_TICKS) * 100,
+                           _NAT_INTEGRAL_VALUE)
+    # Localizing to `pendulum` UTC directly calculates the offset of each value. Localizing to `pandas` UTC and
+    # **then** converting to `pendulum` UTC (the time zone of the values returned by `net_dt.as_date_time`)
+    # simply changes the time zone of the result.
+    return pd.DatetimeIndex(nanoseconds.view('datetime64[ns]')).tz_localize('UTC').tz_convert(net_dt.UTC).array
+
+
+@dataclasses.dataclass
+class _DateTimeOffsetTimePoints:
+    is_time_point: np.ndarray
+    millisecond_ticks: np.ndarray
+    is_representable: bool
+
+
+def _read_date_time_offset_time_points(net_rows, net_column) -> _DateTimeOffsetTimePoints:
+    """
+    Read the time points of a .NET `DateTimeOffset` column.
+
+    Args:
+        net_rows: The .NET array of `DataRow` instances.
+        net_column: The .NET `DateTimeOffset` column.
+
+    Returns:
+        The mask of the cells that are neither `DBNull` nor sentinels, the UTC ticks of each cell truncated to
+        milliseconds, and whether all the time points are representable by a UTC `datetime64[ns]` column.
+
+    Raises:
+        DataFrameAdapterDateTimeOffsetMinValueError: If any cell is `DateTimeOffset.MinValue`.
+    """
+    is_null = _read_null_mask(net_rows, net_column)
+    utc_ticks = net_array.as_numpy_array(
+        _select_values(net_rows, net_column, Int64, lambda dto: Expression.Property(dto, 'UtcTicks')), np.int64)
+
+    is_sentinel = ~is_null & (utc_ticks >= _MAX_SENTINEL_RANGE.lower.UtcTicks)
+    is_min_value = ~is_null & (utc_ticks == DateTimeOffset.MinValue.UtcTicks)
+    if is_min_value.any():
+        raise DataFrameAdapterDateTimeOffsetMinValueError(int(np.argmax(is_min_value)), net_column.ColumnName)
+
+    # Like `net_date_time.as_date_time`, discard any fractional milliseconds.
+    is_time_point = ~(is_null | is_sentinel)
+    millisecond_ticks = utc_ticks - utc_ticks % TimeSpan.TicksPerMillisecond
+    offset_ticks = net_array.as_numpy_array(
+        _select_values(net_rows, net_column, Int64,
+                       lambda dto: Expression.Property(Expression.Property(dto, 'Offset'), 'Ticks')), np.int64)
+    time_point_ticks = millisecond_ticks[is_time_point]
+    is_representable = not ((offset_ticks[is_time_point] != 0).any() or
+                            (time_point_ticks < _MIN_TIMESTAMP_TICKS).any() or
+                            (time_point_ticks > _MAX_TIMESTAMP_TICKS).any())
+    return _DateTimeOffsetTimePoints(is_time_point, millisecond_ticks, is_representable)
+
+
+def _read_time_span_column(net_rows, net_column):
+    durations = _read_time_span_durations(net_rows, net_column)
+    if not durations.is_duration.any() or not durations.is_representable:
+        # `pandas` cannot represent these values as a `timedelta64` column. Additionally, `pandas` interprets
+        # the (signed) components of a negative `pendulum.Duration` differently than those of a negative
+        # `datetime.timedelta`. Convert each cell and let `pandas` determine the type of the column.
+        return _read_object_column(net_rows, net_column)
+
+    nanoseconds = np.where(durations.is_duration, durations.microseconds.astype(np.int64) * 1000,
+                           _NAT_INTEGRAL_VALUE)
+    return nanoseconds.view('timedelta64[ns]')
+
+
+@dataclasses.dataclass
+class _TimeSpanDurations:
+    is_duration: np.ndarray
+    microseconds: np.ndarray
+    is_representable: bool
+
+
+def _read_time_span_durations(net_rows, net_column) -> _TimeSpanDurations:
+    """
+    Read the durations of a .NET `TimeSpan` column.
+
+    Args:
+        net_rows: The .NET array of `DataRow` instances.
+        net_column: The .NET `TimeSpan` column.
+
+    Returns:
+        The mask of the cells that are neither `DBNull` nor converted to `NaT`, the (floating point) microseconds
+        of each cell, and whether all the durations are representable by a `timedelta64[ns]` column.
+    """
+    is_null = _read_null_mask(net_rows, net_column)
+    ticks = net_array.as_numpy_array(
+        _select_values(net_rows, net_column, Int64, lambda time_span: Expression.Property(time_span, 'Ticks')),
+        np.int64)
+
+    # The expressions for total days and total seconds match those of the .NET `TimeSpan` properties.
+    is_nat = ~is_null & ((ticks == TimeSpan.MaxValue.Ticks) |
+                         (ticks == TimeSpan.MinValue.Ticks) |
+                         (ticks.astype(np.float64) / TimeSpan.TicksPerDay > _MAX_TIME_SPAN_DAYS))
+    is_duration = ~(is_null | is_nat)
+    microseconds = _total_seconds_to_microseconds(ticks.astype(np.float64) / TimeSpan.TicksPerSecond)
+    duration_microseconds = microseconds[is_duration]
+    is_representable = not ((duration_microseconds < 0).any() or
+                            (duration_microseconds > _MAX_TIMEDELTA_MICROSECONDS).any())
+    return _TimeSpanDurations(is_duration, microseconds, is_representable)
+
+
+def _read_object_column(net_rows, net_column):
+    net_values = _select_column(net_rows, Object, lambda row: _cell(row, net_column))
+    return [_net_value_to_python_value(row_no, net_column.ColumnName, net_value)
+            for row_no, net_value in enumerate(net_values)]
+
+
+def _total_seconds_to_microseconds(total_seconds: np.ndarray) -> np.ndarray:
+    """
+    Round floating point seconds to (floating point) microseconds exactly as `datetime.timedelta(seconds=...)`.
+
+    Args:
+        total_seconds: The floating point seconds to round.
+
+    Returns:
+        The rounded number of microseconds (as floating point values).
+    """
+    fractional_seconds, integral_seconds = np.modf(total_seconds)
+    # Like `datetime.timedelta`, `np.round` rounds half to even.
+    return integral_seconds * 1_000_000 + np.round(fractional_seconds * 1_000_000)
+
+
+def _null_column(is_null: np.ndarray):
+    return [None] * len(is_null)
+
+
+def _read_null_mask(net_rows, net_column) -> np.ndarray:
+    return net_array.as_numpy_array(_select_column(net_rows, Boolean, lambda row: _is_null(row, net_column)),
+                                    np.bool_)
+
+
+def _select_values(net_rows, net_column, net_result_type, to_result=toolz.identity):
+    """
+    Select the value of a column from each row converting each `DBNull` cell to the default .NET value.
+
+    Args:
+        net_rows: The .NET array of `DataRow` instances.
+        net_column: The .NET `DataColumn` whose values are selected.
+        net_result_type: The .NET type of each selected value.
+        to_result: A callable transforming an `Expression` for the unboxed cell value into the `Expression`
+        selecting the result. The default selects the unboxed cell value itself.
+
+    Returns:
+        A .NET array of `net_result_type` values.
+    """
+    def select_value(row):
+        unboxed = Expression.Convert(_cell(row, net_column), net_column.DataType)
+        net_result_clr_type = clr.GetClrType(net_result_type)
+        return Expression.Condition(_is_null(row, net_column),
+                                    Expression.Default(net_result_clr_type),
+                                    Expression.Convert(to_result(unboxed), net_result_clr_type))
+
+    return _select_column(net_rows, net_result_type, select_value)
+
+
+def _select_column(net_rows, net_result_type, to_selector_body):
+    """
+    Select a value from each row of a .NET array of `DataRow` instances using a compiled .NET function.
+
+    Args:
+        net_rows: The .NET array of `DataRow` instances.
+        net_result_type: The .NET type of each selected value.
+        to_selector_body: A callable transforming the `Expression` for a `DataRow` into the `Expression` that
+        selects the value.
+
+    Returns:
+        A .NET array of `net_result_type` values.
+    """
+    return _select(net_rows, DataRow, net_result_type, to_selector_body)
+
+
+def _select(net_items, net_item_type, net_result_type, to_selector_body):
+    """
+    Select a value from each item of a .NET array using a .NET function compiled from an `Expression`.
+
+    Args:
+        net_items: The .NET array of items.
+        net_item_type: The .NET type of each item.
+        net_result_type: The .NET type of each selected value.
+        to_selector_body: A callable transforming the `Expression` for an item into the `Expression` that
+        selects the value.
+
+    Returns:
+        A .NET array of `net_result_type` values.
+    """
+    item = Expression.Parameter(clr.GetClrType(net_item_type), 'item')
+    selector = Expression.Lambda[Func[net_item_type, net_result_type]](to_selector_body(item), item).Compile()
+    return Enumerable.ToArray[net_result_type](Enumerable.Select[net_item_type, net_result_type](net_items,
+                                                                                                 selector))
+
+
+def _cell(row, net_column):
+    return Expression.Property(row, 'Item', Expression.Constant(net_column))
+
+
+def _is_null(row, net_column):
+    return Expression.Call(row, _DATA_ROW_IS_NULL, Expression.Constant(net_column))
+
+
+def _net_value_to_python_value(row_no, column_name, value):
+    try:
+        converted = dataclasses.replace(CellDto(row_no, column_name, value),
+                                        value=net_cell_value_to_pandas_cell_value(value))
+        return converted.value
+    except ValueError as ve:
+        if 'DateTimeOffset.MinValue' in str(ve):
+            raise DataFrameAdapterDateTimeOffsetMinValueError(row_no, column_name)
+        else:
+            raise Exception(f"Cannot read value from dot net data table row {row_no} column named {column_name},"
+                            f" value {value}, {traceback.format_exc()}")
+    except TypeError as te:
+        if 'System.DateTime' in str(te):
+            raise DataFrameAdapterDateTimeError(value.GetType())
+        else:
+            raise Exception(f"Cannot read value from dot net data table row {row_no} column named {column_name},"
+                            f" value {value}, {traceback.format_exc()}")
+
+
+_DATA_ROW_IS_NULL = clr.GetClrType(DataRow).GetMethod('IsNull', Array[Type]([clr.GetClrType(DataColumn)]))
+_DATA_ROW_COLLECTION_INDEX_OF = clr.GetClrType(DataRowCollection).GetMethod('IndexOf')
+
+_UNIX_EPOCH_TICKS = DateTimeOffset.UnixEpoch.UtcTicks
+_MIN_TIMESTAMP_TICKS = _UNIX_EPOCH_TICKS - (-pd.Timestamp.min.value // 100)
+_MAX_TIMESTAMP_TICKS = _UNIX_EPOCH_TICKS + pd.Timestamp.max.value // 100
+_MAX_TIMEDELTA_MICROSECONDS = pd.Timedelta.max.value // 1000
+_NAT_INTEGRAL_VALUE = np.iinfo(np.int64).min
+_MAX_TIME_SPAN_DAYS = 36525  # ~ 100 years; see the `TimeSpan` overload of `net_cell_value_to_pandas_cell_value`
+
+_COLUMN_READERS = {
+    'System.Double': _read_floating_column,
+    'System.Single': _read_floating_column,
+    'System.Byte': _read_integral_column,
+    'System.SByte': _read_integral_column,
+    'System.Int16': _read_integral_column,
+    'System.UInt16': _read_integral_column,
+    'System.Int32': _read_integral_column,
+    'System.UInt32': _read_integral_column,
+    'System.Int64': _read_integral_column,
+    'System.String': _read_string_column,
+    'System.Guid': _read_guid_column,
+    'System.DateTime': _read_date_time_column,
+    'System.DateTimeOffset': _read_date_time_offset_column,
+    'System.TimeSpan': _read_time_span_column,
+}
+"""The function reading each kind of .NET `DataColumn`. Columns of any other type are read cell by cell."""
@@ -3,15 +3,29 @@ from Orchid.FractureDiagnostics.FiberDataSet import IFiberDataSet
 import orchid.base
 from orchid import (
     dom_project_object as dpo,
-    native_fiber_data_set_info as info
+    native_data_frame_adapter as dfa,
+    native_fiber_data_set_info as info,
+    net_array,
 )
-from .utils import convert_dotnet_datetime_to_python_datetime
-from typing import List, Optional
-from datetime import datetime
+from typing import Callable, Iterator, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System import DateTime, Double, Int64
+
 INT32_MAX = 2147483647
 
+DATA_SET_BAND_BYTES = 64 * 1024 * 1024
+"""The (approximate) memory used by each band of rows copied by `NativeFiberData.copy_data_set_into`."""
+
+_NET_ELEMENT_DTYPES = {'System.Double': np.float64, 'System.Single': np.float32}
+"""The `numpy` data type matching the layout of each .NET element type of a fiber data set."""
+
+_UNIX_EPOCH_TICKS = DateTime.UnixEpoch.Ticks
+_MIN_DATETIME64_TICKS = _UNIX_EPOCH_TICKS - (-pd.Timestamp.min.value // 100)
+_MAX_DATETIME64_TICKS = _UNIX_EPOCH_TICKS + pd.Timestamp.max.value // 100
+
 
 class NativeFiberData(dpo.DomProjectObject):
     """Adapts a native IFiberDataSet to python."""
@@ -44,30 +58,171 @@ class NativeFiberData(dpo.DomProjectObject):
     def data_sets_info(self) -> List[info.NativeFiberDataSetInfo]:
         return [info.NativeFiberDataSetInfo(x) for x in self.dom_object.FiberDataSets]
 
-    def get_data_set(self, data_set_name: Optional[str] = None):
+    def get_data_set(self, data_set_name: Optional[str] = None, dtype=np.float64) -> pd.DataFrame:
+        """
+        Return the values of a data set of this fiber data as a `pandas` `DataFrame`.
+
+        Args:
+            data_set_name: The name of the data set. If `None`, return the first data set.
+            dtype: The `numpy` data type of the values. Use `np.float32` to halve the memory needed.
+
+        Returns:
+            A `pandas` `DataFrame` with a row for each depth and a column for each time.
+        """
+        return pd.DataFrame(self.get_data_set_array(data_set_name, dtype), copy=False)
+
+    def get_data_set_array(self, data_set_name: Optional[str] = None, dtype=np.float64) -> np.ndarray:
+        """
+        Return the values of a data set of this fiber data as a two-dimensional `numpy` array.
+
+        This method copies the entire .NET array in a single block and does not convert each value separately.
+
+        Args:
+            data_set_name: The name of the data set. If `None`, return the first data set.
+            dtype: The `numpy` data type of the values. Use `np.float32` to halve the memory needed.
+
+        Returns:
+            A `numpy` array with a row for each depth and a column for each time.
+        """
+        data, net_element_dtype = self._net_data_set(data_set_name)
+        return net_array.as_numpy_array(data, net_element_dtype, dtype)
+
+    def copy_data_set_into(self, allocate: Callable[[Tuple[int, int], np.dtype], np.ndarray],
+                           data_set_name: Optional[str] = None, dtype=np.float64,
+                           band_rows: Optional[int] = None) -> np.ndarray:
+        """
+        Copy the values of a data set of this fiber data into an array allocated by the caller.
+
+        Unlike `get_data_set_array`, this method copies the .NET array one band of rows at a time so that, for
+        example, copying into a memory mapped file (see `np.lib.format.open_memmap`) only needs additional memory
+        for a single band and not for the entire data set.
+
+        Args:
+            allocate: A callable returning the (writable) array, given its shape and `numpy` data type, into which
+            this method copies the values.
+            data_set_name: The name of the data set. If `None`, copy the first data set.
+            dtype: The `numpy` data type of the values.
+            band_rows: The number of rows copied at a time. If `None`, copy about `DATA_SET_BAND_BYTES` of values
+            at a time.
+
+        Returns:
+            The array returned by `allocate` containing the values with a row for each depth and a column for each
+            time.
+        """
+        data, net_element_dtype = self._net_data_set(data_set_name)
+        row_count, column_count = data.GetLength(0), data.GetLength(1)
+        result = allocate((row_count, column_count), np.dtype(dtype))
+        if band_rows is None:
+            band_rows = max(DATA_SET_BAND_BYTES // (np.dtype(net_element_dtype).itemsize * max(column_count, 1)), 1)
+
+        # The items of a two-dimensional .NET array are stored row by row, so each band is a contiguous slice.
+        for band_start in range(0, row_count, band_rows):
+            band_stop = min(band_start + band_rows, row_count)
+            band = net_array.slice_as_numpy_array(data, band_start * column_count, band_stop * column_count,
+                                                  net_element_dtype)
+            result[band_start:band_stop] = band.reshape(band_stop - band_start, column_count)
+            if isinstance(result, np.memmap):
+                # Write the band to disk so that the operating system may release its pages.
+                result.flush()
+        return result
+
+    def _net_data_set(self, data_set_name: Optional[str]):
+        data = self.dom_object.GetDataSet(self._find_data_set_info(data_set_name))
+        element_type_name = data.GetType().GetElementType().FullName
         try:
-            data_set_info = next(x for x in self.dom_object.FiberDataSets if x.name == data_set_name) if data_set_name is not None else self.dom_object.FiberDataSets[0]
+            return data, _NET_ELEMENT_DTYPES[element_type_name]
+        except KeyError:
+            raise TypeError(f'Unexpected element type, {element_type_name}, of fiber data set.')
+
+    def _find_data_set_info(self, data_set_name: Optional[str]):
+        try:
+            return next(x for x in self.dom_object.FiberDataSets if x.name == data_set_name) if data_set_name is not None else self.dom_object.FiberDataSets[0]
         except StopIteration:
             raise ValueError("No Data Set with this name in this fiber data object")
-        data = self.dom_object.GetDataSet(data_set_info)
-        data_list = [[data[i, j] for j in range(data.GetLength(1))] for i in range(data.GetLength(0))]
-        return pd.DataFrame(data_list)
-
-    def get_data_table(self, start_index: int = 0, end_index: int = INT32_MAX):
-        if end_index == INT32_MAX:
-            print("We strongly recommend that you avoid loading the entire data table and instead work with chunks, "
-                  "specifying the start and end indexes. You can also use the get_data_set method, which is faster.")
-        print("Retrieving the data table... This may take a few minutes")
+
+    def get_data_table(self, start_index: int = 0, end_index: int = INT32_MAX) -> pd.DataFrame:
+        """
+        Return the data table of this fiber data between two (depth) indices as a single `pandas` `DataFrame`.
+
+        Loading the entire data table needs memory for the entire table. Consider using `iter_data_table` to work
+        with the table one chunk at a time, or `get_data_set_array`.
+
+        Args:
+            start_index: The index of the first row of the data table.
+            end_index: The index ending the rows of the data table. If `INT32_MAX`, read to the end of the table.
+
+        Returns:
+            A `pandas` `DataFrame` with a row for each depth.
+        """
         data_table = self.dom_object.GetDataTable(self.dom_object.DepthUnit, start_index, end_index)
-        data_dict = {column: [row[column] for row in data_table.Rows] for column in data_table.Columns}
-        df = pd.DataFrame(data_dict)
-        print("Data table Retrieved")
-        return df
+        return dfa.table_to_data_frame(data_table)
+
+    def iter_data_table(self, chunk_rows: int = 1000, start_index: int = 0, end_index: int = INT32_MAX,
+                        progress: Optional[Callable[[int, int], None]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Yield the data table of this fiber data between two (depth) indices as a sequence of `pandas` `DataFrame`
+        instances.
+
+        This method reads the .NET data table in windows of (about) `chunk_rows` rows and converts each window
+        column by column. Only a single window is held in memory at a time.
+
+        Args:
+            chunk_rows: The number of rows to read in each window.
+            start_index: The index of the first row of the data table.
+            end_index: The index ending the rows of the data table. If `INT32_MAX`, read to the end of the table.
+            progress: A callable invoked after reading each window with the number of rows read so far and the
+            total number of rows to read.
+
+        Yields:
+            A `pandas` `DataFrame` for each window whose index contains the (depth) indices of its rows.
+        """
+        if chunk_rows < 1:
+            raise ValueError(f'Expected positive number of rows in each chunk but found {chunk_rows}.')
+
+        def generate_chunks():
+            # Count the depths without copying them from .NET.
+            stop_index = min(end_index, self.dom_object.Depths.Count)
+            total_rows = max(stop_index - start_index, 0)
+            window_start = start_index
+            while window_start < stop_index:
+                data_table = self.dom_object.GetDataTable(self.dom_object.DepthUnit, window_start,
+                                                          min(window_start + chunk_rows, stop_index))
+                window_rows = data_table.Rows.Count
+                if window_rows == 0:
+                    return
+
+                window = dfa.table_to_data_frame(data_table)
+                window.index = pd.RangeIndex(window_start, window_start + window_rows)
+                # Start the next window after the last row actually read.
+                window_start += window_rows
+                if progress is not None:
+                    progress(min(window_start - start_index, total_rows), total_rows)
+                yield window
+
+        return generate_chunks()
 
     @property
-    def dates(self) -> List[datetime]:
-        return [convert_dotnet_datetime_to_python_datetime(x.ToString()) for x in self.dom_object.Times]
+    def dates(self) -> np.ndarray:
+        """
+        Return the times of this fiber data.
+
+        The times are the (clock) times of the .NET `DateTime` values copied in a single block; times outside the
+        range of `datetime64[ns]` (for example, `DateTime.MinValue`) are `NaT`.
+
+        Returns:
+            A `numpy` array of `datetime64[ns]` values.
+        """
+        ticks = net_array.select_as_numpy_array(self.dom_object.Times, 'Ticks', Int64, np.int64)
+        is_representable = (ticks >= _MIN_DATETIME64_TICKS) & (ticks <= _MAX_DATETIME64_TICKS)
+        nanoseconds = np.where(is_representable, (ticks - _UNIX_EPOCH_TICKS) * 100, np.iinfo(np.int64).min)
+        return nanoseconds.view('datetime64[ns]')
 
     @property
-    def depths(self) -> List[float]:
-        return [x.Value for x in self.dom_object.Depths]
+    def depths(self) -> np.ndarray:
+        """
+        Return the depths of this fiber data (in `depth_unit`) copied in a single block.
+
+        Returns:
+            A `numpy` array of `float64` values.
+        """
+        return net_array.select_as_numpy_array(self.dom_object.Depths, 'Value', Double, np.float64)
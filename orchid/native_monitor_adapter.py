@@ -12,6 +12,7 @@
 # and may not be used in any way not expressly authorized by the Company.
 #
 
+import pandas as pd
 import pendulum
 
 import orchid.base
@@ -49,8 +50,8 @@ class NativeMonitorAdapter(dpo.DomProjectObject):
         contain samples either before or after `time_range()`.
         
         Another consequence of this definition is that if a client wants to access sample inside 
-        `time_range()`, one must write code to manually filter the series samples to only include the samples
-        in `time_range()`.
+        `time_range()`, one must limit the samples to `time_range()`; for example, by calling
+        `data_points_in_range()`.
         """,
         tsa.NativeTimeSeriesAdapter)
 
@@ -65,3 +66,14 @@ class NativeMonitorAdapter(dpo.DomProjectObject):
             methods available from a `pendulum.Interval` instance.
         """
         return pendulum.Interval(self.start_time, self.stop_time)
+
+    def data_points_in_range(self) -> pd.Series:
+        """
+        Return the samples of the well time series recorded while this monitor is active.
+
+        This method only converts the samples in `time_range()` and not the complete well time series.
+
+        Returns:
+            The `pandas` time `Series` containing the samples of `well_time_series` in `time_range()`.
+        """
+        return self.well_time_series.data_points(self.start_time, self.stop_time)
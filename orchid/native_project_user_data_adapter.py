@@ -16,15 +16,17 @@
 #
 
 import json
-from typing import Callable, Union
+from typing import Callable, Iterable, Mapping, Optional, Union
 import uuid
 
+import pandas as pd
 import toolz.curried as toolz
 
 from orchid import (
     dot_net_dom_access as dna,
     dot_net_disposable as dnd,
     net_stage_qc as nqc,
+    project_context as opc,
 )
 
 
@@ -47,8 +49,22 @@ class NativeProjectUserDataAdapter(dna.DotNetAdapter):
     # by `StartStopTimeEditorViewModel` default `Variant` logic for QC notes and for start stop
     # confirmation.
 
-    def __init__(self, adaptee: IProjectUserData):
+    def __init__(self, adaptee: IProjectUserData, net_project_callable: Callable = None):
+        """
+        Construct an instance adapting the .NET `IProjectUserData` of the .NET `IProject` provided by
+        `net_project_callable`.
+
+        Args:
+            adaptee: The .NET `IProjectUserData` to adapt.
+            net_project_callable: A callable returning the .NET `IProject` whose user data this instance adapts.
+        """
         super().__init__(adaptee)
+        self._net_project_callable = net_project_callable
+        # The parsed JSON of the project user data with the project context generation at which it was parsed.
+        # Parsing the (possibly large) JSON for every value requested is costly, so an instance associated with a
+        # project parses it only when first needed and again after any change to the project (see
+        # `ProjectContext.generation`).
+        self._maybe_user_data_json = None
 
     def stage_qc_notes(self, stage_id: uuid.UUID) -> str:
         """
@@ -60,11 +76,7 @@ class NativeProjectUserDataAdapter(dna.DotNetAdapter):
         Returns:
             The requested QC notes.
         """
-        key_func = nqc.make_qc_notes_key
-        transform_func = toolz.identity
-        default_result = ''
-
-        return self._extract_value_for_stage_id(stage_id, key_func, default_result, transform_func)
+        return _extract_value(self._user_data_json, nqc.make_qc_notes_key(stage_id), '', toolz.identity)
 
     def stage_start_stop_confirmation(self, stage_id: uuid.UUID) -> nqc.CorrectionStatus:
         """
@@ -76,31 +88,32 @@ class NativeProjectUserDataAdapter(dna.DotNetAdapter):
         Returns:
             The requested start stop confirmation.
         """
-        key_func = nqc.make_start_stop_confirmation_key
-        transform_func = nqc.CorrectionStatus
-        default_result = nqc.CorrectionStatus.NEW
-
-        return self._extract_value_for_stage_id(stage_id, key_func, default_result, transform_func)
-
-    def _extract_value_for_stage_id(self,
-                                    stage_id: uuid.UUID,
-                                    key_func: Callable[[uuid.UUID], str],
-                                    default_result: Union[str, nqc.CorrectionStatus],
-                                    transform_func: Callable[[str], Union[str, nqc.CorrectionStatus]]):
-        project_user_data_json = json.loads(self.dom_object.ToJson())
-        confirmation_key = key_func(stage_id)
-        # TODO: Replace hard-coded "copy" of logic
-        # Hard-coded logic for QC notes default value from `StartStopTimeEditorViewModel`:
-        # return .NET `CorrectionStatus.New` if either of stage ID or of start stop
-        # confirmation is unavailable.
-        result = default_result
-        if confirmation_key in project_user_data_json:
-            actual_value_type = toolz.get_in([confirmation_key, 'Type'], project_user_data_json)
-            assert actual_value_type == 'System.String', (f'Expected, "System.String",'
-                                                          f' but found "{actual_value_type}".')
-            text_status = toolz.get_in([confirmation_key, 'Value'], project_user_data_json)
-            result = transform_func(text_status)
-        return result
+        return _extract_value(self._user_data_json, nqc.make_start_stop_confirmation_key(stage_id),
+                              nqc.CorrectionStatus.NEW, nqc.CorrectionStatus)
+
+    def stage_qc_frame(self, stage_ids: Optional[Iterable[uuid.UUID]] = None) -> pd.DataFrame:
+        """
+        Calculate the QC notes and the start stop confirmation of many stages.
+
+        This method parses the project user data (at most) once for all the stages.
+
+        Args:
+            stage_ids: The object IDs of the stages of interest. If `None`, calculate the QC of all the stages with
+            any QC information in the project user data.
+
+        Returns:
+            A `pd.DataFrame` indexed by the stage ID with the columns, 'stage_qc_notes' and
+            'stage_start_stop_confirmation'. Stages without QC information have the default values: empty notes and
+            `CorrectionStatus.NEW`.
+        """
+        user_data_json = self._user_data_json
+        stage_ids = list(stage_ids) if stage_ids is not None else _stage_ids_with_qc(user_data_json)
+        rows = [(_extract_value(user_data_json, nqc.make_qc_notes_key(stage_id), '', toolz.identity),
+                 _extract_value(user_data_json, nqc.make_start_stop_confirmation_key(stage_id),
+                                nqc.CorrectionStatus.NEW, nqc.CorrectionStatus))
+                for stage_id in stage_ids]
+        return pd.DataFrame(rows, index=pd.Index(stage_ids, name='stage_id', dtype=object),
+                            columns=[nqc.StageQCTags.QC_NOTES.value, nqc.StageQCTags.START_STOP_CONFIRMATION.value])
 
     def set_stage_qc_notes(self, stage_id: uuid.UUID, to_notes: str) -> None:
         """
@@ -109,7 +122,7 @@ class NativeProjectUserDataAdapter(dna.DotNetAdapter):
             stage_id: The object ID that identifies the stage of interest.
             to_notes: The value to which to set the stage QC notes.
         """
-        self._set_value(stage_id, nqc.make_qc_notes_key, to_notes, toolz.identity)
+        self.set_stage_qc_bulk({stage_id: {nqc.StageQCTags.QC_NOTES: to_notes}})
 
     def set_stage_start_stop_confirmation(self, stage_id: uuid.UUID,
                                           to_confirmation: nqc.CorrectionStatus) -> None:
@@ -120,18 +133,90 @@ class NativeProjectUserDataAdapter(dna.DotNetAdapter):
             stage_id: The object ID that identifies the stage of interest.
             to_confirmation: The value to which to set the stage start stop confirmation.
         """
-        self._set_value(stage_id, nqc.make_start_stop_confirmation_key, to_confirmation, lambda v: v.value)
+        self.set_stage_qc_bulk({stage_id: {nqc.StageQCTags.START_STOP_CONFIRMATION: to_confirmation}})
 
-    def _set_value(self, stage_id, key_func, to_value, value_func):
+    def set_stage_qc_bulk(self, changes: Mapping[uuid.UUID,
+                                                 Mapping[nqc.StageQCTags, Union[str, nqc.CorrectionStatus]]]) -> None:
         """
-        Invoke `SetValue` on the mutable DOM object.
+        Set the QC notes and / or the start stop confirmation of many stages.
+
+        This method converts all the changes before changing the project user data so that an invalid change
+        changes nothing. It then applies all the changes in a single mutable session.
+
+        Example:
+
+        >>> user_data.set_stage_qc_bulk({
+        >>>     stage_id: {nqc.StageQCTags.QC_NOTES: 'Reviewed',
+        >>>                nqc.StageQCTags.START_STOP_CONFIRMATION: nqc.CorrectionStatus.CONFIRMED},
+        >>> })
 
         Args:
-            stage_id: The object ID identifying the stage whose value is to be set.
-            key_func: A callable that generates the key identifying the value.
-            to_value: The value to set.
-            value_func: A function transforming the value to the appropriate .NET value.
+            changes: Maps the object ID of each stage to change to the new values of that stage keyed by the
+            `nqc.StageQCTags` (or its value, for example, 'stage_qc_notes').
         """
-        with dnd.disposable(self.dom_object.ToMutable()) as mutable_pud:
-            mutable_pud.SetValue(key_func(stage_id),
-                                 Variant.Create.Overloads[str](value_func(to_value)))
+        net_values = [(nqc.make_key(stage_id, nqc.StageQCTags(tag)), _as_net_text(nqc.StageQCTags(tag), to_value))
+                      for stage_id, stage_changes in changes.items()
+                      for tag, to_value in stage_changes.items()]
+        if not net_values:
+            return
+
+        try:
+            with dnd.disposable(self.dom_object.ToMutable()) as mutable_pud:
+                for key, net_text in net_values:
+                    mutable_pud.SetValue(key, Variant.Create.Overloads[str](net_text))
+        finally:
+            self._maybe_user_data_json = None
+            # Other adapters of the same user data must parse it again.
+            if self._net_project_callable:
+                opc.invalidate(self._net_project_callable())
+
+    @property
+    def _user_data_json(self):
+        if not self._net_project_callable:
+            # Without a project context, this instance cannot detect changes made by others.
+            return json.loads(self.dom_object.ToJson())
+
+        generation = opc.context_for(self._net_project_callable()).generation
+        if self._maybe_user_data_json is None or self._maybe_user_data_json[0] != generation:
+            self._maybe_user_data_json = (generation, json.loads(self.dom_object.ToJson()))
+        return self._maybe_user_data_json[1]
+
+
+def _extract_value(user_data_json, key: str, default_result: Union[str, nqc.CorrectionStatus],
+                   transform_func: Callable[[str], Union[str, nqc.CorrectionStatus]]):
+    # TODO: Replace hard-coded "copy" of logic
+    # Hard-coded logic for QC notes default value from `StartStopTimeEditorViewModel`:
+    # return .NET `CorrectionStatus.New` if either of stage ID or of start stop
+    # confirmation is unavailable.
+    result = default_result
+    if key in user_data_json:
+        actual_value_type = toolz.get_in([key, 'Type'], user_data_json)
+        assert actual_value_type == 'System.String', (f'Expected, "System.String",'
+                                                      f' but found "{actual_value_type}".')
+        text_value = toolz.get_in([key, 'Value'], user_data_json)
+        result = transform_func(text_value)
+    return result
+
+
+def _stage_ids_with_qc(user_data_json):
+    """Return the object IDs of all stages with QC information (in order of first appearance)."""
+    qc_tag_values = {tag.value for tag in nqc.StageQCTags}
+    result = {}
+    for key in user_data_json:
+        stage_id_text, _, tag_value = key.partition('|')
+        if tag_value in qc_tag_values:
+            try:
+                result.setdefault(uuid.UUID(stage_id_text), None)
+            except ValueError:
+                # Not a stage QC key
+                pass
+    return list(result)
+
+
+def _as_net_text(tag: nqc.StageQCTags, to_value: Union[str, nqc.CorrectionStatus]) -> str:
+    if tag == nqc.StageQCTags.QC_NOTES:
+        if not isinstance(to_value, str):
+            raise TypeError(f'Expected QC notes to be `str` but found {type(to_value).__name__}.')
+        return to_value
+
+    return nqc.CorrectionStatus(to_value).value
@@ -19,10 +19,12 @@
 import dataclasses as dc
 import enum
 import math
-from typing import Optional, Tuple, Union
+from typing import Optional, Sequence, Tuple, Union
 
 import deal
+import numpy as np
 import option
+import pandas as pd
 import pendulum as pdt
 import toolz.curried as toolz
 
@@ -38,6 +40,7 @@ from orchid import (
     net_date_time as ndt,
     net_fracture_diagnostics_factory as fdf,
     net_quantity as onq,
+    project_context as opc,
     reference_origins as origins,
     searchable_stage_parts as ssp,
     unit_system as units,
@@ -147,17 +150,18 @@ class NativeStageAdapter(dpo.DomProjectObject):
     def _set_time_range(self, to_time_range: pdt.Interval):
         to_start_net_time = ndt.as_net_date_time(to_time_range.start)
         to_stop_net_time = ndt.as_net_date_time(to_time_range.end)
-        if len(self.stage_parts()) == 1:
-            single_stage_part = toolz.first(self.stage_parts())
+        stage_parts = self.stage_parts()
+        if len(stage_parts) == 1:
+            single_stage_part = toolz.first(stage_parts)
             with dnd.disposable(single_stage_part.dom_object.ToMutable()) as mutable_first_stage_part:
                 mutable_first_stage_part.SetStartStopTimes(to_start_net_time,
                                                            to_stop_net_time)
-        elif len(self.stage_parts()) > 1:
-            single_stage_part = toolz.first(self.stage_parts())
+        elif len(stage_parts) > 1:
+            single_stage_part = toolz.first(stage_parts)
             with dnd.disposable(single_stage_part.dom_object.ToMutable()) as mutable_first_stage_part:
                 mutable_first_stage_part.SetStartStopTimes(to_start_net_time,
                                                            single_stage_part.dom_object.StopTime)
-            last_stage_part = toolz.last(self.stage_parts())
+            last_stage_part = toolz.last(stage_parts)
             with dnd.disposable(last_stage_part.dom_object.ToMutable()) as mutable_last_stage_part:
                 mutable_last_stage_part.SetStartStopTimes(last_stage_part.dom_object.StartTime,
                                                           to_stop_net_time)
@@ -167,6 +171,7 @@ class NativeStageAdapter(dpo.DomProjectObject):
                                                         to_stop_net_time, None)
             with dnd.disposable(self.dom_object.ToMutable()) as mutable_stage:
                 mutable_stage.Parts.Add(stage_part_to_add)
+        self._invalidate_project_context()
 
     time_range = property(fget=_get_time_range, fset=_set_time_range,
                           doc='The time range (start and end) of this stage')
@@ -413,7 +418,9 @@ class NativeStageAdapter(dpo.DomProjectObject):
         Returns:
             An `ssp.SearchableStageParts` for all the stage parts for this stage.
         """
-        return ssp.SearchableStageParts(spa.NativeStagePartAdapter, self.dom_object.Parts)
+        return self._memoized('stage_parts',
+                              lambda: ssp.SearchableStageParts(spa.NativeStagePartAdapter, self.dom_object.Parts,
+                                                               lazy=True, net_project=self._net_project_callable()))
 
     def top_location(self, in_length_unit: Union[units.UsOilfield, units.Metric],
                      xy_reference_frame: origins.WellReferenceFrameXy,
@@ -449,15 +456,15 @@ class NativeStageAdapter(dpo.DomProjectObject):
         if not self.dom_object.TreatmentCurves.Items:
             return {}
 
-        def add_curve(so_far, treatment_curve):
+        result = {}
+        # Wrap the .NET treatment curves in a facade and add each to a dictionary keyed by the sampled quantity
+        # name. If many curves have the same sampled quantity name, the first such curve "wins."
+        adapters = opc.context_for(self._net_project_callable()).adapters
+        for net_treatment_curve in self.dom_object.TreatmentCurves.Items:
+            treatment_curve = adapters.get_or_add(ntc.NativeTreatmentCurveAdapter, str(net_treatment_curve.ObjectId),
+                                                  net_treatment_curve)
             curve_name = self._sampled_quantity_name_curve_map(treatment_curve.sampled_quantity_name)
-            treatment_curve_map = {curve_name: treatment_curve}
-            return toolz.merge(treatment_curve_map, so_far)
-
-        result = toolz.pipe(self.dom_object.TreatmentCurves.Items,  # start with .NET treatment curves
-                            toolz.map(ntc.NativeTreatmentCurveAdapter),  # wrap them in a facade
-                            # Transform the map to a dictionary keyed by the sampled quantity name
-                            lambda cs: toolz.reduce(add_curve, cs, {}))
+            result.setdefault(curve_name, treatment_curve)
         return result
 
 
@@ -629,3 +636,194 @@ class CreateStageDto:
         stage_parts = List[IStagePart]()
         stage_parts.Add(stage_part)
         mutable_stage.Parts = stage_parts
+
+
+# The columns of a stages frame (see `create_stages_from_frame`)
+STAGES_FRAME_REQUIRED_COLUMNS = ('stage_no', 'connection_type', 'md_top', 'md_bottom')
+STAGES_FRAME_OPTIONAL_COLUMNS = ('cluster_count', 'shmin', 'isip', 'start_time', 'stop_time')
+
+
+@deal.pre(lambda well, stages_frame, in_length_unit=None, in_pressure_unit=None:
+          in_length_unit is None or validation.is_unit_system_length(in_length_unit),
+          message=VALID_LENGTH_UNIT_MESSAGE)
+@deal.pre(lambda well, stages_frame, in_length_unit=None, in_pressure_unit=None:
+          in_pressure_unit is None or validation.arg_is_acceptable_pressure_unit(None, in_pressure_unit),
+          message='The parameter, `in_pressure_unit`, must be a unit system pressure.')
+def create_stages_from_frame(well, stages_frame: pd.DataFrame,
+                             in_length_unit: Optional[Union[units.UsOilfield, units.Metric]] = None,
+                             in_pressure_unit: Optional[Union[units.UsOilfield, units.Metric]] = None,
+                             ) -> Sequence[NativeStageAdapter]:
+    """
+    Create a stage for each row of `stages_frame`.
+
+    This function is the "bulk" equivalent of calling `CreateStageDto.create_stage` for each row. It validates each
+    column and converts each column to the project units in a single (vectorized) operation, and it reads the
+    project units only once.
+
+    The `stages_frame` has the required columns:
+
+    - 'stage_no': The (positive) stage number.
+    - 'connection_type': The `ConnectionType` (or its name; for example, 'PLUG_AND_PERF').
+    - 'md_top' and 'md_bottom': The magnitudes of the measured depths in `in_length_unit`.
+
+    and the optional columns:
+
+    - 'cluster_count': The (non-negative) cluster count. (Default 0.)
+    - 'shmin' and 'isip': The magnitudes of the pressures in `in_pressure_unit`. NaN means no value.
+    - 'start_time' and 'stop_time': The UTC start and stop times. NaT (or neither column) means the largest
+    possible .NET time range. See `CreateStageDto` for the consequences of not supplying the times or the ISIP.
+
+    Args:
+        well (NativeWellAdapter): The well of the created stages.
+        stages_frame: The details of the stages to create.
+        in_length_unit: The unit of 'md_top' and 'md_bottom'. If `None`, the project length unit.
+        in_pressure_unit: The unit of 'shmin' and 'isip'. If `None`, the project pressure unit.
+
+    Returns:
+        The `NativeStageAdapter` wrapping each created .NET `IStage`. These stages are **not** yet added to `well`.
+
+    Raises:
+        ValueError: If `stages_frame` lacks a required column or contains an invalid value.
+    """
+    missing_columns = [name for name in STAGES_FRAME_REQUIRED_COLUMNS if name not in stages_frame.columns]
+    if missing_columns:
+        raise ValueError(f'Expected stages frame to have the columns, {missing_columns}.')
+
+    project_units = well.expect_project_units
+    stage_nos = _integral_column(stages_frame, 'stage_no', lambda values: values > 0, 'positive')
+    cluster_counts = (_integral_column(stages_frame, 'cluster_count', lambda values: values >= 0, 'non-negative')
+                      if 'cluster_count' in stages_frame.columns
+                      else np.zeros(len(stages_frame), dtype=np.int64))
+    connection_types = _connection_type_column(stages_frame)
+    native_md_tops = onq.as_net_quantities(project_units.LENGTH, _magnitude_column(
+        stages_frame, 'md_top', in_length_unit, project_units.LENGTH, is_required=True))
+    native_md_bottoms = onq.as_net_quantities(project_units.LENGTH, _magnitude_column(
+        stages_frame, 'md_bottom', in_length_unit, project_units.LENGTH, is_required=True))
+    native_shmins = onq.as_net_quantities(project_units.PRESSURE, _magnitude_column(
+        stages_frame, 'shmin', in_pressure_unit, project_units.PRESSURE, is_required=False))
+    native_isips = onq.as_net_quantities(project_units.PRESSURE, _magnitude_column(
+        stages_frame, 'isip', in_pressure_unit, project_units.PRESSURE, is_required=False))
+    native_start_times, native_stop_times = _net_time_range_columns(stages_frame)
+
+    result = []
+    for row in range(len(stages_frame)):
+        native_shmin = (ScriptAdapter.MakeOptionSome(native_shmins[row])
+                        if native_shmins[row] is not None
+                        else ScriptAdapter.MakeOptionNone[UnitsNet.Pressure]())
+        # The order of completion on the well is one less than the stage number (see `CreateStageDto`).
+        native_stage = CreateStageDto.create_net_stage(well.dom_object, int(stage_nos[row]) - 1,
+                                                       connection_types[row], native_md_tops[row],
+                                                       native_md_bottoms[row], native_shmin,
+                                                       int(cluster_counts[row]))
+        # .NET only allows adding a part to a mutable stage. Because the created stage is not yet part of the
+        # project, changing it is far cheaper than changing the well.
+        with dnd.disposable(native_stage.ToMutable()) as mutable_stage:
+            stage_part = CreateStageDto.create_net_stage_part(native_stage, native_start_times[row],
+                                                              native_stop_times[row], native_isips[row])
+            CreateStageDto.add_stage_part_to_stage(mutable_stage, stage_part)
+        result.append(NativeStageAdapter(native_stage))
+    return result
+
+
+def _invalid_rows_error(stages_frame: pd.DataFrame, column_name: str, is_invalid: np.ndarray,
+                        expected: str) -> ValueError:
+    invalid_rows = stages_frame.index[is_invalid]
+    return ValueError(f'Expected {column_name} to be {expected}.'
+                      f' Found {list(stages_frame[column_name][is_invalid][:5])} in rows {list(invalid_rows[:5])}.')
+
+
+def _numeric_column(stages_frame: pd.DataFrame, column_name: str) -> np.ndarray:
+    try:
+        return pd.to_numeric(stages_frame[column_name]).to_numpy(dtype=np.float64, na_value=np.nan)
+    except (TypeError, ValueError):
+        raise ValueError(f'Expected {column_name} to contain only numbers.')
+
+
+def _integral_column(stages_frame: pd.DataFrame, column_name: str, is_valid, expected: str) -> np.ndarray:
+    values = _numeric_column(stages_frame, column_name)
+    with np.errstate(invalid='ignore'):
+        is_invalid = ~(np.isfinite(values) & (np.mod(values, 1) == 0) & is_valid(values))
+    if is_invalid.any():
+        raise _invalid_rows_error(stages_frame, column_name, is_invalid, f'a {expected} integer')
+    return values.astype(np.int64)
+
+
+def _connection_type_column(stages_frame: pd.DataFrame) -> Sequence[FormationConnectionType]:
+    net_connection_types = {**{connection_type: connection_type.value for connection_type in ConnectionType},
+                            **{connection_type.name: connection_type.value for connection_type in ConnectionType}}
+    result = stages_frame['connection_type'].map(lambda value: net_connection_types.get(value))
+    is_invalid = result.isna().to_numpy()
+    if is_invalid.any():
+        raise _invalid_rows_error(stages_frame, 'connection_type', is_invalid, 'a `ConnectionType` (or its name)')
+    return list(result)
+
+
+def _magnitude_column(stages_frame: pd.DataFrame, column_name: str,
+                      in_unit: Optional[Union[units.UsOilfield, units.Metric]],
+                      project_unit: Union[units.UsOilfield, units.Metric], is_required: bool) -> np.ndarray:
+    """
+    Return the magnitudes of a column converted (in a single operation) from `in_unit` to `project_unit`.
+
+    An optional column may contain NaN values (meaning no value); an optional column absent from `stages_frame`
+    contains only NaN values.
+    """
+    if column_name not in stages_frame.columns:
+        return np.full(len(stages_frame), np.nan)
+
+    magnitudes = _numeric_column(stages_frame, column_name)
+    if is_required:
+        is_invalid = ~np.isfinite(magnitudes)
+        if is_invalid.any():
+            raise _invalid_rows_error(stages_frame, column_name, is_invalid, 'a finite number')
+
+    if in_unit is None or in_unit == project_unit:
+        return magnitudes
+    return om.Quantity(magnitudes, in_unit.value.unit).to(project_unit.value.unit).magnitude
+
+
+def _net_time_range_columns(stages_frame: pd.DataFrame) -> Tuple[Sequence[System.DateTime], Sequence[System.DateTime]]:
+    has_start_times = 'start_time' in stages_frame.columns
+    has_stop_times = 'stop_time' in stages_frame.columns
+    if has_start_times != has_stop_times:
+        raise ValueError('Expected stages frame to have both start_time and stop_time columns or neither.')
+    if not has_start_times:
+        no_times = [System.DateTime.MaxValue] * len(stages_frame)
+        return no_times, no_times
+
+    start_times = _utc_time_column(stages_frame, 'start_time')
+    stop_times = _utc_time_column(stages_frame, 'stop_time')
+    is_no_start_time = start_times.isna().to_numpy()
+    is_no_stop_time = stop_times.isna().to_numpy()
+    if (is_no_start_time != is_no_stop_time).any():
+        raise _invalid_rows_error(stages_frame, 'start_time', is_no_start_time != is_no_stop_time,
+                                  'NaT exactly when stop_time is NaT')
+    is_reversed = (~is_no_start_time & (start_times > stop_times)).to_numpy()
+    if is_reversed.any():
+        raise _invalid_rows_error(stages_frame, 'start_time', is_reversed, 'no later than stop_time')
+
+    return _as_net_date_times(start_times), _as_net_date_times(stop_times)
+
+
+def _utc_time_column(stages_frame: pd.DataFrame, column_name: str) -> pd.Series:
+    try:
+        result = pd.to_datetime(stages_frame[column_name])
+    except (TypeError, ValueError):
+        raise ValueError(f'Expected {column_name} to contain only time points.')
+    if not isinstance(result.dtype, pd.DatetimeTZDtype) or str(result.dtype.tz) != 'UTC':
+        raise ValueError(f'Expected {column_name} to contain only UTC time points. Found {result.dtype}.')
+    return result
+
+
+_NET_TICKS_AT_UNIX_EPOCH = System.DateTime.UnixEpoch.Ticks
+_NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+
+def _as_net_date_times(utc_time_points: pd.Series) -> Sequence[System.DateTime]:
+    # Like `ndt.as_net_date_time`, discard any fractional milliseconds, and, like `CreateStageDto`, replace a
+    # missing time point with `DateTime.MaxValue`.
+    nanoseconds = utc_time_points.to_numpy(dtype='datetime64[ns]').view(np.int64)
+    ticks = ((nanoseconds // _NANOSECONDS_PER_MILLISECOND) * System.TimeSpan.TicksPerMillisecond +
+             _NET_TICKS_AT_UNIX_EPOCH)
+    is_no_time_point = utc_time_points.isna().to_numpy()
+    return [System.DateTime.MaxValue if is_no_time_point[i] else System.DateTime(int(ticks[i]), System.DateTimeKind.Utc)
+            for i in range(len(ticks))]
@@ -16,9 +16,10 @@
 #
 
 from collections import namedtuple
-from typing import Iterable
+from typing import Iterable, Optional, Union
 
 import option
+import pandas as pd
 import toolz.curried as toolz
 
 import orchid.base
@@ -33,6 +34,7 @@ from orchid import (
     native_trajectory_adapter as nta,
     net_quantity as onq,
     reference_origins as origins,
+    unit_system as units,
 )
 
 # noinspection PyUnresolvedReferences
@@ -96,7 +98,9 @@ class NativeWellAdapter(dpo.DomProjectObject):
         Returns:
             An `spo.SearchableProjectObjects` for all the stages of this project.
         """
-        return oss.SearchableStages(nsa.NativeStageAdapter, self.dom_object.Stages.Items)
+        return self._memoized('stages',
+                              lambda: oss.SearchableStages(nsa.NativeStageAdapter, self.dom_object.Stages.Items,
+                                                           lazy=True, net_project=self._net_project_callable()))
 
     def locations_for_md_kb_values(self,
                                    md_kb_values: Iterable[om.Quantity],
@@ -113,10 +117,36 @@ class NativeWellAdapter(dpo.DomProjectObject):
 
     def add_stages(self, create_stage_dtos: Iterable[nsa.CreateStageDto]):
         created_stages = [csd.create_stage(self) for csd in create_stage_dtos]
+        self._add_created_stages(created_stages)
 
+    def add_stages_from_frame(self, stages_frame: pd.DataFrame,
+                              in_length_unit: Optional[Union[units.UsOilfield, units.Metric]] = None,
+                              in_pressure_unit: Optional[Union[units.UsOilfield, units.Metric]] = None):
+        """
+        Add a stage to this well for each row of `stages_frame`.
+
+        Adding many stages, for example, when importing a completion design, is much faster using this method than
+        using `add_stages` because this method validates and converts entire columns at once. Like `add_stages`,
+        this method adds all the stages to this well in a single change.
+
+        Args:
+            stages_frame: The details of the stages to add. See `nsa.create_stages_from_frame` for its columns.
+            in_length_unit: The unit of the measured depths. If `None`, the project length unit.
+            in_pressure_unit: The unit of the pressures. If `None`, the project pressure unit.
+
+        Raises:
+            ValueError: If `stages_frame` lacks a required column or contains an invalid value. In this situation,
+            this method adds no stages.
+        """
+        created_stages = nsa.create_stages_from_frame(self, stages_frame, in_length_unit=in_length_unit,
+                                                      in_pressure_unit=in_pressure_unit)
+        self._add_created_stages(created_stages)
+
+    def _add_created_stages(self, created_stages):
         with dnd.disposable(self.dom_object.ToMutable()) as mutable_well:
             native_created_stages = self._create_net_stages(created_stages)
             mutable_well.AddStages(native_created_stages)
+        self._invalidate_project_context()
 
     @staticmethod
     def _create_net_stages(created_stages):
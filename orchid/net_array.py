@@ -0,0 +1,179 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Functions to copy arrays of primitive values between .NET and `numpy`.
+
+Iterating over a .NET array from Python crosses the Python / .NET boundary once for each item. The functions in
+this module instead pin the .NET array and copy its memory to (or from) a `numpy` array in a single operation.
+"""
+
+import ctypes
+
+import numpy as np
+
+# noinspection PyPackageRequirements
+import clr
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System import Array, Object, Type
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System.Linq import Enumerable
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System.Linq.Expressions import Expression, ParameterExpression
+# noinspection PyUnresolvedReferences,PyPackageRequirements
+from System.Runtime.InteropServices import GCHandle, GCHandleType
+
+
+def as_numpy_array(net_array, dtype, result_dtype=None) -> np.ndarray:
+    """
+    Copy a .NET array of primitive values into a new `numpy` array.
+
+    The caller is responsible for choosing a `dtype` whose memory layout matches the .NET element type; for
+    example, `np.float64` for `System.Double`, `np.int64` for `System.Int64` and `np.bool_` for `System.Boolean`.
+
+    Args:
+        net_array: The .NET array (of any rank) to copy.
+        dtype: The `numpy` data type matching the .NET element type.
+        result_dtype: The `numpy` data type of each item of the result. If `None`, the result has type `dtype`.
+        Converting while copying avoids allocating an intermediate array of type `dtype`; for example, copying
+        a `System.Double` array into a `np.float32` array needs only half the memory of the .NET array.
+
+    Returns:
+        A `numpy` array with the same shape as `net_array` containing a copy of its items.
+    """
+    shape = tuple(net_array.GetLength(dimension) for dimension in range(net_array.Rank))
+    result = np.empty(shape, dtype=result_dtype if result_dtype is not None else dtype)
+    if result.size == 0:
+        return result
+
+    pinned = GCHandle.Alloc(net_array, GCHandleType.Pinned)
+    try:
+        pinned_items = np.frombuffer((ctypes.c_char * (result.size * np.dtype(dtype).itemsize)).from_address(
+            pinned.AddrOfPinnedObject().ToInt64()), dtype=dtype).reshape(shape)
+        np.copyto(result, pinned_items)
+    finally:
+        pinned.Free()
+
+    return result
+
+
+def slice_as_numpy_array(net_array, start: int, stop: int, dtype) -> np.ndarray:
+    """
+    Copy a slice of a one-dimensional .NET array of primitive values into a new `numpy` array.
+
+    This function copies only the items of the slice; it does not copy the entire .NET array. Because .NET stores
+    the items of a multi-dimensional array row by row, `net_array` may also be a multi-dimensional array; `start`
+    and `stop` then index its items in that order. For example, the rows `[i, j)` of a two-dimensional array of
+    `n` columns are the items `[i * n, j * n)`.
+
+    Args:
+        net_array: The .NET array to copy.
+        start: The index of the first item copied.
+        stop: The index following the last item copied.
+        dtype: The `numpy` data type matching the .NET element type.
+
+    Returns:
+        A `numpy` array containing a copy of the items of `net_array[start:stop]`.
+    """
+    start, stop, _ = slice(start, stop).indices(net_array.Length)
+    result = np.empty(max(stop - start, 0), dtype=dtype)
+    if result.size == 0:
+        return result
+
+    pinned = GCHandle.Alloc(net_array, GCHandleType.Pinned)
+    try:
+        ctypes.memmove(result.ctypes.data, pinned.AddrOfPinnedObject().ToInt64() + start * result.itemsize,
+                       result.nbytes)
+    finally:
+        pinned.Free()
+
+    return result
+
+
+def as_net_array(numpy_array: np.ndarray, net_element_type):
+    """
+    Copy a one-dimensional `numpy` array into a new .NET array of primitive values.
+
+    The caller is responsible for supplying a `numpy_array` whose `dtype` matches the memory layout of
+    `net_element_type`; for example, `np.int32` for `System.Int32`.
+
+    Args:
+        numpy_array: The one-dimensional `numpy` array to copy.
+        net_element_type: The .NET type of each item of the result.
+
+    Returns:
+        A .NET array containing a copy of the items of `numpy_array`.
+    """
+    source = np.ascontiguousarray(numpy_array)
+    result = Array.CreateInstance(clr.GetClrType(net_element_type), len(source))
+    if source.size == 0:
+        return result
+
+    pinned = GCHandle.Alloc(result, GCHandleType.Pinned)
+    try:
+        ctypes.memmove(pinned.AddrOfPinnedObject().ToInt64(), source.ctypes.data, source.nbytes)
+    finally:
+        pinned.Free()
+
+    return result
+
+
+def select_as_numpy_array(net_items, property_name: str, net_result_type, dtype) -> np.ndarray:
+    """
+    Copy a property of each item of a .NET `IEnumerable<T>` into a new one-dimensional `numpy` array.
+
+    This function selects the property of every item inside .NET using a compiled .NET function and copies the
+    resulting .NET array in a single block. It does not cross the Python / .NET boundary for each item.
+
+    Args:
+        net_items: The .NET `IEnumerable<T>` (for example, a .NET array or list) of items.
+        property_name: The name of the property of `T` to select.
+        net_result_type: The .NET primitive type to which each property value is converted.
+        dtype: The `numpy` data type matching `net_result_type`.
+
+    Returns:
+        A `numpy` array containing the converted property value of each item of `net_items`.
+    """
+    net_item_type = _enumerable_item_type(net_items)
+    net_result_clr_type = clr.GetClrType(net_result_type)
+    item = Expression.Parameter(net_item_type, 'item')
+    selector = Expression.Lambda(Expression.Convert(Expression.Property(item, property_name), net_result_clr_type),
+                                 Array[ParameterExpression]([item])).Compile()
+
+    # The item type is only known at run time so invoke the generic LINQ methods by reflection
+    selected = _ENUMERABLE_SELECT.MakeGenericMethod(Array[Type]([net_item_type, net_result_clr_type])).Invoke(
+        None, Array[Object]([net_items, selector]))
+    net_values = _ENUMERABLE_TO_ARRAY.MakeGenericMethod(Array[Type]([net_result_clr_type])).Invoke(
+        None, Array[Object]([selected]))
+    return as_numpy_array(net_values, dtype)
+
+
+def _enumerable_item_type(net_items):
+    # Python.NET may wrap `net_items` in the interface through which it was obtained.
+    net_items_type = getattr(net_items, '__implementation__', net_items).GetType()
+    if net_items_type.IsArray:
+        return net_items_type.GetElementType()
+
+    try:
+        return next(candidate.GetGenericArguments()[0] for candidate in net_items_type.GetInterfaces()
+                    if candidate.IsGenericType and
+                    candidate.GetGenericTypeDefinition().FullName == 'System.Collections.Generic.IEnumerable`1')
+    except StopIteration:
+        raise TypeError(f'Expected an `IEnumerable<T>` but found {net_items_type.FullName}.')
+
+
+_ENUMERABLE_SELECT = next(method for method in clr.GetClrType(Enumerable).GetMethods()
+                          if method.Name == 'Select' and
+                          method.GetParameters()[1].ParameterType.GetGenericTypeDefinition().Name == 'Func`2')
+_ENUMERABLE_TO_ARRAY = clr.GetClrType(Enumerable).GetMethod('ToArray')
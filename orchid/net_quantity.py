@@ -22,7 +22,7 @@ from functools import singledispatch
 import math
 from numbers import Real
 import operator
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Union
 
 import option
 import toolz.curried as toolz
@@ -444,6 +444,34 @@ def as_net_quantity_in_specified_unit(specified_unit, measurement: om.Quantity)
     return as_net_quantity(specified_unit.value.physical_quantity, target_measurement)
 
 
+_NET_QUANTITY_FROM = {
+    opq.PhysicalQuantity.LENGTH: net_length_from,
+    opq.PhysicalQuantity.PRESSURE: net_pressure_from,
+}
+
+
+def as_net_quantities(specified_unit: Union[units.UsOilfield, units.Metric],
+                      magnitudes: Iterable[float]) -> List[Optional[UnitsNet.IQuantity]]:
+    """
+    Create a .NET `UnitsNet.IQuantity` instance in `specified_unit` for each of many magnitudes.
+
+    Unlike `as_net_quantity`, this function converts no units; each magnitude must already be measured in
+    `specified_unit`. Callers convert many magnitudes to `specified_unit` in a single (vectorized) operation
+    instead of converting each `Quantity` separately.
+
+    Args:
+        specified_unit: The length or pressure unit of each magnitude.
+        magnitudes: The magnitudes to convert.
+
+    Returns:
+        The .NET quantity of each magnitude or `None` if the magnitude is NaN.
+    """
+    net_quantity_from = _NET_QUANTITY_FROM[specified_unit.value.physical_quantity]
+    net_unit = _UNIT_NET_UNITS[specified_unit]
+    return [net_quantity_from(float(magnitude), net_unit) if not math.isnan(magnitude) else None
+            for magnitude in magnitudes]
+
+
 def equal_net_quantities(left_quantity: UnitsNet.IQuantity, right_quantity: UnitsNet.IQuantity,
                          comparison_details: EqualsComparisonDetails = EqualsComparisonDetails()):
     """
@@ -17,11 +17,13 @@
 
 from collections import namedtuple
 from typing import Iterable, List, Tuple
+import weakref
 
 import deal
 import option
 import toolz.curried as toolz
 
+import orchid.base
 from orchid import (
     dot_net_dom_access as dna,
     native_data_frame_adapter as dfa,
@@ -31,6 +33,7 @@ from orchid import (
     native_project_user_data_adapter as uda,
     native_well_adapter as nwa,
     net_quantity as onq,
+    project_context as opc,
     searchable_data_frames as sdf,
     searchable_project_objects as spo,
     unit_system as units,
@@ -63,14 +66,26 @@ class Project(dna.IdentifiedDotNetAdapter):
 
         project_loader: Loads an IProject to be adapted.
         """
-        super().__init__(project_loader.native_project())
+        net_project = project_loader.native_project()
+        # A project is the `IProject` of its own project context
+        super().__init__(net_project, orchid.base.constantly(net_project))
         self._project_loader = project_loader
+        # Release the state shared by the adapters of this project when this project is released.
+        weakref.finalize(self, opc.discard, self.dom_object)
 
-    azimuth = dna.transformed_dom_property('azimuth', 'The azimuth of the project measured east of north.',
-                                           toolz.compose(onq.as_measurement(units.Common.ANGLE),
-                                                         option.maybe))
     name = dna.dom_property('name', 'The name of this project.')
-    project_units = dna.transformed_dom_property('project_units', 'The project unit system.', units.as_unit_system)
+
+    @property
+    def azimuth(self):
+        """The azimuth of the project measured east of north."""
+        return self._project_value('azimuth', lambda: toolz.pipe(self.dom_object.Azimuth,
+                                                                 option.maybe,
+                                                                 onq.as_measurement(units.Common.ANGLE)))
+
+    @property
+    def project_units(self):
+        """The project unit system."""
+        return self._project_value('project_units', lambda: units.as_unit_system(self.dom_object.ProjectUnits))
 
     # _data_frames = dna.map_reduce_dom_property('data_frames', 'The project data frames.',
     #                                            dfa.NativeDataFrameAdapterIdentified, dna.dictionary_by_id, {})
@@ -78,7 +93,9 @@ class Project(dna.IdentifiedDotNetAdapter):
     @property
     def fluid_density(self):
         """The fluid density of the project in project units."""
-        return onq.as_measurement(self.project_units.DENSITY, option.maybe(self.dom_object.FluidDensity))
+        return self._project_value('fluid_density',
+                                   lambda: onq.as_measurement(self.project_units.DENSITY,
+                                                              option.maybe(self.dom_object.FluidDensity)))
 
     def data_frames(self) -> spo.SearchableProjectObjects:
         """
@@ -87,7 +104,9 @@ class Project(dna.IdentifiedDotNetAdapter):
         Returns:
             An `spo.SearchableProjectObjects` for all the data frames of this project.
         """
-        return sdf.SearchableDataFrames(dfa.NativeDataFrameAdapterIdentified, self.dom_object.DataFrames.Items)
+        return self._memoized('data_frames',
+                              lambda: sdf.SearchableDataFrames(dfa.NativeDataFrameAdapterIdentified,
+                                                               self.dom_object.DataFrames.Items, lazy=True))
 
     def default_well_colors(self) -> List[Tuple[float, float, float]]:
         """
@@ -104,7 +123,10 @@ class Project(dna.IdentifiedDotNetAdapter):
         Returns:
             An `spo.SearchableProjectObjects` for all the monitors of this project.
         """
-        return spo.SearchableProjectObjects(nma.NativeMonitorAdapter, self.dom_object.Monitors.Items)
+        return self._memoized('monitors',
+                              lambda: spo.SearchableProjectObjects(nma.NativeMonitorAdapter,
+                                                                   self.dom_object.Monitors.Items, lazy=True,
+                                                                   net_project=self.dom_object))
 
     def fiber_data(self) -> List[nfd.NativeFiberData]:
         """
@@ -127,13 +149,14 @@ class Project(dna.IdentifiedDotNetAdapter):
         """
         Return the location of the project center on the surface measured in project units.
         """
-        net_center = self.dom_object.GetProjectCenter()
-        result = toolz.pipe(net_center,
-                            toolz.map(option.maybe),
-                            toolz.map(onq.as_measurement(self.project_units.LENGTH)),
-                            list,
-                            lambda ls: SurfacePoint(ls[0], ls[1]))
-        return result
+        def calculate_project_center():
+            return toolz.pipe(self.dom_object.GetProjectCenter(),
+                              toolz.map(option.maybe),
+                              toolz.map(onq.as_measurement(self.project_units.LENGTH)),
+                              list,
+                              lambda ls: SurfacePoint(ls[0], ls[1]))
+
+        return self._project_value('project_center', calculate_project_center)
 
     def proppant_concentration_mass_unit(self):
         if self.project_units == units.UsOilfield:
@@ -151,6 +174,21 @@ class Project(dna.IdentifiedDotNetAdapter):
         else:
             raise ValueError(f'Unknown unit system: {self.project_units}')
 
+    @property
+    def time_series_cache(self) -> opc.TimeSeriesCache:
+        """
+        The cache of the converted samples of the time series of this project.
+
+        Set `time_series_cache.max_bytes` to change the memory available to the cache (or to 0 to disable
+        caching), and call `time_series_cache.statistics()` to monitor its effectiveness.
+        """
+        return opc.context_for(self.dom_object).time_series_cache
+
+    def _project_value(self, name, calculate):
+        # Share project-wide values with the adapters of the objects of this project (see
+        # `IdentifiedDotNetAdapter._maybe_project_units`).
+        return opc.context_for(self.dom_object).project_value(name, calculate)
+
     def time_series(self) -> spo.SearchableProjectObjects:
         """
         Return a `spo.SearchableProjectObjects` instance of all the time series for this project.
@@ -158,11 +196,16 @@ class Project(dna.IdentifiedDotNetAdapter):
         Returns:
             An `spo.SearchableProjectObjects` for all the time series of this project.
         """
-        return spo.SearchableProjectObjects(tsa.NativeTimeSeriesAdapter, self.dom_object.WellTimeSeriesList.Items)
+        return self._memoized('time_series',
+                              lambda: spo.SearchableProjectObjects(tsa.NativeTimeSeriesAdapter,
+                                                                   self.dom_object.WellTimeSeriesList.Items,
+                                                                   lazy=True, net_project=self.dom_object))
 
     @property
     def user_data(self) -> uda.NativeProjectUserDataAdapter:
-        return uda.NativeProjectUserDataAdapter(self.dom_object.ProjectUserData)
+        # Share a single adapter (and its parsed user data) until the project changes.
+        return self._memoized('user_data', lambda: uda.NativeProjectUserDataAdapter(self.dom_object.ProjectUserData,
+                                                                                    self._net_project_callable))
 
     def wells(self) -> spo.SearchableProjectObjects:
         """
@@ -171,7 +214,9 @@ class Project(dna.IdentifiedDotNetAdapter):
         Returns:
             An `spo.SearchableProjectObjects` for all the wells of this project.
         """
-        return spo.SearchableProjectObjects(nwa.NativeWellAdapter, self.dom_object.Wells.Items)
+        return self._memoized('wells',
+                              lambda: spo.SearchableProjectObjects(nwa.NativeWellAdapter, self.dom_object.Wells.Items,
+                                                                   lazy=True, net_project=self.dom_object))
 
     def wells_by_name(self, name: str) -> Iterable[IWell]:
         """
@@ -0,0 +1,314 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Manages state (for example, caches) shared by all the Python adapters of the objects of a single .NET project.
+
+Many adapters, for example, the adapters of time series, are created independently of the `Project` adapter. This
+module associates each .NET `IProject` with a single `ProjectContext` so that all the adapters of objects of the
+same project share the same state.
+"""
+
+from collections import namedtuple, OrderedDict
+import itertools
+import threading
+from typing import Any, Callable, Hashable, Optional
+import weakref
+
+import pandas as pd
+
+
+DEFAULT_TIME_SERIES_CACHE_BYTES = 256 * 1024 * 1024
+MAX_PROJECT_CONTEXTS = 8
+
+
+CacheStatistics = namedtuple('CacheStatistics', ['hits', 'misses', 'evictions', 'entries', 'size_bytes',
+                                                 'max_bytes'])
+
+
+class TimeSeriesCache:
+    """
+    A least-recently used cache of converted time series bounded by the memory used by the cached series.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_TIME_SERIES_CACHE_BYTES):
+        """
+        Construct an empty instance.
+
+        Args:
+            max_bytes: The maximum memory (in bytes) used by the cached time series. A value of 0 disables
+            caching.
+        """
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._size_bytes = 0
+        self._max_bytes = max_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum memory (in bytes) used by the cached time series."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, to_max_bytes: int):
+        if to_max_bytes < 0:
+            raise ValueError(f'Expected non-negative maximum bytes but found {to_max_bytes}.')
+
+        with self._lock:
+            self._max_bytes = to_max_bytes
+            self._evict()
+
+    def get_or_add(self, key: Hashable, read_series: Callable[[], pd.Series]) -> pd.Series:
+        """
+        Return the time series identified by `key`, reading and caching it if not already cached.
+
+        Args:
+            key: Identifies the time series; for example, the object ID of the time series and the time window.
+            read_series: A callable returning the time series if it is not cached.
+
+        Returns:
+            A copy of the cached time series. Changing the returned series does not change the cache.
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached.copy()
+            self._misses += 1
+
+        # Do not hold the lock while reading the (possibly large) series from .NET.
+        result = read_series()
+        size_bytes = int(result.memory_usage(index=True, deep=False))
+        with self._lock:
+            if size_bytes <= self._max_bytes and key not in self._entries:
+                self._entries[key] = result.copy()
+                self._size_bytes += size_bytes
+                self._evict()
+        return result
+
+    def clear(self):
+        """Remove all cached time series. This method does not reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def statistics(self) -> CacheStatistics:
+        """
+        Return the statistics of this cache.
+
+        Returns:
+            The number of hits, misses and evictions since this cache was created, the number of cached time series,
+            the memory used by the cached time series and the maximum memory available.
+        """
+        with self._lock:
+            return CacheStatistics(self._hits, self._misses, self._evictions, len(self._entries),
+                                   self._size_bytes, self._max_bytes)
+
+    def _evict(self):
+        while self._size_bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size_bytes -= int(evicted.memory_usage(index=True, deep=False))
+            self._evictions += 1
+
+
+class AdapterIdentityMap:
+    """
+    Maps each .NET project object to the single Python adapter of that object.
+
+    Navigating a project, for example, calling `well.stages()` repeatedly, would otherwise create a new adapter for
+    the same .NET object each time, losing the state (for example, cached values) of the previous adapter. This map
+    only holds weak references to the adapters so that it never keeps an unused adapter alive.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._adapters = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._adapters)
+
+    def get_or_add(self, make_adapter: Callable, object_id_text: str, net_project_object) -> Any:
+        """
+        Return the adapter, created by `make_adapter`, of a .NET project object, creating it if needed.
+
+        Args:
+            make_adapter: The callable that constructs the adapter of `net_project_object`.
+            object_id_text: The text of the object ID of `net_project_object`.
+            net_project_object: The .NET project object to adapt.
+
+        Returns:
+            The (single) adapter created by `make_adapter` of the .NET project object identified by
+            `object_id_text`.
+        """
+        key = (make_adapter, object_id_text)
+        with self._lock:
+            result = self._adapters.get(key)
+            if result is None:
+                result = make_adapter(net_project_object)
+                self._adapters[key] = result
+            return result
+
+    def clear(self):
+        """Remove all adapters from this map."""
+        with self._lock:
+            self._adapters.clear()
+
+
+_generations = itertools.count()
+
+
+class ProjectContext:
+    """The state shared by all the adapters of the objects of a single .NET project."""
+
+    def __init__(self):
+        self._time_series_cache = TimeSeriesCache()
+        self._adapters = AdapterIdentityMap()
+        self._lock = threading.RLock()
+        self._project_values = {}
+        self._generation = next(_generations)
+
+    @property
+    def generation(self) -> int:
+        """
+        Identifies the state of the .NET project; this value changes each time this context is invalidated.
+
+        Adapters that memoize values derived from the .NET project, for example, the collection of the stages of a
+        well, compare the generation at which they calculated the value with this generation to detect that the
+        memoized value is stale. Generations are unique across all contexts so that a context created again after
+        being discarded never matches a value memoized using the discarded context.
+        """
+        return self._generation
+
+    @property
+    def time_series_cache(self) -> TimeSeriesCache:
+        return self._time_series_cache
+
+    @property
+    def adapters(self) -> AdapterIdentityMap:
+        return self._adapters
+
+    def project_value(self, name: Hashable, calculate: Callable[[], Any]) -> Any:
+        """
+        Return a project-wide value, calculating it only if not already calculated.
+
+        Project-wide values, like the project unit system or the project fluid density, are needed by many
+        adapters but rarely change. Reading these values from .NET each time they are needed is costly.
+
+        Args:
+            name: Identifies the value; for example, 'project_units'.
+            calculate: A callable returning the value if it is not already calculated.
+
+        Returns:
+            The (shared) value. Callers must not change the returned value.
+        """
+        with self._lock:
+            try:
+                return self._project_values[name]
+            except KeyError:
+                pass
+
+        # Do not hold the lock while calculating the value from .NET.
+        result = calculate()
+        with self._lock:
+            return self._project_values.setdefault(name, result)
+
+    def invalidate(self):
+        """
+        Discard all state derived from the .NET project; for example, after changing the project.
+
+        The adapters remain valid after a change to the project so this method does not clear the adapter identity
+        map.
+        """
+        self._time_series_cache.clear()
+        with self._lock:
+            self._project_values.clear()
+            self._generation = next(_generations)
+
+
+_contexts_lock = threading.RLock()
+_contexts = OrderedDict()
+
+
+def context_for(net_project) -> ProjectContext:
+    """
+    Return the context of a .NET project, creating it if needed.
+
+    This module retains the contexts of (at most) `MAX_PROJECT_CONTEXTS` projects, discarding the context of the
+    least recently used project.
+
+    Args:
+        net_project: The .NET `IProject`.
+
+    Returns:
+        The context of `net_project`.
+    """
+    key = _project_key(net_project)
+    with _contexts_lock:
+        result = _contexts.get(key)
+        if result is None:
+            result = ProjectContext()
+            _contexts[key] = result
+            while len(_contexts) > MAX_PROJECT_CONTEXTS:
+                _contexts.popitem(last=False)
+        else:
+            _contexts.move_to_end(key)
+        return result
+
+
+def maybe_context_for(net_project) -> Optional[ProjectContext]:
+    """
+    Return the context of a .NET project if it exists.
+
+    Args:
+        net_project: The .NET `IProject`.
+
+    Returns:
+        The context of `net_project` or `None` if it has no context.
+    """
+    with _contexts_lock:
+        return _contexts.get(_project_key(net_project))
+
+
+def invalidate(net_project):
+    """
+    Invalidate the context (if any) of a .NET project; for example, after changing the project.
+
+    Args:
+        net_project: The changed .NET `IProject`.
+    """
+    context = maybe_context_for(net_project)
+    if context is not None:
+        context.invalidate()
+
+
+def discard(net_project):
+    """
+    Discard the context (if any) of a .NET project; for example, when the project is reloaded or released.
+
+    Args:
+        net_project: The .NET `IProject`.
+    """
+    with _contexts_lock:
+        _contexts.pop(_project_key(net_project), None)
+
+
+def _project_key(net_project):
+    # Python.NET creates a new Python object each time it returns a .NET object, but these Python objects compare
+    # equal (and have the same hash) if they refer to the same .NET object.
+    return getattr(net_project, '__implementation__', net_project)
@@ -26,6 +26,7 @@ import toolz.curried as toolz
 from orchid import (
     dot_net,
     dot_net_disposable as dnd,
+    project_context as opc,
     script_adapter_context as sac,
     validation,
 )
@@ -127,6 +128,9 @@ class ProjectStore:
             >>> loaded_project.Name
             'frankNstein_Bakken_UTM13_FEET'
         """
+        if self._native_project is not None:
+            # Reloading replaces the .NET project so state derived from the previous project is no longer valid.
+            opc.discard(self._native_project)
         with sac.ScriptAdapterContext():
             reader = ScriptAdapter.CreateProjectFileReader(dot_net.app_settings_path())
             self._native_project = reader.Read(pathname_to_str(self._project_pathname), TimeZoneInfo.Utc)
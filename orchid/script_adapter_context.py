@@ -14,6 +14,7 @@
 
 
 import sys
+import threading
 
 import orchid.configuration
 
@@ -44,6 +45,10 @@ clr.AddReference('Orchid.FractureDiagnostics.SDKFacade')
 from Orchid.FractureDiagnostics.SDKFacade import ScriptAdapter
 
 
+_session_lock = threading.RLock()
+_session_depth = 0
+
+
 class ScriptAdapterContext:
     """
     A "private" class with the responsibility to initialize and shutdown the .NET ScriptAdapter class.
@@ -59,23 +64,45 @@ class ScriptAdapterContext:
     `ProjectStore.native_project`, enters the context if it will actually read the project and exits the
     context when the read operation is finished.
 
+    All instances share a single, reference-counted session: entering the first (outermost) context initializes
+    the `ScriptAdapter` and exiting the last context shuts it down. Entering a context while another context is
+    active (for example, within `orchid.session()`) reuses the already initialized `ScriptAdapter`.
+
     For information on Python context managers, see
     [the Python docs](https://docs.python.org/3.8/library/stdtypes.html#context-manager-types)
     """
 
     def __enter__(self):
-        try:
-            ScriptAdapter.Init()
-            return self
-        # TODO: Correct exception type / DEADFALL issue
-        except InvalidOperationException as ioe:
-            if 'REVEAL-CORE-0xDEADFA11' in ioe.Message:
-                print('Orchid licensing error. Please contact Orchid technical support.')
-                sys.exit(-1)
-            else:
-                raise
+        global _session_depth
+        with _session_lock:
+            if _session_depth == 0:
+                _initialize_script_adapter()
+            _session_depth += 1
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        ScriptAdapter.Shutdown()
+        global _session_depth
+        with _session_lock:
+            _session_depth -= 1
+            if _session_depth == 0:
+                ScriptAdapter.Shutdown()
         # Returning no value will propagate the exception to the caller in the normal way
         return
+
+
+def is_session_active() -> bool:
+    """Return `True` if the `ScriptAdapter` is currently initialized by an active context; otherwise, `False`."""
+    with _session_lock:
+        return _session_depth > 0
+
+
+def _initialize_script_adapter():
+    try:
+        ScriptAdapter.Init()
+    # TODO: Correct exception type / DEADFALL issue
+    except InvalidOperationException as ioe:
+        if 'REVEAL-CORE-0xDEADFA11' in ioe.Message:
+            print('Orchid licensing error. Please contact Orchid technical support.')
+            sys.exit(-1)
+        else:
+            raise
@@ -24,8 +24,8 @@ from Orchid.FractureDiagnostics import IProjectObject
 
 
 class SearchableDataFrames(spo.SearchableProjectObjects):
-    def __init__(self, make_adapter: Callable, net_project_objects: Iterator[IProjectObject]):
-        super(SearchableDataFrames, self).__init__(make_adapter, net_project_objects)
+    def __init__(self, make_adapter: Callable, net_project_objects: Iterator[IProjectObject], lazy: bool = False):
+        super(SearchableDataFrames, self).__init__(make_adapter, net_project_objects, lazy)
 
         def has_duplicate_object_ids(pos):
             return not toolz.pipe(
@@ -34,7 +34,7 @@ class SearchableDataFrames(spo.SearchableProjectObjects):
                 toolz.isdistinct,
             )
 
-        if has_duplicate_object_ids(net_project_objects):
+        if has_duplicate_object_ids(self._net_project_objects):
             warnings.warn("""
             KNOWN ISSUE: Multiple data frames with duplicate object IDs detected.
             
@@ -12,12 +12,15 @@
 # and may not be used in any way not expressly authorized by the Company.
 #
 
-from typing import Callable, Iterator, Optional
+from typing import Callable, Hashable, Iterator, Optional
 import uuid
 
 import toolz.curried as toolz
 
-from orchid import dom_project_object as dpo
+from orchid import (
+    dom_project_object as dpo,
+    project_context as opc,
+)
 
 # noinspection PyUnresolvedReferences
 from Orchid.FractureDiagnostics import IProjectObject
@@ -47,6 +50,7 @@ Provides a searchable collection of `DomProjectObject` instances. This searchabl
 - Search for a single instance by object ID
 - Search for all instances with a specified name
 - Search for all instances with a specified display name
+- Search for all instances whose .NET DOM object satisfies a predicate
 
 Here are the DOM objects that currently may be collections:
 - Data frames
@@ -58,25 +62,43 @@ Here are the DOM objects that currently may be collections:
 
 This objects are all derived from `IProjectObject`. The corresponding instances in the Python API all derive from 
 `dpo.DomProjectObject` which implements the attributes `object_id`, `name` and `display_name`.
+
+A collection may be "lazy." A lazy collection only creates the adapter for a .NET project object when a caller
+actually requests that project object. Additionally, searches by name, display name and object ID (and the searches
+of derived classes) always examine the .NET DOM objects directly so that they only create adapters for the matching
+project objects.
 """
 
 
 class SearchableProjectObjects:
-    def __init__(self, make_adapter: Callable, net_project_objects: Iterator[IProjectObject]):
+    def __init__(self, make_adapter: Callable, net_project_objects: Iterator[IProjectObject], lazy: bool = False,
+                 net_project=None):
         """
         Construct a collection of project objects created my `make_adapter` using the arguments, `net_project_objects`.
         Args:
             make_adapter: The callable that constructs adapter instances using `net_project_objects`.
             net_project_objects: The sequence of .NET `IProjectObject` instances adapted by the Python API.
+            lazy: If `True`, create the adapter for each .NET project object only when first requested; otherwise,
+            create the adapters for all .NET project objects during construction.
+            net_project: The .NET `IProject` containing `net_project_objects`. If supplied, this collection shares
+            the adapter of each .NET project object with all other collections of the same project; otherwise, this
+            collection creates its own adapters.
         """
-        def add_project_object_to_collection(so_far, update_po):
-            return toolz.assoc(so_far, update_po.object_id, update_po)
-        
-        self._collection = toolz.pipe(
-            net_project_objects,
-            toolz.map(make_adapter),
-            lambda pos: toolz.reduce(add_project_object_to_collection, pos, {}),
-        )
+        self._make_adapter = make_adapter
+        self._maybe_adapter_identity_map = (opc.context_for(net_project).adapters
+                                            if net_project is not None
+                                            else None)
+        self._net_project_objects = list(net_project_objects)
+        # The mapping from the text of each object ID to the (last) .NET project object with that ID is built when
+        # first needed so that a lazy collection reads no .NET `ObjectId` during construction.
+        self._maybe_net_project_objects_by_id = None
+        self._adapters = {}
+        # Secondary indices (for example, by name) are only built when first searched.
+        self._indices = {}
+
+        if not lazy:
+            for object_id_text in self._net_project_objects_by_id:
+                self._adapter_for(object_id_text)
 
     def __iter__(self):
         """
@@ -85,16 +107,7 @@ class SearchableProjectObjects:
         Returns:
             An iterator over the items in this collection.
         """
-        # TODO: Change this implementation to be more "fundamental" than `all_objects()`.
-        # The implementation of this method currently calls `all_objects()`. I think this implementation
-        # is not quite correct; instead, `all_objects()` should call this method (even if indirectly) which
-        # should return an iterator over `self._collection.values()`.
-        #
-        # Because we have not tested the Orchid Python API much this quarter, because we are creating a
-        # release, and because I do not want to destabilize the release at this time, I have chosen to
-        # leave the implementation of `all_objects()` as is and implement this method in terms of
-        # `all_objects()`. (FYI: I did prototype "switching" the implementations and all unit tests passed.)
-        return iter(self.all_objects())
+        return (self._adapter_for(object_id_text) for object_id_text in self._net_project_objects_by_id)
 
     def __len__(self):
         """
@@ -103,7 +116,7 @@ class SearchableProjectObjects:
         Returns:
             The number of items in this collection.
         """
-        return len(self._collection)
+        return len(self._net_project_objects_by_id)
 
     def all_display_names(self) -> Iterator[str]:
         """
@@ -112,7 +125,8 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all the display names of project objects in this collection.
         """
-        return toolz.map(lambda po: po.display_name, self._collection.values())
+        return toolz.map(lambda npo: dpo.transform_display_name(npo.DisplayName),
+                         self._net_project_objects_by_id.values())
 
     def all_names(self) -> Iterator[str]:
         """
@@ -121,7 +135,7 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all the names of project objects in this collection.
         """
-        return toolz.map(lambda po: po.name, self._collection.values())
+        return toolz.map(lambda npo: npo.Name, self._net_project_objects_by_id.values())
 
     def all_object_ids(self) -> Iterator[uuid.UUID]:
         """
@@ -130,7 +144,7 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all the object IDs of project objects in this collection.
         """
-        return self._collection.keys()
+        return [uuid.UUID(object_id_text) for object_id_text in self._net_project_objects_by_id]
 
     def all_objects(self) -> Iterator[dpo.DomProjectObject]:
         """
@@ -139,19 +153,38 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all the project objects in this collection.
         """
-        return self._collection.values()
+        return list(self)
 
     def find(self, predicate: Callable) -> Iterator[dpo.DomProjectObject]:
         """
         Return an iterator over all project objects for which `predicate` returns `True`.
 
+        Because `predicate` is invoked with the project object (adapter), this method creates the adapters for
+        **all** the project objects in a lazy collection. Consider `find_by_dom_predicate` to avoid this cost.
+
         Args:
             predicate: The `boolean` `Callable` to be invoked for each `dpo.DomProjectObject` in the collection.
 
         Returns:
             An iterator over all project objects fulfilling `predicate`.
         """
-        return toolz.filter(predicate, self._collection.values())
+        return toolz.filter(predicate, self.all_objects())
+
+    def find_by_dom_predicate(self, dom_predicate: Callable[[IProjectObject], bool]) -> Iterator[dpo.DomProjectObject]:
+        """
+        Return an iterator over all project objects whose adapted .NET DOM object fulfills `dom_predicate`.
+
+        This method only creates adapters for the matching project objects.
+
+        Args:
+            dom_predicate: The `boolean` `Callable` to be invoked for each .NET `IProjectObject` in the collection.
+
+        Returns:
+            An iterator over all project objects whose .NET DOM object fulfills `dom_predicate`.
+        """
+        return [self._adapter_for(object_id_text)
+                for object_id_text, net_project_object in self._net_project_objects_by_id.items()
+                if dom_predicate(net_project_object)]
 
     def find_by_display_name(self, display_name_to_find: str) -> Iterator[dpo.DomProjectObject]:
         """
@@ -163,7 +196,7 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all project objects with the specified `display_name` property.
         """
-        return self.find(lambda po: po.display_name == display_name_to_find.strip())
+        return self._find_by_index('display_name', lambda npo: npo.DisplayName, display_name_to_find.strip())
 
     def find_by_name(self, name_to_find: str) -> Iterator[dpo.DomProjectObject]:
         """
@@ -175,7 +208,7 @@ class SearchableProjectObjects:
         Returns:
             An iterator over all project objects with the specified `name` property.
         """
-        return self.find(lambda po: po.name == name_to_find.strip())
+        return self._find_by_index('name', lambda npo: npo.Name, name_to_find.strip())
 
     def find_by_object_id(self, object_id_to_find: uuid.UUID) -> Optional[dpo.DomProjectObject]:
         """
@@ -187,4 +220,90 @@ class SearchableProjectObjects:
         Returns:
             The project objects with the specified `name` property. If no such project is found, return `None`.
         """
-        return toolz.get(object_id_to_find, self._collection, default=None)
+        object_id_text = str(object_id_to_find)
+        if object_id_text not in self._net_project_objects_by_id:
+            return None
+        return self._adapter_for(object_id_text)
+
+    @property
+    def _net_project_objects_by_id(self):
+        if self._maybe_net_project_objects_by_id is None:
+            # Like a dictionary built from the adapters, the last .NET project object with a given object ID "wins."
+            self._maybe_net_project_objects_by_id = {str(npo.ObjectId): npo for npo in self._net_project_objects}
+        return self._maybe_net_project_objects_by_id
+
+    def _adapter_for(self, object_id_text: str) -> dpo.DomProjectObject:
+        """
+        Return the adapter for the .NET project object identified by `object_id_text` creating it if needed.
+
+        Args:
+            object_id_text: The text of the object ID identifying the .NET project object of interest.
+
+        Returns:
+            The (single) adapter of the identified .NET project object.
+        """
+        result = self._adapters.get(object_id_text)
+        if result is None:
+            net_project_object = self._net_project_objects_by_id[object_id_text]
+            result = (self._maybe_adapter_identity_map.get_or_add(self._make_adapter, object_id_text,
+                                                                  net_project_object)
+                      if self._maybe_adapter_identity_map is not None
+                      else self._make_adapter(net_project_object))
+            self._adapters[object_id_text] = result
+        return result
+
+    def _find_by_index(self, index_name: str, dom_key_func: Callable[[IProjectObject], Hashable],
+                       to_find: Hashable) -> Iterator[dpo.DomProjectObject]:
+        """
+        Return an iterator over all project objects whose .NET key, calculated by `dom_key_func`, is `to_find`.
+
+        The author intends this method to be "protected"; that is, only called by this class and its derived classes.
+
+        The first search using `index_name` builds an index mapping each key to all the .NET project objects with
+        that key. All subsequent searches using `index_name` reuse that index so that each search is a single lookup
+        instead of a scan of the entire collection. Because the index contains .NET project objects, a search only
+        creates the adapters of the matching project objects.
+
+        Args:
+            index_name: The name identifying the index to search.
+            dom_key_func: The callable calculating the key of a .NET project object. This callable must always return
+            the same key for a given `index_name`.
+            to_find: The key of all project objects of interest.
+
+        Returns:
+            An iterator over all project objects with the key, `to_find`.
+        """
+        index = self._indices.get(index_name)
+        if index is None:
+            index = {}
+            for object_id_text, net_project_object in self._net_project_objects_by_id.items():
+                index.setdefault(dom_key_func(net_project_object), []).append(object_id_text)
+            self._indices[index_name] = index
+
+        return iter([self._adapter_for(object_id_text) for object_id_text in index.get(to_find, ())])
+
+    def _find_single_by_index(self, index_name: str, dom_key_func: Callable[[IProjectObject], Hashable],
+                              to_find: Hashable) -> Optional[dpo.DomProjectObject]:
+        """
+        Return the single project object whose .NET key, calculated by `dom_key_func`, is `to_find`.
+
+        The author intends this method to be "protected"; that is, only called by this class and its derived classes.
+
+        Args:
+            index_name: The name identifying the index to search.
+            dom_key_func: The callable calculating the key of a .NET project object.
+            to_find: The key of the project object of interest.
+
+        Returns:
+            The matching project object or `None` if no project object matches.
+
+        Raises:
+            SearchableProjectMultipleMatchError if multiple project objects match.
+        """
+        candidates = list(self._find_by_index(index_name, dom_key_func, to_find))
+        if len(candidates) == 0:
+            return None
+        elif len(candidates) == 1:
+            return candidates[0]
+        else:
+            raise SearchableProjectMultipleMatchError(to_find)
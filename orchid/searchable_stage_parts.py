@@ -36,13 +36,7 @@ class SearchableStageParts(spo.SearchableProjectObjects):
             If no such stage part is found, returns `None`. If multiple stage parts with the specified part number are
             found, raises `spo.SearchableProjectMultipleMatchError`.
         """
-        candidates = list(self.find(lambda s: s.part_no == to_find))
-        if len(candidates) == 0:
-            return None
-        elif len(candidates) == 1:
-            return candidates[0]
-        else:
-            raise spo.SearchableProjectMultipleMatchError(to_find)
+        return self._find_single_by_index('part_no', lambda s: s.PartNumber, to_find)
 
     def find_by_display_name_with_well(self, to_find: str) -> Iterable[spa.NativeStagePartAdapter]:
         """
@@ -56,7 +50,7 @@ class SearchableStageParts(spo.SearchableProjectObjects):
 
             If no such stage part is in this collection, returns an empty iterator.
         """
-        return self.find(lambda s: s.display_name_with_well == to_find)
+        return self._find_by_index('display_name_with_well', lambda s: s.DisplayNameWithWell, to_find)
 
     def find_by_display_name_without_well(self, to_find: str) -> Iterable[spa.NativeStagePartAdapter]:
         """
@@ -70,4 +64,4 @@ class SearchableStageParts(spo.SearchableProjectObjects):
 
             If no such stage part is in this collection, returns an empty iterator.
         """
-        return self.find(lambda s: s.display_name_without_well == to_find)
+        return self._find_by_index('display_name_without_well', lambda s: s.DisplayNameWithoutWell, to_find)
@@ -17,13 +17,7 @@ from orchid import searchable_project_objects as spo
 
 class SearchableStages(spo.SearchableProjectObjects):
     def find_by_display_stage_number(self, to_find: int):
-        candidates = list(self.find(lambda s: s.display_stage_number == to_find))
-        if len(candidates) == 0:
-            return None
-        elif len(candidates) == 1:
-            return candidates[0]
-        else:
-            raise spo.SearchableProjectMultipleMatchError(to_find)
+        return self._find_single_by_index('display_stage_number', lambda s: s.DisplayStageNumber, to_find)
 
     def find_by_display_name_with_well(self, to_find: str):
-        return self.find(lambda s: s.display_name_with_well == to_find)
+        return self._find_by_index('display_name_with_well', lambda s: s.DisplayNameWithWell, to_find)
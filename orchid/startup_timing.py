@@ -0,0 +1,86 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+"""
+Records the time spent in each phase of starting (and configuring) the Orchid Python API.
+
+For example,
+
+    import orchid
+    from orchid import startup_timing
+
+    project = orchid.load_project(ifrac_path)
+    print(startup_timing.report())
+
+Phases may nest; for example, importing the API may bootstrap .NET, and preparing the imports of the Orchid
+assemblies includes resolving the configuration.
+"""
+
+import contextlib
+import threading
+import time
+from typing import Dict
+
+
+_timings_lock = threading.Lock()
+_timings: Dict[str, float] = {}
+_counts: Dict[str, int] = {}
+
+
+@contextlib.contextmanager
+def timed(phase: str):
+    """
+    Add the time spent in the body of a `with` statement to the time spent in a phase.
+
+    Args:
+        phase: The name of the phase; for example, 'resolve_configuration'.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _timings_lock:
+            _timings[phase] = _timings.get(phase, 0.0) + elapsed
+            _counts[phase] = _counts.get(phase, 0) + 1
+
+
+def breakdown() -> Dict[str, float]:
+    """
+    Return the time spent in each phase.
+
+    Returns:
+        The total time (in seconds) spent in each phase in the order that the phases first finished.
+    """
+    with _timings_lock:
+        return dict(_timings)
+
+
+def report() -> str:
+    """
+    Return a (human-readable) report of the time spent in each phase.
+
+    Returns:
+        A line for each phase containing its name, the number of times it ran and its total time.
+    """
+    with _timings_lock:
+        return '\n'.join(f'{phase:<24}{_counts[phase]:>6}{1000 * elapsed:>12.1f} ms'
+                         for phase, elapsed in _timings.items())
+
+
+def clear():
+    """Forget the time spent in all phases."""
+    with _timings_lock:
+        _timings.clear()
+        _counts.clear()
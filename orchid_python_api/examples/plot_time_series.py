@@ -72,7 +72,9 @@ def plot_time_series():
 
     all_time_series = list(project.time_series().all_objects())
     all_time_series_display_names = list(project.time_series().all_display_names())
-    data_points = [series.data_points() for series in all_time_series]
+    # Each plot is only a few hundred pixels wide; downsample each series to preserve its shape without plotting
+    # (possibly) millions of samples.
+    data_points = [series.data_points(max_points=2000, method='lttb') for series in all_time_series]
 
     # 1.2 Plot the time series in a 4x4 array
 
@@ -70,7 +70,7 @@ from Orchid.FractureDiagnostics.TimeSeries import IStageSampledQuantityTimeSerie
 # noinspection PyUnresolvedReferences
 import UnitsNet
 # noinspection PyUnresolvedReferences,PyPackageRequirements
-from System import Int32, Array, DateTime, Guid
+from System import Int32, Int64, Array, DateTime, Double, Guid
 # noinspection PyUnresolvedReferences,PyPackageRequirements
 from System.Data import DataColumn, DataTable
 
@@ -463,6 +463,22 @@ class MutableWellDto(WellDto):
         return result
 
 
+def create_stub_python_time_series_arrays_dto(sample_values, unix_time_stamps, time_stamp_type=Int64):
+    """
+    Create a stub .NET `PythonTimeSeriesArraysDto` whose arrays are .NET arrays.
+
+    Args:
+        sample_values: The sample magnitudes.
+        unix_time_stamps: The Unix time stamps (in seconds) of the samples.
+        time_stamp_type: The .NET type of each Unix time stamp.
+
+    Returns:
+        A `StubPythonTimesSeriesArraysDto` containing a .NET array of sample magnitudes and of Unix time stamps.
+    """
+    return StubPythonTimesSeriesArraysDto(Array[Double](list(sample_values)),
+                                          Array[time_stamp_type](list(unix_time_stamps)))
+
+
 def create_stub_net_time_series_data_points(start_time_point: pdt.DateTime,
                                             sample_values) -> Sequence[StubNetSample]:
     """
@@ -22,7 +22,7 @@ import toolz.curried as toolz
 from orchid import net_date_time as ndt
 
 # noinspection PyUnresolvedReferences
-from System import DateTime, DBNull, Type
+from System import DateTime, DBNull, Guid, Type
 # noinspection PyUnresolvedReferences
 from System.Data import DataColumn, DataSetDateTime, DataTable
 
@@ -235,6 +235,9 @@ def make_data_table_row(row_data, data_table):
         elif is_net_time_span(data_table.Columns[net_column_name]):
             net_time_point = perhaps_cell_value.map_or(ndt.as_net_time_span, DBNull.Value)
             data_table_row[net_column_name] = net_time_point
+        elif is_net_guid(data_table.Columns[net_column_name]):
+            net_guid = perhaps_cell_value.map_or(lambda v: Guid(str(v)), DBNull.Value)
+            data_table_row[net_column_name] = net_guid
         else:
             data_table_row[net_column_name] = perhaps_cell_value.unwrap_or(DBNull.Value)
     return data_table_row
@@ -251,3 +254,4 @@ is_net_string = is_net_column_of_type('System.String')
 is_net_date_time = is_net_column_of_type('System.DateTime')
 is_net_date_time_offset = is_net_column_of_type('System.DateTimeOffset')
 is_net_time_span = is_net_column_of_type('System.TimeSpan')
+is_net_guid = is_net_column_of_type('System.Guid')
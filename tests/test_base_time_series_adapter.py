@@ -31,6 +31,9 @@ from orchid import (
 
 from tests import stub_net as tsn
 
+# noinspection PyUnresolvedReferences
+from System import Double, Int64
+
 
 class StubBaseTimeSeriesAdapter(bca.BaseTimeSeriesAdapter):
     def __init__(self, adaptee=None, net_project_callable=None):
@@ -51,7 +54,7 @@ class TestBaseCurveAdapter(unittest.TestCase):
 
         with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                                  spec=loader.as_python_time_series_arrays,
-                                 return_value=tsn.StubPythonTimesSeriesArraysDto((), ())):
+                                 return_value=tsn.create_stub_python_time_series_arrays_dto((), ())):
             actual_data_points = sut.data_points()
         assert_that(actual_data_points.empty, is_(True))
 
@@ -69,6 +72,146 @@ class TestBaseCurveAdapter(unittest.TestCase):
         sample_values = (16.12, -90.80, -27.59,)
         assert_equal_data_points(name, object_id, sample_values, start_time)
 
+    def test_data_points_preserves_fractional_second_time_stamps(self):
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_A, 'fluctus')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+            (51.07, 51.39, 50.84), (1618221600.0, 1618221600.25, 1618221600.5), Double)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=stub_python_time_series_arrays_dto):
+            actual_data_points = sut.data_points()
+
+        expected_data_points = pd.Series(data=[51.07, 51.39, 50.84],
+                                         index=pd.DatetimeIndex(['2021-04-12T10:00:00', '2021-04-12T10:00:00.25',
+                                                                 '2021-04-12T10:00:00.5'], tz='UTC'),
+                                         name='fluctus')
+        pdt.assert_series_equal(actual_data_points, expected_data_points)
+
+    def test_data_points_in_window_returns_only_samples_in_window(self):
+        start_time = pendulum.parse('2023-10-05T08:41:17Z')
+        sample_values = (4117.3, 4121.8, 4126.0, 4119.4, 4108.7)
+        for start, stop, expected_slice in [
+            (start_time.add(seconds=1), start_time.add(seconds=3), slice(1, 4)),
+            (start_time.add(seconds=1, microseconds=1), start_time.add(seconds=3, microseconds=-1), slice(2, 3)),
+            (None, start_time.add(seconds=1), slice(0, 2)),
+            (start_time.add(seconds=3), None, slice(3, 5)),
+            (start_time.add(seconds=7), start_time.add(seconds=9), slice(0, 0)),
+            (start_time.add(seconds=3), start_time.add(seconds=1), slice(0, 0)),
+        ]:
+            with self.subTest(f'Data points from {start} to {stop}'):
+                assert_equal_data_points('limes', tsn.DONT_CARE_ID_D, sample_values, start_time, start, stop,
+                                         expected_slice)
+
+    def test_data_points_in_window_copies_only_samples_in_window(self):
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_A, 'fenestra')
+        sample_values = (4117.3, 4121.8, 4126.0, 4119.4, 4108.7)
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+            sample_values, tuple(range(1696495277, 1696495277 + len(sample_values))))
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+        sut._net_project_callable = None
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=stub_python_time_series_arrays_dto), \
+                unittest.mock.patch('orchid.base_time_series_adapter.net_array.slice_as_numpy_array',
+                                    wraps=bca.net_array.slice_as_numpy_array) as spy_slice_as_numpy_array:
+            sut.data_points(pd.Timestamp('2023-10-05T08:41:18Z'), pd.Timestamp('2023-10-05T08:41:20Z'))
+
+        # Both the time stamps and the sample magnitudes are copied only from the window
+        assert_that([call.args[1:3] for call in spy_slice_as_numpy_array.call_args_list],
+                    equal_to([(1, 4), (1, 4)]))
+
+    def test_data_points_in_window_assumes_time_points_without_time_zone_are_utc(self):
+        start_time = pendulum.parse('2023-10-05T08:41:17Z')
+        sample_values = (4117.3, 4121.8, 4126.0)
+
+        assert_equal_data_points('limes', tsn.DONT_CARE_ID_D, sample_values, start_time,
+                                 pd.Timestamp('2023-10-05T08:41:18'), None, slice(1, 3))
+
+    def test_data_points_with_max_points_returns_downsampled_samples(self):
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_A, 'collis')
+        sample_values = (10.0, 12.0, 11.0, 30.0, 11.0, 12.0, 10.0, -5.0, 10.0, 11.0)
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+            sample_values, tuple(range(1696495277, 1696495277 + len(sample_values))))
+        for method, max_points, expected_values in [
+            ('lttb', 4, [10.0, 30.0, -5.0, 11.0]),
+            ('minmax', 4, [10.0, 30.0, 12.0, -5.0]),
+            ('lttb', 10, list(sample_values)),
+        ]:
+            with self.subTest(f'Downsample to {max_points} points using {method}'):
+                sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+                sut._net_project_callable = None
+                with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                         spec=loader.as_python_time_series_arrays,
+                                         return_value=stub_python_time_series_arrays_dto):
+                    actual_data_points = sut.data_points(max_points=max_points, method=method)
+
+                assert_that(actual_data_points.tolist(), equal_to(expected_values))
+                assert_that(actual_data_points.index.is_monotonic_increasing, is_(True))
+
+    def test_data_points_after_returns_only_later_samples(self):
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_B, 'crescens')
+        sample_values = (4117.3, 4121.8, 4126.0, 4119.4, 4108.7)
+        for time_stamps, time_stamp_type, after, expected_values in [
+            ((1696495277, 1696495278, 1696495279, 1696495280, 1696495281), Int64,
+             pd.Timestamp('2023-10-05T08:41:19Z'), [4119.4, 4108.7]),
+            ((1696495277, 1696495278, 1696495279, 1696495280, 1696495281), Int64,
+             pd.Timestamp('2023-10-05T08:41:19.5'), [4119.4, 4108.7]),
+            ((1696495277, 1696495278, 1696495279, 1696495280, 1696495281), Int64,
+             pd.Timestamp('2023-10-05T08:41:16Z'), list(sample_values)),
+            ((1696495277, 1696495278, 1696495279, 1696495280, 1696495281), Int64,
+             pd.Timestamp('2023-10-05T08:41:21Z'), []),
+            ((1696495277.0, 1696495277.25, 1696495277.5, 1696495277.75, 1696495278.0), Double,
+             pd.Timestamp('2023-10-05T08:41:17.5Z'), [4119.4, 4108.7]),
+        ]:
+            with self.subTest(f'Data points after {after}'):
+                sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+                stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+                    sample_values, time_stamps, time_stamp_type)
+                with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                         spec=loader.as_python_time_series_arrays,
+                                         return_value=stub_python_time_series_arrays_dto):
+                    actual_data_points = sut.data_points_after(after)
+
+                assert_that(actual_data_points.tolist(), equal_to(expected_values))
+                assert_that(actual_data_points.name, equal_to('crescens'))
+
+    def test_data_points_reads_time_series_of_project_once(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_E, 'memoria')
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+            (16.12, -90.80, -27.59), (1614517501, 1614517502, 1614517503))
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=stub_python_time_series_arrays_dto) as mock_as_arrays:
+            first_data_points = StubBaseTimeSeriesAdapter(stub_net_time_series,
+                                                          lambda: stub_net_project).data_points()
+            # Changing the returned series must not change the cached series
+            first_data_points.iloc[0] = 0.0
+            actual_data_points = StubBaseTimeSeriesAdapter(stub_net_time_series,
+                                                           lambda: stub_net_project).data_points()
+
+        assert_that(mock_as_arrays.call_count, equal_to(1))
+        assert_that(actual_data_points.tolist(), equal_to([16.12, -90.80, -27.59]))
+
+    def test_data_points_without_project_reads_time_series_each_call(self):
+        stub_net_time_series = tsn.create_stub_net_time_series(tsn.DONT_CARE_ID_E, 'memoria')
+        sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
+        # The stub adapter replaces a missing project callable with a stub
+        sut._net_project_callable = None
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto((), ())
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=stub_python_time_series_arrays_dto) as mock_as_arrays:
+            sut.data_points()
+            sut.data_points()
+
+        assert_that(mock_as_arrays.call_count, equal_to(2))
+
     @unittest.mock.patch('orchid.dot_net_dom_access.IdentifiedDotNetAdapter.expect_project_units',
                          name='stub_expect_project_units',
                          new_callable=unittest.mock.PropertyMock)
@@ -124,7 +267,8 @@ class TestBaseCurveAdapter(unittest.TestCase):
 # - test_base_time_series_adapter
 # - test_native_time_series_adapter
 # - test_native_treatment_curve_adapter
-def assert_equal_data_points(name, object_id, sample_values, start_time):
+def assert_equal_data_points(name, object_id, sample_values, start_time, window_start=None, window_stop=None,
+                             expected_slice=slice(None)):
     stub_net_time_series = tsn.create_stub_net_time_series(object_id, name)
     sut = StubBaseTimeSeriesAdapter(stub_net_time_series)
     stub_unix_time_stamps = toolz.pipe(
@@ -132,20 +276,21 @@ def assert_equal_data_points(name, object_id, sample_values, start_time):
         toolz.map(lambda dt: int(dt.timestamp())),
         list,
     )
-    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(sample_values,
-                                                                            stub_unix_time_stamps)
+    stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(sample_values,
+                                                                                      stub_unix_time_stamps)
     with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                              spec=loader.as_python_time_series_arrays,
                              return_value=stub_python_time_series_arrays_dto):
-        actual_data_points = sut.data_points()
+        actual_data_points = sut.data_points(window_start, window_stop)
         expected_sample_times = toolz.pipe(
             start_time,
             lambda st: tsn.create_1_second_time_points(st, len(sample_values)),
             toolz.map(lambda dt: int(dt.timestamp())),
             toolz.map(lambda uts: np.datetime64(uts, 's')),
-            lambda tss: pd.DatetimeIndex(tss, tz='UTC'),
+            lambda tss: pd.DatetimeIndex(tss, tz='UTC').as_unit('ns'),
         )
-        expected_data_points = pd.Series(index=expected_sample_times, data=sample_values, name=name)
+        expected_data_points = pd.Series(index=expected_sample_times, data=sample_values,
+                                         name=name).iloc[expected_slice]
         pdt.assert_series_equal(actual_data_points, expected_data_points)
 
 
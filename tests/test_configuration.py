@@ -61,6 +61,9 @@ class ConfigurationTest(unittest.TestCase):
     configuration. If the dictionary becomes deeper or shallower, one would need to change these tests.
     """
 
+    def setUp(self):
+        orchid.configuration._discard_cached_configuration()
+
     @staticmethod
     def test_canary_test():
         assert_that(2 + 2, equal_to(4))
@@ -232,6 +235,59 @@ class ConfigurationTest(unittest.TestCase):
                                       'coniugis': {'deliciam': 'lapidarium'}}))
 
 
+# Test ideas
+# - Calculates configuration once while sources unchanged
+# - Recalculates if environment variable changes
+# - Recalculates if configuration file changes
+# - Reload recalculates configuration
+# - Changing returned configuration does not change cache
+@unittest.mock.patch('orchid.configuration.get_environment_configuration',
+                     return_value={'orchid': {'training_data': 'Nilus'}})
+@unittest.mock.patch('orchid.configuration.get_file_configuration', return_value={})
+@unittest.mock.patch('orchid.configuration.get_fallback_configuration', return_value={'orchid': {'root': 'Tiberis'}})
+class CachedConfigurationTest(unittest.TestCase):
+    def setUp(self):
+        orchid.configuration._discard_cached_configuration()
+
+    def test_configuration_calculated_once_if_sources_unchanged(self, stub_get_fallback_configuration, *_):
+        orchid.configuration.get_configuration()
+        actual = orchid.configuration.get_configuration()
+
+        assert_that(stub_get_fallback_configuration.call_count, equal_to(1))
+        assert_that(actual, equal_to({'orchid': {'root': 'Tiberis', 'training_data': 'Nilus'}}))
+
+    def test_configuration_recalculated_if_environment_variable_changes(self, stub_get_fallback_configuration, *_):
+        with unittest.mock.patch.dict('os.environ', {'ORCHID_TRAINING_DATA': 'Nilus'}):
+            orchid.configuration.get_configuration()
+        with unittest.mock.patch.dict('os.environ', {'ORCHID_TRAINING_DATA': 'Danubius'}):
+            orchid.configuration.get_configuration()
+
+        assert_that(stub_get_fallback_configuration.call_count, equal_to(2))
+
+    def test_configuration_recalculated_if_configuration_file_changes(self, stub_get_fallback_configuration, *_):
+        with unittest.mock.patch('orchid.configuration.configuration_file_path') as stub_configuration_file_path:
+            stub_configuration_file_path.return_value.stat.return_value.st_mtime_ns = 1_696_495_277_000_000_000
+            orchid.configuration.get_configuration()
+            stub_configuration_file_path.return_value.stat.return_value.st_mtime_ns = 1_696_495_301_000_000_000
+            orchid.configuration.get_configuration()
+
+        assert_that(stub_get_fallback_configuration.call_count, equal_to(2))
+
+    def test_reload_configuration_recalculates_configuration(self, stub_get_fallback_configuration, *_):
+        orchid.configuration.get_configuration()
+        stub_get_fallback_configuration.return_value = {'orchid': {'root': 'Rhenus'}}
+        actual = orchid.configuration.reload_configuration()
+
+        assert_that(stub_get_fallback_configuration.call_count, equal_to(2))
+        assert_that(actual['orchid'], has_entries(root='Rhenus'))
+
+    def test_changing_configuration_does_not_change_cached_configuration(self, *_):
+        orchid.configuration.get_configuration()['orchid']['root'] = 'Padus'
+        actual = orchid.configuration.get_configuration()
+
+        assert_that(actual['orchid'], has_entries(root='Tiberis'))
+
+
 # Test ideas
 class EnvironmentConfigurationTest(unittest.TestCase):
     @staticmethod
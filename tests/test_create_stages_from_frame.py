@@ -0,0 +1,171 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import decimal
+import math
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, calling, raises, is_, none, contains_exactly
+import deal
+import pandas as pd
+import pendulum as pdt
+
+from orchid import (
+    native_stage_adapter as nsa,
+    native_well_adapter as nwa,
+    unit_system as units,
+)
+
+from tests import (
+    custom_matchers as tcm,
+    stub_net as tsn,
+)
+
+# noinspection PyUnresolvedReferences
+from System import DateTime, DateTimeKind
+# noinspection PyUnresolvedReferences
+import UnitsNet
+
+
+def make_stages_frame(**columns):
+    required_columns = {
+        'stage_no': [22, 23],
+        'connection_type': [nsa.ConnectionType.PLUG_AND_PERF, 'SLIDING_SLEEVE'],
+        'md_top': [14582.1, 14720.1],
+        'md_bottom': [14720.1, 14858.1],
+    }
+    return pd.DataFrame({**required_columns, **columns})
+
+
+def make_created_net_stage():
+    stub_net_stage = tsn.StageDto().create_net_stub()
+    stub_net_mutable_stage = tsn.MutableStageDto().create_net_stub()
+    stub_net_stage.ToMutable.return_value = stub_net_mutable_stage
+    return stub_net_stage
+
+
+def make_stub_well():
+    return nwa.NativeWellAdapter(tsn.WellDto().create_net_stub())
+
+
+# noinspection PyUnresolvedReferences
+@unittest.mock.patch('orchid.unit_system.as_unit_system', return_value=units.UsOilfield)
+@unittest.mock.patch('orchid.native_stage_adapter.CreateStageDto.create_net_stage')
+@unittest.mock.patch('orchid.native_stage_adapter.CreateStageDto.create_net_stage_part')
+@unittest.mock.patch('orchid.native_stage_adapter.CreateStageDto.add_stage_part_to_stage')
+class TestCreateStagesFromFrame(unittest.TestCase):
+    def test_canary(self, *_stubs):
+        self.assertEqual(2 + 2, 4)
+
+    def test_creates_one_stage_and_one_stage_part_for_each_row(self, stub_add_stage_part_to_stage,
+                                                               stub_create_net_stage_part, stub_create_net_stage,
+                                                               _stub_as_unit_system):
+        stub_create_net_stage.side_effect = [make_created_net_stage() for _ in range(2)]
+
+        actual = nsa.create_stages_from_frame(make_stub_well(), make_stages_frame())
+
+        assert_that(len(actual), equal_to(2))
+        assert_that(stub_create_net_stage.call_count, equal_to(2))
+        assert_that(stub_create_net_stage_part.call_count, equal_to(2))
+        assert_that(stub_add_stage_part_to_stage.call_count, equal_to(2))
+
+    def test_creates_stages_with_order_of_completion_and_connection_type(self, _stub_add_stage_part_to_stage,
+                                                                         _stub_create_net_stage_part,
+                                                                         stub_create_net_stage,
+                                                                         _stub_as_unit_system):
+        stub_create_net_stage.side_effect = [make_created_net_stage() for _ in range(2)]
+
+        nsa.create_stages_from_frame(make_stub_well(), make_stages_frame())
+
+        actual = [(call.args[1], call.args[2]) for call in stub_create_net_stage.call_args_list]
+        assert_that(actual, contains_exactly((21, nsa.ConnectionType.PLUG_AND_PERF.value),
+                                             (22, nsa.ConnectionType.SLIDING_SLEEVE.value)))
+
+    def test_converts_md_top_to_project_unit(self, _stub_add_stage_part_to_stage, _stub_create_net_stage_part,
+                                             stub_create_net_stage, stub_as_unit_system):
+        for in_length_unit, project_unit_system, expected, tolerance in [
+            (None, units.Metric, UnitsNet.Length.FromMeters(UnitsNet.QuantityValue.op_Implicit(3714.60)),
+             decimal.Decimal('0.01')),
+            (units.Metric.LENGTH, units.UsOilfield,
+             UnitsNet.Length.FromFeet(UnitsNet.QuantityValue.op_Implicit(12187.0)), decimal.Decimal('0.1')),
+        ]:
+            with self.subTest(f'Create stages with md_top in {in_length_unit} in {project_unit_system.LENGTH}'):
+                stub_create_net_stage.side_effect = [make_created_net_stage()]
+                stub_as_unit_system.return_value = project_unit_system
+                stages_frame = make_stages_frame().iloc[:1].assign(md_top=[3714.60])
+
+                nsa.create_stages_from_frame(make_stub_well(), stages_frame, in_length_unit=in_length_unit)
+
+                tcm.assert_that_net_quantities_close_to(stub_create_net_stage.call_args.args[3], expected,
+                                                        tolerance=tolerance)
+
+    def test_creates_stage_parts_with_isip_and_time_range(self, _stub_add_stage_part_to_stage,
+                                                          stub_create_net_stage_part, stub_create_net_stage,
+                                                          _stub_as_unit_system):
+        stub_create_net_stage.side_effect = [make_created_net_stage() for _ in range(2)]
+        stages_frame = make_stages_frame(
+            isip=[5109.66, math.nan],
+            start_time=[pdt.datetime(2019, 12, 29, 12, 35, 15), None],
+            stop_time=[pdt.datetime(2019, 12, 29, 14, 38, 55), None])
+
+        nsa.create_stages_from_frame(make_stub_well(), stages_frame)
+
+        first_stage_part_args, second_stage_part_args = [call.args for call in
+                                                         stub_create_net_stage_part.call_args_list]
+        assert_that(first_stage_part_args[1],
+                    tcm.equal_to_net_date_time(DateTime(2019, 12, 29, 12, 35, 15, DateTimeKind.Utc)))
+        assert_that(first_stage_part_args[2],
+                    tcm.equal_to_net_date_time(DateTime(2019, 12, 29, 14, 38, 55, DateTimeKind.Utc)))
+        tcm.assert_that_net_quantities_close_to(
+            first_stage_part_args[3],
+            UnitsNet.Pressure.FromPoundsForcePerSquareInch(UnitsNet.QuantityValue.op_Implicit(5109.66)),
+            tolerance=decimal.Decimal('0.01'))
+        assert_that(second_stage_part_args[1], tcm.equal_to_net_date_time(DateTime.MaxValue))
+        assert_that(second_stage_part_args[2], tcm.equal_to_net_date_time(DateTime.MaxValue))
+        assert_that(second_stage_part_args[3], is_(none()))
+
+    def test_invalid_stages_frame_raises_error_and_creates_no_stages(self, _stub_add_stage_part_to_stage,
+                                                                     _stub_create_net_stage_part,
+                                                                     stub_create_net_stage, _stub_as_unit_system):
+        for description, stages_frame in [
+            ('missing md_top', make_stages_frame().drop(columns='md_top')),
+            ('non-positive stage_no', make_stages_frame(stage_no=[22, 0])),
+            ('fractional stage_no', make_stages_frame(stage_no=[22, 22.5])),
+            ('negative cluster_count', make_stages_frame(cluster_count=[-1, 3])),
+            ('unknown connection_type', make_stages_frame(connection_type=['PLUG_AND_PERF', 'PLUGGED'])),
+            ('missing md_bottom value', make_stages_frame(md_bottom=[14720.1, math.nan])),
+            ('start_time without stop_time',
+             make_stages_frame(start_time=[pdt.datetime(2019, 12, 29, 12), pdt.datetime(2019, 12, 29, 14)])),
+            ('start_time after stop_time',
+             make_stages_frame(start_time=[pdt.datetime(2019, 12, 29, 15), None],
+                               stop_time=[pdt.datetime(2019, 12, 29, 14), None])),
+            ('time points without time zone',
+             make_stages_frame(start_time=pd.to_datetime(['2019-12-29T12:00', '2019-12-29T14:00']),
+                               stop_time=pd.to_datetime(['2019-12-29T13:00', '2019-12-29T15:00']))),
+        ]:
+            with self.subTest(f'Create stages from frame with {description} raises ValueError'):
+                assert_that(calling(nsa.create_stages_from_frame).with_args(make_stub_well(), stages_frame),
+                            raises(ValueError))
+                stub_create_net_stage.assert_not_called()
+
+    def test_in_length_unit_not_length_raises_error(self, *_stubs):
+        assert_that(calling(nsa.create_stages_from_frame).with_args(make_stub_well(), make_stages_frame(),
+                                                                    in_length_unit=units.Metric.PRESSURE),
+                    raises(deal.PreContractError))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import importlib
+import pathlib
+import sys
+import tempfile
+import types
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, is_, equal_to, has_item, is_not
+
+import orchid
+from orchid import dot_net_bootstrap
+
+
+def find_spec_imported_by(importing_module_name, name):
+    # Call the hook from a frame whose module is `importing_module_name` like the import statement of that module
+    namespace = {'__name__': importing_module_name, 'hook': dot_net_bootstrap._import_hook, 'name': name}
+    exec('result = hook.find_spec(name, None)', namespace)
+    return namespace['result']
+
+
+@unittest.mock.patch('orchid.dot_net_bootstrap.bootstrap', name='stub_bootstrap')
+class TestDotNetImportHook(unittest.TestCase):
+    def test_hook_bootstraps_before_import_of_dot_net_namespace_by_orchid_module(self, stub_bootstrap):
+        for name in ['clr', 'Optional', 'Orchid', 'System', 'UnitsNet']:
+            with self.subTest(f'Import {name} by orchid module'):
+                stub_bootstrap.reset_mock()
+
+                actual = find_spec_imported_by('orchid.native_stub_adapter', name)
+
+                stub_bootstrap.assert_called_once_with()
+                # Leave finding the module to the .NET import machinery
+                assert_that(actual, is_(None))
+
+    def test_hook_bootstraps_before_import_of_dot_net_namespace_by_user_script(self, stub_bootstrap):
+        # For example, a script executing `import orchid` and then `import clr` or `from System import DateTime`
+        for name in ['clr', 'Optional', 'Orchid', 'System', 'UnitsNet']:
+            with self.subTest(f'Import {name} by user script'):
+                stub_bootstrap.reset_mock()
+
+                find_spec_imported_by('__main__', name)
+
+                stub_bootstrap.assert_called_once_with()
+
+    def test_importing_system_by_user_script_bootstraps_before_finding_module(self, stub_bootstrap):
+        with tempfile.TemporaryDirectory() as module_dir:
+            pathlib.Path(module_dir, 'System.py').write_text('IS_FOUND = True\n')
+            with unittest.mock.patch.object(sys, 'path', [module_dir, *sys.path]), \
+                    unittest.mock.patch.dict(sys.modules), \
+                    unittest.mock.patch.object(sys, 'meta_path', [dot_net_bootstrap._import_hook,
+                                                                  *(finder for finder in sys.meta_path
+                                                                    if finder is not dot_net_bootstrap._import_hook)]):
+                sys.modules.pop('System', None)
+                # noinspection PyUnresolvedReferences
+                import System
+
+                # The hook only bootstraps; other finders find the module.
+                assert_that(System.IS_FOUND, equal_to(True))
+
+        stub_bootstrap.assert_called_once_with()
+
+    def test_hook_ignores_import_of_python_modules(self, stub_bootstrap):
+        for name in ['numpy', 'Orchid_utilities', 'orchid.measurement', 'System.IO']:
+            with self.subTest(f'Import {name}'):
+                dot_net_bootstrap._import_hook.find_spec(name, None)
+
+        stub_bootstrap.assert_not_called()
+
+    def test_hook_ignores_dot_net_imports_of_bootstrap_modules(self, stub_bootstrap):
+        initializing_module = types.ModuleType('orchid.dot_net')
+        initializing_module.__spec__ = unittest.mock.MagicMock(name='stub_spec', _initializing=True)
+        with unittest.mock.patch.dict(sys.modules, {'orchid.dot_net': initializing_module}):
+            dot_net_bootstrap._import_hook.find_spec('clr', None)
+
+        stub_bootstrap.assert_not_called()
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_exported_names_listed_by_dir(self):
+        for name in ['load_project', 'session', 'TreatmentCurveTypes', 'unit_registry', 'reload_configuration']:
+            with self.subTest(f'Export {name}'):
+                assert_that(dir(orchid), has_item(name))
+
+    def test_export_is_attribute_of_defining_module(self):
+        from orchid import core
+
+        assert_that(orchid.load_project, is_(core.load_project))
+
+    def test_submodules_resolve_after_bare_import(self):
+        for name in ['configuration', 'core']:
+            with self.subTest(f'Access orchid.{name}'):
+                assert_that(getattr(orchid, name), is_(importlib.import_module(f'orchid.{name}')))
+
+    def test_unknown_name_raises_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            # noinspection PyUnresolvedReferences,PyStatementEffect
+            orchid.obscurus
+
+    def test_bootstrap_removes_hook(self):
+        orchid.load_project
+
+        assert_that(dot_net_bootstrap.is_bootstrapped(), equal_to(True))
+        assert_that(sys.meta_path, is_not(has_item(dot_net_bootstrap._import_hook)))
+
+
+if __name__ == '__main__':
+    unittest.main()
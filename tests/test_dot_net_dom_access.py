@@ -37,6 +37,8 @@ class StubDomObject(dna.IdentifiedDotNetAdapter):
     stub_property = dna.dom_property('stub_property', '')
     stub_date_time = dna.transformed_dom_property('stub_date_time', '', ndt.as_date_time)
     stub_transformed_iterator = dna.transformed_dom_property_iterator('stub_transformed_iterator', '', increment)
+    stub_cached_property = dna.dom_property('stub_cached_property', '', cached=True)
+    stub_cached_transformed = dna.transformed_dom_property('stub_cached_transformed', '', increment, cached=True)
 
 
 class DotNetAdapterTest(unittest.TestCase):
@@ -91,6 +93,65 @@ class IdentifiedDotNetAdapterTest(unittest.TestCase):
 
                 assert_that(sut.expect_project_units, equal_to(unit_system))
 
+    @unittest.mock.patch('orchid.unit_system.as_unit_system', return_value=units.Metric)
+    def test_expect_project_units_converts_project_units_once_per_project(self, mock_as_unit_system):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        suts = [dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name=f'stub_adaptee_{i}'),
+                                            lambda: stub_net_project)
+                for i in range(3)]
+
+        actual = [sut.expect_project_units for sut in suts]
+
+        assert_that(actual, equal_to([units.Metric] * 3))
+        assert_that(mock_as_unit_system.call_count, equal_to(1))
+
+    @unittest.mock.patch('orchid.unit_system.as_unit_system', return_value=units.Metric)
+    def test_expect_project_units_converts_project_units_again_after_project_changed(self, mock_as_unit_system):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name='stub_adaptee'), lambda: stub_net_project)
+
+        _ = sut.expect_project_units
+        sut._invalidate_project_context()
+        _ = sut.expect_project_units
+
+        assert_that(mock_as_unit_system.call_count, equal_to(2))
+
+    @staticmethod
+    def test_memoized_calculates_value_only_once():
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name='stub_adaptee'), lambda: stub_net_project)
+        calculate = unittest.mock.MagicMock(name='calculate', return_value='stadium')
+
+        sut._memoized('stages', calculate)
+        actual = sut._memoized('stages', calculate)
+
+        calculate.assert_called_once_with()
+        assert_that(actual, equal_to('stadium'))
+
+    @staticmethod
+    def test_memoized_without_project_calculates_value_only_once():
+        sut = dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name='stub_adaptee'))
+        calculate = unittest.mock.MagicMock(name='calculate', return_value='stadium')
+
+        sut._memoized('stages', calculate)
+        sut._memoized('stages', calculate)
+
+        calculate.assert_called_once_with()
+
+    @staticmethod
+    def test_memoized_calculates_value_again_after_other_adapter_changes_project():
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name='stub_adaptee'), lambda: stub_net_project)
+        changing_adapter = dna.IdentifiedDotNetAdapter(unittest.mock.MagicMock(name='stub_changing_adaptee'),
+                                                       lambda: stub_net_project)
+        calculate = unittest.mock.MagicMock(name='calculate', side_effect=['stadium', 'stadia'])
+
+        sut._memoized('stages', calculate)
+        changing_adapter._invalidate_project_context()
+        actual = sut._memoized('stages', calculate)
+
+        assert_that(actual, equal_to('stadia'))
+
 
 class DomPropertyTest(unittest.TestCase):
     @staticmethod
@@ -130,6 +191,55 @@ class DomPropertyTest(unittest.TestCase):
                 for actual, expected in zip(actual_values, expected_values):
                     assert_that(actual, close_to(expected, 6e-4))
 
+    def test_dot_net_property_name(self):
+        for attribute_name, expected in [('name', 'Name'), ('object_id', 'ObjectId'),
+                                         ('display_name_with_well', 'DisplayNameWithWell')]:
+            with self.subTest(f'Test dot_net_property_name() of "{attribute_name}" is "{expected}"'):
+                assert_that(dna.dot_net_property_name(attribute_name), equal_to(expected))
+
+    @staticmethod
+    def test_uncached_dom_property_reads_changed_dom_value():
+        stub_adaptee = unittest.mock.MagicMock(name='stub_adaptee')
+        stub_adaptee.StubProperty = 'primus'
+        sut = StubDomObject(stub_adaptee)
+        assert_that(sut.stub_property, equal_to('primus'))
+
+        stub_adaptee.StubProperty = 'secundus'
+
+        assert_that(sut.stub_property, equal_to('secundus'))
+
+    @staticmethod
+    def test_cached_dom_property_reads_dom_value_only_once():
+        stub_adaptee = unittest.mock.MagicMock(name='stub_adaptee')
+        stub_adaptee.StubCachedProperty = 'primus'
+        sut = StubDomObject(stub_adaptee)
+        assert_that(sut.stub_cached_property, equal_to('primus'))
+
+        stub_adaptee.StubCachedProperty = 'secundus'
+
+        assert_that(sut.stub_cached_property, equal_to('primus'))
+
+    @staticmethod
+    def test_cached_transformed_dom_property_transforms_dom_value_only_once():
+        stub_adaptee = unittest.mock.MagicMock(name='stub_adaptee')
+        stub_adaptee.StubCachedTransformed = 41
+        sut = StubDomObject(stub_adaptee)
+        assert_that(sut.stub_cached_transformed, equal_to(42))
+
+        stub_adaptee.StubCachedTransformed = 99
+
+        assert_that(sut.stub_cached_transformed, equal_to(42))
+
+    @staticmethod
+    def test_cached_dom_property_is_cached_per_instance():
+        first_adaptee = unittest.mock.MagicMock(name='first_adaptee')
+        first_adaptee.StubCachedProperty = 'primus'
+        second_adaptee = unittest.mock.MagicMock(name='second_adaptee')
+        second_adaptee.StubCachedProperty = 'secundus'
+
+        assert_that(StubDomObject(first_adaptee).stub_cached_property, equal_to('primus'))
+        assert_that(StubDomObject(second_adaptee).stub_cached_property, equal_to('secundus'))
+
 
 if __name__ == '__main__':
     unittest.main()
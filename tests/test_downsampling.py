@@ -0,0 +1,111 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+
+from hamcrest import assert_that, equal_to, calling, raises, has_length, less_than_or_equal_to
+import numpy as np
+
+from orchid import (
+    downsampling as ods,
+)
+
+
+def brute_force_lttb_indices(x, y, max_points):
+    bucket_edges = np.linspace(1, len(x) - 1, max_points - 1).astype(np.int64)
+    result = [0]
+    for bucket in range(max_points - 2):
+        if bucket < max_points - 3:
+            next_bucket = slice(bucket_edges[bucket + 1], bucket_edges[bucket + 2])
+            next_x, next_y = np.mean(x[next_bucket]), np.mean(y[next_bucket])
+        else:
+            next_x, next_y = x[-1], y[-1]
+        previous = result[-1]
+        areas = [abs((x[previous] - next_x) * (y[candidate] - y[previous]) -
+                     (x[previous] - x[candidate]) * (next_y - y[previous]))
+                 for candidate in range(bucket_edges[bucket], bucket_edges[bucket + 1])]
+        result.append(int(bucket_edges[bucket] + np.argmax(areas)))
+    result.append(len(x) - 1)
+    return result
+
+
+class TestDownsampling(unittest.TestCase):
+    def test_lttb_indices_matches_brute_force(self):
+        generator = np.random.default_rng(20231005)
+        for sample_count, max_points in [(100, 10), (1000, 37), (57, 3)]:
+            with self.subTest(f'Downsample {sample_count} samples to {max_points} points'):
+                x = np.cumsum(generator.random(sample_count))
+                y = np.cumsum(generator.normal(size=sample_count))
+
+                actual = ods.lttb_indices(x, y, max_points)
+
+                assert_that(actual.tolist(), equal_to(brute_force_lttb_indices(x, y, max_points)))
+
+    def test_lttb_indices_of_few_samples_returns_all_samples(self):
+        actual = ods.lttb_indices(np.arange(5), np.array([3.0, 1.0, 4.0, 1.0, 5.0]), 5)
+
+        assert_that(actual.tolist(), equal_to([0, 1, 2, 3, 4]))
+
+    def test_lttb_indices_ignores_non_finite_samples(self):
+        y = np.array([3.0, np.nan, 4.0, 1.0, np.inf, 5.0, 9.0, 2.0])
+
+        actual = ods.lttb_indices(np.arange(len(y)), y, 4)
+
+        assert_that(actual.tolist(), has_length(4))
+        assert_that(np.all(np.isfinite(y[actual])), equal_to(True))
+        assert_that([actual[0], actual[-1]], equal_to([0, 7]))
+
+    def test_lttb_indices_preserves_precision_of_nanosecond_times(self):
+        x = np.arange(1_696_495_277_000_000_000, 1_696_495_277_000_000_000 + 10, dtype=np.int64)
+        y = np.array([0.0, 0.0, 0.0, 7.0, 0.0, 0.0, -7.0, 0.0, 0.0, 0.0])
+
+        actual = ods.lttb_indices(x, y, 4)
+
+        assert_that(actual.tolist(), equal_to([0, 3, 6, 9]))
+
+    def test_lttb_indices_fails_if_fewer_than_three_points(self):
+        assert_that(calling(ods.lttb_indices).with_args(np.arange(10), np.zeros(10), 2),
+                    raises(ValueError, pattern='at least 3'))
+
+    def test_min_max_indices_preserves_extremes_of_each_bucket(self):
+        y = np.array([2.0, 9.0, 1.0, 5.0, np.nan, 3.0, 8.0, 0.0, 4.0, 6.0, 7.0, -1.0])
+
+        actual = ods.min_max_indices(y, 6)
+
+        # Buckets of 4 samples: [2, 9, 1, 5], [nan, 3, 8, 0], [4, 6, 7, -1]
+        assert_that(actual.tolist(), equal_to([1, 2, 6, 7, 10, 11]))
+
+    def test_min_max_indices_returns_at_most_max_points(self):
+        y = np.random.default_rng(20231005).normal(size=10_001)
+
+        actual = ods.min_max_indices(y, 100)
+
+        assert_that(len(actual), less_than_or_equal_to(100))
+        assert_that(np.all(np.diff(actual) > 0), equal_to(True))
+        assert_that({int(np.argmin(y)), int(np.argmax(y))} <= set(actual.tolist()), equal_to(True))
+
+    def test_min_max_indices_fails_if_fewer_than_two_points(self):
+        assert_that(calling(ods.min_max_indices).with_args(np.zeros(10), 1),
+                    raises(ValueError, pattern='at least 2'))
+
+    def test_downsample_indices_accepts_method_name(self):
+        y = np.array([2.0, 9.0, 1.0, 5.0, 3.0, 8.0, 0.0, 4.0])
+
+        assert_that(ods.downsample_indices(np.arange(len(y)), y, 4, ods.DownsamplingMethod('minmax')).tolist(),
+                    equal_to(ods.min_max_indices(y, 4).tolist()))
+        assert_that(calling(ods.DownsamplingMethod).with_args('average'), raises(ValueError))
+
+
+if __name__ == '__main__':
+    unittest.main()
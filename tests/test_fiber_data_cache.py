@@ -0,0 +1,140 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import os
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, instance_of
+import numpy as np
+import numpy.testing as npt
+
+from orchid import (
+    fiber_data_cache as fdc,
+    native_fiber_data as nfd,
+)
+
+
+DEPTHS = np.array([2741.5, 2742.5, 2743.5, 2744.5])
+DATES = np.array(['2022-08-17T06:00:00', '2022-08-17T06:00:30', '2022-08-17T06:01:00'], dtype='datetime64[ns]')
+VALUES = np.array([[0.31, -1.07, 2.64], [0.09, 0.55, -0.18], [-3.72, 1.49, 0.86], [0.27, -0.64, 4.13]])
+
+
+def create_stub_fiber_data(file_path):
+    result = unittest.mock.MagicMock(name='stub_fiber_data', spec=nfd.NativeFiberData)
+    result.file_path = str(file_path)
+    result.data_sets_info = [unittest.mock.MagicMock(name='stub_data_set_info')]
+    result.data_sets_info[0].name = 'DAS'
+    result.depths = DEPTHS
+    result.dates = DATES
+
+    def copy_data_set_into(allocate, _data_set_name, dtype):
+        values = allocate(VALUES.shape, np.dtype(dtype))
+        values[:] = VALUES
+        return values
+
+    result.copy_data_set_into.side_effect = copy_data_set_into
+    return result
+
+
+class TestFiberDataCache(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.fiber_file_path = pathlib.Path(self.temporary_directory.name).joinpath('fiber.dat')
+        self.fiber_file_path.write_bytes(b'fiber')
+        self.sut = fdc.FiberDataCache(pathlib.Path(self.temporary_directory.name).joinpath('cache'))
+
+    def test_data_set_returns_memory_mapped_data_set(self):
+        actual = self.sut.data_set(create_stub_fiber_data(self.fiber_file_path))
+
+        assert_that(actual.values, instance_of(np.memmap))
+        npt.assert_array_equal(actual.values, VALUES)
+        npt.assert_array_equal(actual.depths, DEPTHS)
+        npt.assert_array_equal(actual.dates, DATES)
+
+    def test_data_set_extracts_data_set_only_once(self):
+        stub_fiber_data = create_stub_fiber_data(self.fiber_file_path)
+
+        self.sut.data_set(stub_fiber_data)
+        actual = fdc.FiberDataCache(self.sut.cache_directory).data_set(stub_fiber_data)
+
+        assert_that(stub_fiber_data.copy_data_set_into.call_count, equal_to(1))
+        npt.assert_array_equal(actual.values, VALUES)
+
+    def test_data_set_extracts_data_set_again_if_fiber_file_modified(self):
+        stub_fiber_data = create_stub_fiber_data(self.fiber_file_path)
+
+        self.sut.data_set(stub_fiber_data)
+        modified_time_ns = os.stat(self.fiber_file_path).st_mtime_ns + 1_000_000_000
+        os.utime(self.fiber_file_path, ns=(modified_time_ns, modified_time_ns))
+        self.sut.data_set(stub_fiber_data)
+
+        assert_that(stub_fiber_data.copy_data_set_into.call_count, equal_to(2))
+
+    def test_data_set_caches_each_name_and_dtype_separately(self):
+        stub_fiber_data = create_stub_fiber_data(self.fiber_file_path)
+
+        self.sut.data_set(stub_fiber_data)
+        self.sut.data_set(stub_fiber_data, 'DAS')
+        self.sut.data_set(stub_fiber_data, 'DTS')
+        actual = self.sut.data_set(stub_fiber_data, dtype=np.float32)
+
+        assert_that(stub_fiber_data.copy_data_set_into.call_count, equal_to(3))
+        assert_that(actual.values.dtype, equal_to(np.dtype(np.float32)))
+
+    def test_data_set_copies_values_into_memory_mapped_file(self):
+        stub_fiber_data = create_stub_fiber_data(self.fiber_file_path)
+        allocated_types = []
+
+        def copy_data_set_into(allocate, _data_set_name, dtype):
+            values = allocate(VALUES.shape, np.dtype(dtype))
+            allocated_types.append(type(values))
+            values[:] = VALUES
+            return values
+
+        stub_fiber_data.copy_data_set_into.side_effect = copy_data_set_into
+        actual = self.sut.data_set(stub_fiber_data, dtype=np.float32)
+
+        # The values are written directly to the cache file and never assembled in memory.
+        assert_that(allocated_types, equal_to([np.memmap]))
+        stub_fiber_data.get_data_set_array.assert_not_called()
+        npt.assert_array_equal(actual.values, VALUES.astype(np.float32))
+
+    def test_select_slices_by_depth_and_time(self):
+        cached = self.sut.data_set(create_stub_fiber_data(self.fiber_file_path))
+
+        actual = cached.select(min_depth=2742.0, max_depth=2743.5, start_time=np.datetime64('2022-08-17T06:00:30'))
+
+        npt.assert_array_equal(actual.values, VALUES[1:3, 1:])
+        npt.assert_array_equal(actual.depths, DEPTHS[1:3])
+        npt.assert_array_equal(actual.dates, DATES[1:])
+
+    def test_pyramid_builds_pyramid_only_once(self):
+        stub_fiber_data = create_stub_fiber_data(self.fiber_file_path)
+
+        self.sut.pyramid(stub_fiber_data, factor=2)
+        with unittest.mock.patch.object(fdc.fdp, 'build') as mock_build:
+            actual = self.sut.pyramid(stub_fiber_data, factor=2)
+
+        mock_build.assert_not_called()
+        assert_that(len(actual.levels), equal_to(3))
+        npt.assert_allclose(actual.levels[1].maximum, np.array([[0.55, 2.64], [1.49, 4.13]]))
+
+
+if __name__ == '__main__':
+    unittest.main()
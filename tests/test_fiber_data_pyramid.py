@@ -0,0 +1,114 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import pathlib
+import tempfile
+import unittest
+
+from hamcrest import assert_that, equal_to, calling, raises
+import numpy as np
+import numpy.testing as npt
+
+from orchid import (
+    fiber_data_pyramid as fdp,
+)
+
+
+def expected_tiles(values, tile_size):
+    row_count = -(-values.shape[0] // tile_size)
+    column_count = -(-values.shape[1] // tile_size)
+    result = {statistic: np.full((row_count, column_count), np.nan) for statistic in fdp.STATISTICS}
+    for row in range(row_count):
+        for column in range(column_count):
+            tile = values[row * tile_size:(row + 1) * tile_size, column * tile_size:(column + 1) * tile_size]
+            if not np.isnan(tile).all():
+                result['minimum'][row, column] = np.nanmin(tile)
+                result['maximum'][row, column] = np.nanmax(tile)
+                result['mean'][row, column] = np.nanmean(tile)
+    return result
+
+
+class TestFiberDataPyramid(unittest.TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.directory = pathlib.Path(self.temporary_directory.name)
+
+    def build_and_load(self, values, factor, band_rows=None):
+        fdp.build(values, self.directory, factor, band_rows)
+        depths = np.arange(values.shape[0]) * 0.5 + 1520.0
+        dates = np.datetime64('2021-04-12T09:00:00', 'ns') + np.arange(values.shape[1]) * np.timedelta64(1, 's')
+        return fdp.load(values, depths, dates, self.directory, factor)
+
+    def test_level_count(self):
+        for shape, factor, expected in [((1, 1), 4, 0), ((4, 2), 4, 1), ((5, 3), 4, 2), ((1000, 20), 10, 3)]:
+            with self.subTest(f'Levels of {shape} with factor {factor}'):
+                assert_that(fdp.level_count(shape, factor), equal_to(expected))
+
+    def test_build_summarizes_each_tile(self):
+        values = np.random.default_rng(8675309).normal(size=(37, 23))
+        values[[3, 17, 30], [5, 11, 22]] = np.nan
+        values[8:12, 12:16] = np.nan
+        for factor, band_rows in [(2, None), (4, 8), (3, 5)]:
+            with self.subTest(f'Build with factor {factor} reading {band_rows} rows at a time'):
+                sut = self.build_and_load(values, factor, band_rows)
+
+                assert_that(len(sut.levels), equal_to(fdp.level_count(values.shape, factor) + 1))
+                for level in sut.levels[1:]:
+                    expected = expected_tiles(values, level.tile_size)
+                    for statistic in fdp.STATISTICS:
+                        npt.assert_allclose(getattr(level, statistic), expected[statistic])
+
+    def test_level_depths_and_dates_are_those_of_first_row_and_column_of_each_tile(self):
+        sut = self.build_and_load(np.zeros((10, 6)), 4)
+
+        npt.assert_array_equal(sut.levels[1].depths, np.array([1520.0, 1522.0, 1524.0]))
+        npt.assert_array_equal(sut.levels[1].dates, np.array(['2021-04-12T09:00:00', '2021-04-12T09:00:04'],
+                                                             dtype='datetime64[ns]'))
+
+    def test_viewport_returns_finest_level_fitting_viewport(self):
+        values = np.arange(64 * 64, dtype=np.float64).reshape(64, 64)
+        sut = self.build_and_load(values, 2)
+
+        for max_rows, max_columns, expected_level, expected_shape in [(64, 64, 0, (64, 64)),
+                                                                      (40, 64, 1, (32, 32)),
+                                                                      (8, 20, 3, (8, 8)),
+                                                                      (1, 1, 6, (1, 1))]:
+            with self.subTest(f'Viewport of {max_rows} by {max_columns}'):
+                actual = sut.viewport(max_rows, max_columns)
+
+                assert_that(actual.level, equal_to(expected_level))
+                assert_that(actual.shape, equal_to(expected_shape))
+
+    def test_viewport_returns_only_tiles_overlapping_viewport(self):
+        values = np.arange(64 * 64, dtype=np.float64).reshape(64, 64)
+        sut = self.build_and_load(values, 2)
+
+        actual = sut.viewport(4, 4, min_depth=1525.0, max_depth=1530.0,
+                              start_time=np.datetime64('2021-04-12T09:00:10'),
+                              stop_time=np.datetime64('2021-04-12T09:00:12'))
+
+        assert_that(actual.level, equal_to(2))
+        npt.assert_array_equal(actual.depths, np.array([1524.0, 1526.0, 1528.0, 1530.0]))
+        npt.assert_array_equal(actual.mean, expected_tiles(values, 4)['mean'][2:6, 2:4])
+
+    def test_viewport_with_non_positive_size_raises_value_error(self):
+        sut = self.build_and_load(np.zeros((4, 4)), 2)
+
+        assert_that(calling(sut.viewport).with_args(0, 10), raises(ValueError, pattern='positive'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+import unittest.mock
+import uuid
+
+from hamcrest import assert_that, equal_to, is_
+import pandas as pd
+
+from orchid import (
+    base_time_series_adapter as bca,
+    live_time_series as lts,
+)
+
+
+def make_series(values, start_second=0, name='stub'):
+    return pd.Series(data=[float(value) for value in values],
+                     index=pd.date_range(pd.Timestamp('2023-10-05T08:41:17Z') + pd.Timedelta(seconds=start_second),
+                                         periods=len(values), freq='s', unit='ns'),
+                     name=name)
+
+
+def create_stub_time_series(object_id, all_data_points, newer_data_points=None):
+    result = unittest.mock.MagicMock(name='stub_time_series', spec=bca.BaseTimeSeriesAdapter)
+    result.object_id = object_id
+    result.name = 'stub'
+    result.data_points.return_value = all_data_points
+    result.data_points_after.return_value = newer_data_points
+    return result
+
+
+class TestLiveTimeSeriesCache(unittest.TestCase):
+    def test_first_refresh_reads_all_samples(self):
+        sut = lts.LiveTimeSeriesCache()
+        stub_time_series = create_stub_time_series(uuid.uuid4(), make_series([3, 1, 4]))
+
+        actual = sut.refresh(stub_time_series)
+
+        stub_time_series.data_points_after.assert_not_called()
+        assert_that(actual.tolist(), equal_to([3.0, 1.0, 4.0]))
+        assert_that(sut.data_points(stub_time_series).tolist(), equal_to([3.0, 1.0, 4.0]))
+
+    def test_later_refresh_appends_only_samples_after_last_sample(self):
+        object_id = uuid.uuid4()
+        sut = lts.LiveTimeSeriesCache()
+        sut.refresh(create_stub_time_series(object_id, make_series([3, 1, 4])))
+        # Reloading the project creates a new adapter with the same object ID
+        stub_reloaded_time_series = create_stub_time_series(object_id, None, make_series([1, 5], start_second=3))
+
+        actual = sut.refresh(stub_reloaded_time_series)
+
+        stub_reloaded_time_series.data_points.assert_not_called()
+        stub_reloaded_time_series.data_points_after.assert_called_once_with(
+            pd.Timestamp('2023-10-05T08:41:19Z'))
+        assert_that(actual.tolist(), equal_to([1.0, 5.0]))
+        pd.testing.assert_series_equal(sut.data_points(stub_reloaded_time_series),
+                                       make_series([3, 1, 4, 1, 5]))
+
+    def test_refresh_without_newer_samples_leaves_samples_unchanged(self):
+        object_id = uuid.uuid4()
+        sut = lts.LiveTimeSeriesCache()
+        sut.refresh(create_stub_time_series(object_id, make_series([3, 1, 4])))
+
+        actual = sut.refresh(create_stub_time_series(object_id, None, make_series([])))
+
+        assert_that(actual.empty, is_(True))
+        pd.testing.assert_series_equal(sut.data_points(create_stub_time_series(object_id, None)),
+                                       make_series([3, 1, 4]))
+
+    def test_refresh_of_initially_empty_time_series_reads_all_samples(self):
+        object_id = uuid.uuid4()
+        sut = lts.LiveTimeSeriesCache()
+        sut.refresh(create_stub_time_series(object_id, make_series([])))
+
+        actual = sut.refresh(create_stub_time_series(object_id, make_series([2, 7])))
+
+        assert_that(actual.tolist(), equal_to([2.0, 7.0]))
+        assert_that(sut.data_points(create_stub_time_series(object_id, None)).tolist(), equal_to([2.0, 7.0]))
+
+    def test_data_points_of_unknown_time_series_is_empty(self):
+        sut = lts.LiveTimeSeriesCache()
+
+        actual = sut.data_points(create_stub_time_series(uuid.uuid4(), None))
+
+        assert_that(actual.empty, is_(True))
+        assert_that(str(actual.index.dtype), equal_to('datetime64[ns, UTC]'))
+
+    def test_discard_forgets_samples_of_time_series(self):
+        object_id = uuid.uuid4()
+        sut = lts.LiveTimeSeriesCache()
+        sut.refresh(create_stub_time_series(object_id, make_series([3, 1, 4])))
+        sut.discard(create_stub_time_series(object_id, None))
+
+        stub_time_series = create_stub_time_series(object_id, make_series([2, 7]))
+        actual = sut.refresh(stub_time_series)
+
+        stub_time_series.data_points_after.assert_not_called()
+        assert_that(actual.tolist(), equal_to([2.0, 7.0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
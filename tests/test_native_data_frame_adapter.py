@@ -16,6 +16,7 @@ import unittest
 import uuid
 
 from hamcrest import assert_that, equal_to, calling, raises
+import numpy as np
 import pendulum
 
 import pandas as pd
@@ -197,6 +198,33 @@ class TestNativeDataFrameAdapter(unittest.TestCase):
 
         pdt.assert_frame_equal(sut.pandas_data_frame(), pd.DataFrame())
 
+    def test_net_data_frame_without_rows_produces_pandas_data_frame_with_columns(self):
+        sut = _create_sut(_create_pushdown_table_data_dto())
+        sut.dom_object.DataTable.Rows.Clear()
+
+        for columns, expected_columns in [(None, ['pulvis', 'lacus', 'undae']), (['undae'], ['undae'])]:
+            with self.subTest(f'Convert columns {columns} of native data frame without rows'):
+                actual = sut.pandas_data_frame(columns=columns)
+
+                assert_that(list(actual.columns), equal_to(expected_columns))
+                assert_that(len(actual), equal_to(0))
+
+    def test_net_data_frame_without_rows_and_with_no_selected_rows_have_same_columns(self):
+        empty_sut = _create_sut(_create_pushdown_table_data_dto())
+        empty_sut.dom_object.DataTable.Rows.Clear()
+        sut = _create_sut(_create_pushdown_table_data_dto())
+
+        actual = sut.pandas_data_frame(row_filter='[pulvis] > 100')
+
+        assert_that(list(actual.columns), equal_to(list(empty_sut.pandas_data_frame().columns)))
+
+    def test_net_data_frame_without_rows_rejects_unknown_columns(self):
+        sut = _create_sut(_create_pushdown_table_data_dto())
+        sut.dom_object.DataTable.Rows.Clear()
+
+        assert_that(calling(sut.pandas_data_frame).with_args(columns=['ignotus']), raises(KeyError))
+        assert_that(calling(sut.iter_chunks).with_args(columns=['ignotus']), raises(KeyError))
+
     def test_single_cell_net_data_frame_produces_correct_pandas_data_frame(self):
         table_data_dto = tsn.TableDataDto([float], [{'oratio': 57.89}], toolz.identity)
         sut = _create_sut(table_data_dto)
@@ -413,6 +441,28 @@ class TestNativeDataFrameAdapter(unittest.TestCase):
         assert_that(calling(sut.pandas_data_frame).with_args(),
                     raises(dfa.DataFrameAdapterDateTimeOffsetMinValueError, pattern=expect))
 
+    def test_net_data_frame_with_min_date_time_offset_in_later_rows_raises_error_at_table_row(self):
+        time_points = [pendulum.datetime(2022, 6, 3, 11, 44, 6, 203000), pendulum.datetime(2022, 6, 3, 11, 45, 7),
+                       pendulum.datetime(2022, 6, 3, 11, 46, 8), pendulum.DateTime.min,
+                       pendulum.datetime(2022, 6, 3, 11, 48, 10)]
+        table_data_dto = tsn.TableDataDto([int, pendulum.DateTime],
+                                          [{'ordo': ordo, 'prius': time_point}
+                                           for ordo, time_point in enumerate(time_points)],
+                                          toolz.identity)
+        expect = (f'Unexpectedly found `DateTimeOffset.MinValue`'
+                  f' at row, 3, and column, "prius", of Orchid `DataFrame`.')
+        for description, convert in [
+            ('later chunk', lambda sut: list(sut.iter_chunks(chunk_rows=2))),
+            ('filtered chunk', lambda sut: list(sut.iter_chunks(chunk_rows=1, row_filter='[ordo] > 1'))),
+            ('row slice', lambda sut: sut.pandas_data_frame(row_slice=slice(2, None))),
+            ('row filter', lambda sut: sut.pandas_data_frame(row_filter='[ordo] > 1')),
+        ]:
+            with self.subTest(f'Convert {description} reports `DateTimeOffset.MinValue` at table row'):
+                sut = _create_sut(table_data_dto)
+
+                assert_that(calling(convert).with_args(sut),
+                            raises(dfa.DataFrameAdapterDateTimeOffsetMinValueError, pattern=expect))
+
     def test_net_data_frame_with_max_date_time_offset_produces_nat_cell_in_pandas_data_frame(self):
         table_data_dto = tsn.TableDataDto([pendulum.DateTime],
                                           [{'dies': pendulum.DateTime.max}],
@@ -434,6 +484,116 @@ class TestNativeDataFrameAdapter(unittest.TestCase):
         expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
         pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
 
+    def test_net_data_frame_with_guid_column_produces_correct_pandas_data_frame(self):
+        table_data_dto = tsn.TableDataDto([uuid.UUID, int],
+                                          [{'frustra': uuid.UUID('5a0bd4a4-4a4c-4fd4-b6b3-9a8d3c54cbba'), 'tollo': 41},
+                                           {'frustra': None, 'tollo': -7},
+                                           {'frustra': uuid.UUID('c7f3ef61-4e5b-4b5a-8d6c-24b3fb0d0b44'), 'tollo': 18}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_net_data_frame_with_sentinel_and_null_cells_produces_correct_pandas_data_frame(self):
+        table_data_dto = tsn.TableDataDto([pendulum.DateTime, pendulum.Duration],
+                                          [{'dies': pendulum.datetime(2023, 4, 9, 17, 12, 55, 417000),
+                                            'mora': pendulum.duration(minutes=3, seconds=2, microseconds=11)},
+                                           {'dies': pendulum.DateTime.max, 'mora': None},
+                                           {'dies': None, 'mora': pendulum.duration(days=36526)}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+        actual_data_frame = sut.pandas_data_frame()
+
+        expected_data_frame = pd.DataFrame(
+            data={'dies': [pendulum.datetime(2023, 4, 9, 17, 12, 55, 417000), pd.NaT, None],
+                  'mora': [pendulum.duration(minutes=3, seconds=2, microseconds=11), None, pd.NaT]})
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame)
+
+    def test_pandas_data_frame_with_columns_converts_only_those_columns_in_order(self):
+        table_data_dto = _create_pushdown_table_data_dto()
+        sut = _create_sut(table_data_dto)
+
+        actual_data_frame = sut.pandas_data_frame(columns=['lacus', 'pulvis'])
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(actual_data_frame, expected_data_frame[['lacus', 'pulvis']])
+
+    def test_pandas_data_frame_with_unknown_column_raises_key_error(self):
+        sut = _create_sut(_create_pushdown_table_data_dto())
+
+        assert_that(calling(sut.pandas_data_frame).with_args(columns=['pulvis', 'nusquam']),
+                    raises(KeyError, pattern='nusquam'))
+
+    def test_pandas_data_frame_with_row_slice_converts_only_those_rows(self):
+        table_data_dto = _create_pushdown_table_data_dto()
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        for row_slice in [slice(1, 3), slice(None, None, 2), slice(None, None, -1), slice(7, 9)]:
+            with self.subTest(f'Convert rows, {row_slice}'):
+                sut = _create_sut(table_data_dto)
+
+                actual_data_frame = sut.pandas_data_frame(row_slice=row_slice)
+
+                pdt.assert_frame_equal(actual_data_frame, expected_data_frame.iloc[row_slice],
+                                       check_dtype=False, check_column_type=False)
+
+    def test_pandas_data_frame_with_row_filter_converts_only_matching_rows(self):
+        table_data_dto = _create_pushdown_table_data_dto()
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        for row_filter, row_slice, expected_rows in [('[pulvis] > 0', None, [0, 2]),
+                                                     ("[lacus] LIKE 'a*'", None, [1, 3]),
+                                                     ('[pulvis] > 0', slice(1, None), [2])]:
+            with self.subTest(f'Convert rows, {row_slice}, matching "{row_filter}"'):
+                sut = _create_sut(table_data_dto)
+
+                actual_data_frame = sut.pandas_data_frame(row_slice=row_slice, row_filter=row_filter)
+
+                pdt.assert_frame_equal(actual_data_frame, expected_data_frame.loc[expected_rows])
+
+    def test_iter_chunks_yields_chunks_of_at_most_chunk_rows_rows(self):
+        table_data_dto = _create_pushdown_table_data_dto()
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        for chunk_rows, expected_chunk_lengths in [(1, [1, 1, 1, 1]), (3, [3, 1]), (4, [4]), (5, [4])]:
+            with self.subTest(f'Chunks of {chunk_rows} rows'):
+                sut = _create_sut(table_data_dto)
+
+                actual_chunks = list(sut.iter_chunks(chunk_rows=chunk_rows))
+
+                assert_that(list(toolz.map(len, actual_chunks)), equal_to(expected_chunk_lengths))
+                pdt.assert_frame_equal(pd.concat(actual_chunks), expected_data_frame)
+
+    def test_iter_chunks_yields_chunks_with_same_column_types(self):
+        table_data_dto = tsn.TableDataDto([float, int, pendulum.DateTime],
+                                          [{'nix': None, 'ventus': 3, 'hora': None},
+                                           {'nix': None, 'ventus': 11, 'hora': None},
+                                           {'nix': 2.718, 'ventus': None,
+                                            'hora': pendulum.datetime(2022, 6, 3, 11, 44, 6, 203000)}],
+                                          toolz.identity)
+        sut = _create_sut(table_data_dto)
+
+        actual_chunks = list(sut.iter_chunks(chunk_rows=2))
+
+        for actual_chunk in actual_chunks:
+            assert_that(actual_chunk.dtypes.to_dict(),
+                        equal_to({'nix': np.dtype(np.float64), 'ventus': np.dtype(np.float64),
+                                  'hora': pd.DatetimeTZDtype(tz=pendulum.UTC)}))
+        assert_that(np.isnan(actual_chunks[1].at[2, 'ventus']), equal_to(True))
+
+    def test_iter_chunks_with_columns_and_row_filter_yields_only_those_cells(self):
+        table_data_dto = _create_pushdown_table_data_dto()
+        sut = _create_sut(table_data_dto)
+
+        actual_chunks = list(sut.iter_chunks(chunk_rows=1, columns=['undae'], row_filter='[pulvis] < 0'))
+
+        expected_data_frame = _create_expected_data_frame_with_renamed_columns(toolz.identity, table_data_dto)
+        pdt.assert_frame_equal(pd.concat(actual_chunks), expected_data_frame.loc[[1, 3], ['undae']])
+
+    def test_iter_chunks_with_non_positive_chunk_rows_raises_value_error(self):
+        sut = _create_sut(_create_pushdown_table_data_dto())
+
+        assert_that(calling(sut.iter_chunks).with_args(chunk_rows=0), raises(ValueError, pattern='positive'))
+
     def test_potentially_corrupted(self):
         tag = ' (Potentially Corrupted)'
         for name, expected in [
@@ -454,6 +614,15 @@ def _create_sut(table_data_dto):
     return sut
 
 
+def _create_pushdown_table_data_dto():
+    return tsn.TableDataDto([int, str, float],
+                            [{'pulvis': 3, 'lacus': 'tenebrae', 'undae': 18.09},
+                             {'pulvis': -1, 'lacus': 'aestas', 'undae': -4.31},
+                             {'pulvis': 14, 'lacus': 'pruina', 'undae': 77.52},
+                             {'pulvis': -25, 'lacus': 'avis', 'undae': 0.66}],
+                            toolz.identity)
+
+
 def _create_expected_data_frame_with_renamed_columns(rename_column_func, table_data_dto):
     expected_table_data = toolz.pipe(table_data_dto.table_data,
                                      toolz.map(toolz.valmap(date_time_to_integral_milliseconds)),
@@ -0,0 +1,163 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, calling, raises
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pandas.testing as pdt
+
+from orchid import (
+    native_fiber_data as nfd,
+)
+
+# noinspection PyUnresolvedReferences
+from System import Array, DateTime, Double, Nullable
+# noinspection PyUnresolvedReferences
+from System.Collections.Generic import List
+# noinspection PyUnresolvedReferences
+from System.Data import DataTable
+
+
+DEPTHS = [3015.2, 3016.4, 3017.6, 3018.8, 3020.0]
+VALUES = [[0.11, -0.42], [0.07, 1.93], [-2.25, 0.61], [0.98, -0.03], [1.47, 0.36]]
+
+
+def create_net_list(net_item_type, items):
+    result = List[net_item_type]()
+    for item in items:
+        result.Add(item)
+    return result
+
+
+def create_stub_net_fiber_data():
+    def get_data_table(_depth_unit, start_index, end_index):
+        result = DataTable()
+        for column_name in ['Depth', 'T0', 'T1']:
+            result.Columns.Add(column_name, Double)
+        for depth, values in list(zip(DEPTHS, VALUES))[start_index:end_index]:
+            row = result.NewRow()
+            for column_name, value in zip(['Depth', 'T0', 'T1'], [depth] + values):
+                row[column_name] = value
+            result.Rows.Add(row)
+        return result
+
+    result = unittest.mock.MagicMock(name='stub_net_fiber_data')
+    # `Nullable<double>` stands in for the .NET depth measurements; both have a `Value` property.
+    result.Depths = create_net_list(Nullable[Double], [Nullable[Double](depth) for depth in DEPTHS])
+    result.GetDataTable.side_effect = get_data_table
+    return result
+
+
+def expected_data_frame(start_index, end_index):
+    return pd.DataFrame(data=[[depth] + values for depth, values in zip(DEPTHS, VALUES)],
+                        columns=['Depth', 'T0', 'T1']).iloc[start_index:end_index]
+
+
+class TestNativeFiberData(unittest.TestCase):
+    def test_dates_returns_datetime64_array(self):
+        stub_net_fiber_data = create_stub_net_fiber_data()
+        stub_net_fiber_data.Times = create_net_list(DateTime, [DateTime(2024, 3, 9, 14, 27, 33, 517),
+                                                               DateTime(2024, 3, 9, 14, 28, 3, 517)])
+        sut = nfd.NativeFiberData(stub_net_fiber_data)
+
+        npt.assert_array_equal(sut.dates, np.array(['2024-03-09T14:27:33.517', '2024-03-09T14:28:03.517'],
+                                                   dtype='datetime64[ns]'))
+
+    def test_dates_outside_datetime64_range_are_nat(self):
+        stub_net_fiber_data = create_stub_net_fiber_data()
+        stub_net_fiber_data.Times = create_net_list(DateTime, [DateTime.MinValue, DateTime(2024, 3, 9)])
+        sut = nfd.NativeFiberData(stub_net_fiber_data)
+
+        npt.assert_array_equal(sut.dates, np.array(['NaT', '2024-03-09'], dtype='datetime64[ns]'))
+
+    def test_depths_returns_float64_array(self):
+        sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+
+        actual = sut.depths
+
+        assert_that(actual.dtype, equal_to(np.float64))
+        npt.assert_array_equal(actual, np.array(DEPTHS))
+
+    def test_copy_data_set_into_copies_values_in_bands_into_allocated_array(self):
+        stub_net_fiber_data = create_stub_net_fiber_data()
+        net_values = Array.CreateInstance(Double, len(VALUES), len(VALUES[0]))
+        for row, row_values in enumerate(VALUES):
+            for column, value in enumerate(row_values):
+                net_values[row, column] = value
+        stub_net_fiber_data.GetDataSet.return_value = net_values
+        for band_rows in [1, 2, 5, None]:
+            with self.subTest(f'Copy data set in bands of {band_rows} rows'):
+                sut = nfd.NativeFiberData(stub_net_fiber_data)
+                allocate = unittest.mock.MagicMock(name='allocate', side_effect=np.empty)
+
+                actual = sut.copy_data_set_into(allocate, dtype=np.float32, band_rows=band_rows)
+
+                allocate.assert_called_once_with((5, 2), np.dtype(np.float32))
+                assert_that(actual.dtype, equal_to(np.float32))
+                npt.assert_array_equal(actual, np.array(VALUES, dtype=np.float32))
+
+    def test_get_data_table_of_empty_window_keeps_columns(self):
+        sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+
+        actual = sut.get_data_table(len(DEPTHS), len(DEPTHS) + 2)
+
+        assert_that(list(actual.columns), equal_to(['Depth', 'T0', 'T1']))
+        assert_that(len(actual), equal_to(0))
+
+    def test_iter_data_table_yields_windows_of_data_table(self):
+        for chunk_rows, start_index, end_index, expected_window_lengths in [(2, 0, nfd.INT32_MAX, [2, 2, 1]),
+                                                                            (5, 0, nfd.INT32_MAX, [5]),
+                                                                            (2, 1, 4, [2, 1]),
+                                                                            (3, 5, nfd.INT32_MAX, [])]:
+            with self.subTest(f'Windows of {chunk_rows} rows from {start_index} to {end_index}'):
+                sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+
+                actual_windows = list(sut.iter_data_table(chunk_rows, start_index, end_index))
+
+                assert_that([len(window) for window in actual_windows], equal_to(expected_window_lengths))
+                if actual_windows:
+                    pdt.assert_frame_equal(pd.concat(actual_windows), expected_data_frame(start_index, end_index))
+
+    def test_iter_data_table_reports_progress_after_each_window(self):
+        sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+        progress = unittest.mock.MagicMock(name='progress')
+
+        for _ in sut.iter_data_table(chunk_rows=2, progress=progress):
+            pass
+
+        assert_that(progress.call_args_list,
+                    equal_to([unittest.mock.call(2, 5), unittest.mock.call(4, 5), unittest.mock.call(5, 5)]))
+
+    @unittest.mock.patch('orchid.native_fiber_data.net_array.select_as_numpy_array')
+    def test_iter_data_table_does_not_copy_depths(self, stub_select_as_numpy_array):
+        sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+
+        actual_windows = list(sut.iter_data_table(chunk_rows=2))
+
+        assert_that(sum(len(window) for window in actual_windows), equal_to(len(DEPTHS)))
+        stub_select_as_numpy_array.assert_not_called()
+
+    def test_iter_data_table_with_non_positive_chunk_rows_raises_value_error(self):
+        sut = nfd.NativeFiberData(create_stub_net_fiber_data())
+
+        assert_that(calling(sut.iter_data_table).with_args(chunk_rows=0), raises(ValueError, pattern='positive'))
+
+
+if __name__ == '__main__':
+    unittest.main()
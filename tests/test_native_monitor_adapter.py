@@ -13,14 +13,18 @@
 #
 
 import unittest
+import unittest.mock
 import uuid
 
 from hamcrest import assert_that, equal_to
+import pandas as pd
+import pandas.testing as pdt
 import pendulum
 
 from orchid import (
     native_monitor_adapter as nma,
     net_date_time as net_dt,
+    project_store as loader,
 )
 from tests import stub_net as tsn
 
@@ -52,6 +56,27 @@ class TestNativeMonitorAdapter(unittest.TestCase):
         expected_uuid = uuid.UUID(time_series_dto['object_id'])
         assert_that(sut.well_time_series.object_id, equal_to(expected_uuid))
 
+    def test_data_points_in_range_returns_only_samples_in_time_range(self):
+        start = pendulum.datetime(2027, 7, 3, 7, 10, 0)
+        stop = pendulum.datetime(2027, 7, 3, 7, 10, 2)
+        stub_net_monitor = tsn.create_stub_net_monitor(start=start, stop=stop,
+                                                       well_time_series_dto={'name': 'pressio'})
+        unix_time_stamps = [int(start.add(seconds=offset).timestamp()) for offset in range(-2, 5)]
+        stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(
+            (3390.4, 3391.2, 3388.9, 3402.6, 3415.0, 3409.3, 3397.1), unix_time_stamps)
+        sut = nma.NativeMonitorAdapter(stub_net_monitor)
+
+        with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
+                                 spec=loader.as_python_time_series_arrays,
+                                 return_value=stub_python_time_series_arrays_dto):
+            actual = sut.data_points_in_range()
+
+        expected = pd.Series(data=[3388.9, 3402.6, 3415.0],
+                             index=pd.DatetimeIndex(['2027-07-03T07:10:00', '2027-07-03T07:10:01',
+                                                     '2027-07-03T07:10:02'], tz='UTC'),
+                             name='pressio')
+        pdt.assert_series_equal(actual, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
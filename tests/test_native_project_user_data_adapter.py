@@ -21,13 +21,15 @@ import unittest
 import unittest.mock
 import uuid
 
-from hamcrest import assert_that, equal_to, calling, raises
+from hamcrest import assert_that, equal_to, calling, raises, contains_exactly
 import option
 import toolz.curried as toolz
 
 from orchid import (
+    base,
     native_project_user_data_adapter as uda,
     net_stage_qc as nqc,
+    project_context as opc,
 )
 
 from tests import stub_net as tsn
@@ -154,8 +156,124 @@ class TestNativeProjectUserDataAdapter(unittest.TestCase):
                                  '29ee6679-6499-496c-9027-c018013640d6', nqc.CorrectionStatus.CONFIRMED,
                                  nqc.make_start_stop_confirmation_key, lambda v: v.value)
 
+    def test_stage_qc_queries_parse_project_user_data_only_once(self):
+        stage_id = 'b64521bf-56a2-4e9c-abca-d466670c75a1'
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = create_sut(stage_id, qc_notes='in silvam', start_stop_confirmation=nqc.CorrectionStatus.CONFIRMED,
+                         net_project_callable=base.constantly(stub_net_project))
+
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+        sut.stage_start_stop_confirmation(uuid.UUID(stage_id))
+        sut.stage_qc_frame()
+
+        sut.dom_object.ToJson.assert_called_once_with()
+        opc.discard(stub_net_project)
+
+    def test_stage_qc_queries_without_project_parse_project_user_data_each_time(self):
+        stage_id = '0f3e1d6a-8b2c-4e5f-9a7d-6c1b3e8f2a40'
+        sut = create_sut(stage_id, qc_notes='in silvam', start_stop_confirmation=nqc.CorrectionStatus.CONFIRMED)
+
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+        sut.stage_start_stop_confirmation(uuid.UUID(stage_id))
+        sut.stage_qc_frame()
+
+        assert_that(sut.dom_object.ToJson.call_count, equal_to(3))
+
+    def test_stage_qc_frame_of_all_stages_with_qc(self):
+        sut = uda.NativeProjectUserDataAdapter(tsn.ProjectUserDataDto(stages_qc={
+            uuid.UUID(tsn.DONT_CARE_ID_A): {'stage_qc_notes': 'ligna'},
+            uuid.UUID(tsn.DONT_CARE_ID_B): {'stage_start_stop_confirmation': nqc.CorrectionStatus.UNCONFIRMED},
+        }).create_net_stub())
+
+        actual = sut.stage_qc_frame()
+
+        assert_that(actual.index, contains_exactly(uuid.UUID(tsn.DONT_CARE_ID_A), uuid.UUID(tsn.DONT_CARE_ID_B)))
+        assert_that(list(actual['stage_qc_notes']), equal_to(['ligna', '']))
+        assert_that(list(actual['stage_start_stop_confirmation']),
+                    equal_to([nqc.CorrectionStatus.NEW, nqc.CorrectionStatus.UNCONFIRMED]))
+
+    def test_stage_qc_frame_of_requested_stages_has_defaults_for_stages_without_qc(self):
+        sut = create_sut(tsn.DONT_CARE_ID_A, qc_notes='ligna', start_stop_confirmation=nqc.CorrectionStatus.CONFIRMED)
+
+        actual = sut.stage_qc_frame([uuid.UUID(tsn.DONT_CARE_ID_C), uuid.UUID(tsn.DONT_CARE_ID_A)])
+
+        assert_that(actual.index, contains_exactly(uuid.UUID(tsn.DONT_CARE_ID_C), uuid.UUID(tsn.DONT_CARE_ID_A)))
+        assert_that(list(actual['stage_qc_notes']), equal_to(['', 'ligna']))
+        assert_that(list(actual['stage_start_stop_confirmation']),
+                    equal_to([nqc.CorrectionStatus.NEW, nqc.CorrectionStatus.CONFIRMED]))
+
+    def test_set_stage_qc_bulk_sets_all_values_in_single_call_to_mutable(self):
+        sut = create_sut(tsn.DONT_CARE_ID_A)
+        stub_net_mutable_project_user_data = tsn.MutableProjectUserDat().create_net_stub()
+        sut.dom_object.ToMutable = unittest.mock.MagicMock(return_value=stub_net_mutable_project_user_data)
+
+        sut.set_stage_qc_bulk({
+            uuid.UUID(tsn.DONT_CARE_ID_A): {nqc.StageQCTags.QC_NOTES: 'cave canem',
+                                            nqc.StageQCTags.START_STOP_CONFIRMATION: nqc.CorrectionStatus.CONFIRMED},
+            uuid.UUID(tsn.DONT_CARE_ID_B): {'stage_start_stop_confirmation': nqc.CorrectionStatus.UNCONFIRMED},
+        })
+
+        assert_single_call_to_mutable(sut)
+        actual = [(key, variant.GetValue[str]())
+                  for key, variant in toolz.map(lambda c: c.args,
+                                                stub_net_mutable_project_user_data.SetValue.call_args_list)]
+        assert_that(actual, contains_exactly(
+            (nqc.make_qc_notes_key(tsn.DONT_CARE_ID_A), 'cave canem'),
+            (nqc.make_start_stop_confirmation_key(tsn.DONT_CARE_ID_A), 'Confirmed'),
+            (nqc.make_start_stop_confirmation_key(tsn.DONT_CARE_ID_B), 'Unconfirmed')))
+
+    def test_set_stage_qc_bulk_with_invalid_change_changes_nothing(self):
+        sut = create_sut(tsn.DONT_CARE_ID_A)
+        sut.dom_object.ToMutable = unittest.mock.MagicMock()
+
+        assert_that(calling(sut.set_stage_qc_bulk).with_args({
+            uuid.UUID(tsn.DONT_CARE_ID_A): {nqc.StageQCTags.QC_NOTES: 'cave canem'},
+            uuid.UUID(tsn.DONT_CARE_ID_B): {nqc.StageQCTags.START_STOP_CONFIRMATION: 'Perhaps'},
+        }), raises(ValueError))
+        sut.dom_object.ToMutable.assert_not_called()
+
+    def test_set_stage_qc_notes_parses_project_user_data_again(self):
+        stage_id = '35e4a85b-7b4e-44f6-9484-7286d575d22a'
+        sut = create_sut(stage_id, qc_notes='ante')
+        sut.dom_object.ToMutable = unittest.mock.MagicMock(
+            return_value=tsn.MutableProjectUserDat().create_net_stub())
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        sut.set_stage_qc_notes(uuid.UUID(stage_id), 'post')
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        assert_that(sut.dom_object.ToJson.call_count, equal_to(2))
+
+    def test_stage_qc_queries_parse_project_user_data_again_after_project_changed(self):
+        stage_id = '4b1d5a2c-9a4c-4c0e-8a3e-57c3e0f4f2a1'
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = create_sut(stage_id, qc_notes='ante', net_project_callable=base.constantly(stub_net_project))
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        opc.invalidate(stub_net_project)
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        assert_that(sut.dom_object.ToJson.call_count, equal_to(2))
+        opc.discard(stub_net_project)
+
+    def test_set_stage_qc_bulk_makes_other_adapters_of_project_parse_project_user_data_again(self):
+        stage_id = 'a3f1e0c4-2d6b-4f7e-9b1a-0c8d4e2f6a7b'
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        sut = create_sut(stage_id, qc_notes='ante', net_project_callable=base.constantly(stub_net_project))
+        other = uda.NativeProjectUserDataAdapter(sut.dom_object, base.constantly(stub_net_project))
+        other.dom_object.ToMutable = unittest.mock.MagicMock(
+            return_value=tsn.MutableProjectUserDat().create_net_stub())
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        other.set_stage_qc_notes(uuid.UUID(stage_id), 'post')
+        sut.stage_qc_notes(uuid.UUID(stage_id))
+
+        assert_that(sut.dom_object.ToJson.call_count, equal_to(2))
+        opc.discard(stub_net_project)
+
 
-def create_sut(stage_id_text: str, qc_notes=None, start_stop_confirmation=None, to_json=None):
+def create_sut(stage_id_text: str, qc_notes=None, start_stop_confirmation=None, to_json=None,
+               net_project_callable=None):
     stage_id = uuid.UUID(stage_id_text)
     maybe_qc_notes = option.maybe(qc_notes)
     maybe_confirmation = option.maybe(start_stop_confirmation)
@@ -175,7 +293,7 @@ def create_sut(stage_id_text: str, qc_notes=None, start_stop_confirmation=None,
     elif not stages_qc and to_json:
         stub_project_user_data = tsn.ProjectUserDataDto(to_json=to_json)
 
-    result = uda.NativeProjectUserDataAdapter(stub_project_user_data.create_net_stub())
+    result = uda.NativeProjectUserDataAdapter(stub_project_user_data.create_net_stub(), net_project_callable)
     return result
 
 
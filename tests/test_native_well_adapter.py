@@ -24,17 +24,21 @@ from hamcrest import (
     equal_to,
     instance_of,
     is_,
+    is_not,
     empty,
     contains_exactly,
+    same_instance,
 )
-import toolz.curried as toolz
+import pandas as pd
 import pendulum as pdt
+import toolz.curried as toolz
 
 from orchid import (
     measurement as om,
     native_stage_adapter as nsa,
     native_trajectory_adapter as nta,
     native_well_adapter as nwa,
+    project_context as opc,
     reference_origins as origins,
     unit_system as units,
 )
@@ -113,6 +117,17 @@ class TestNativeWellAdapter(unittest.TestCase):
                 assert_that(sut.stages().all_object_ids(), contains_exactly(*expected_object_ids))
                 assert_that(sut.stages().all_names(), contains_exactly(*expected_names))
 
+    def test_stages_returns_same_collection_until_project_changed(self):
+        stage_dtos = ({'object_id': tsn.DONT_CARE_ID_A, 'name': 'romanorm', 'display_name': ''},)
+        stub_native_well = tsn.WellDto(stage_dtos=stage_dtos).create_net_stub()
+        sut = nwa.NativeWellAdapter(stub_native_well)
+
+        before_change = sut.stages()
+        assert_that(sut.stages(), same_instance(before_change))
+
+        opc.invalidate(stub_native_well.Project)
+        assert_that(sut.stages(), is_not(same_instance(before_change)))
+
     def test_trajectory(self):
         stub_native_well = unittest.mock.MagicMock(name='stub_native_well')
         stub_trajectory = unittest.mock.MagicMock(name='stub_native_trajectory')
@@ -367,6 +382,16 @@ class TestNativeWellAdapterAddStages(unittest.TestCase):
         sut._create_net_stages.assert_called_once_with([created_stage])
         stub_net_mutable_well.AddStages.assert_called_once_with(created_net_stages)
 
+    @unittest.mock.patch('orchid.dot_net_dom_access.opc.invalidate')
+    def test_add_stages_invalidates_project_context(self, mock_invalidate):
+        stub_net_well = tsn.WellDto().create_net_stub()
+        stub_net_well.ToMutable.return_value = tsn.MutableWellDto().create_net_stub()
+        sut = nwa.NativeWellAdapter(stub_net_well)
+
+        sut.add_stages([])
+
+        mock_invalidate.assert_called_once_with(stub_net_well.Project)
+
     @unittest.mock.patch('orchid.native_stage_adapter.CreateStageDto.create_stage')
     @unittest.mock.patch('orchid.native_well_adapter.NativeWellAdapter._create_net_stages')
     def test_add_stages_with_many_items_calls_both_create_stage_add_well_add_stages_many(self,
@@ -423,6 +448,31 @@ class TestNativeWellAdapterAddStages(unittest.TestCase):
         sut._create_net_stages.assert_called_once_with(created_stages)
         stub_net_mutable_well.AddStages.assert_called_once_with(created_net_stages)
 
+    @unittest.mock.patch('orchid.native_stage_adapter.create_stages_from_frame')
+    @unittest.mock.patch('orchid.native_well_adapter.NativeWellAdapter._create_net_stages')
+    def test_add_stages_from_frame_adds_all_created_stages_to_well_once(self, stub_create_net_stages,
+                                                                        stub_create_stages_from_frame):
+        created_net_stages = [tsn.StageDto().create_net_stub() for _ in range(3)]
+        created_stages = [nsa.NativeStageAdapter(created_net_stage)
+                          for created_net_stage in created_net_stages]
+        stub_create_stages_from_frame.return_value = created_stages
+        stub_create_net_stages.return_value = created_net_stages
+
+        stub_net_well = tsn.WellDto().create_net_stub()
+        stub_net_mutable_well = tsn.MutableWellDto().create_net_stub()
+        stub_net_well.ToMutable.return_value = stub_net_mutable_well
+        sut = nwa.NativeWellAdapter(stub_net_well)
+
+        dont_care_stages_frame = pd.DataFrame({'stage_no': [9, 27, 47]})
+        sut.add_stages_from_frame(dont_care_stages_frame, in_length_unit=units.UsOilfield.LENGTH)
+
+        stub_create_stages_from_frame.assert_called_once_with(sut, dont_care_stages_frame,
+                                                              in_length_unit=units.UsOilfield.LENGTH,
+                                                              in_pressure_unit=None)
+        # noinspection PyUnresolvedReferences
+        sut._create_net_stages.assert_called_once_with(created_stages)
+        stub_net_mutable_well.AddStages.assert_called_once_with(created_net_stages)
+
 
 if __name__ == '__main__':
     unittest.main()
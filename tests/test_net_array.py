@@ -0,0 +1,113 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import unittest
+
+from hamcrest import assert_that, equal_to, calling, raises
+import numpy as np
+import numpy.testing as npt
+
+from orchid import (
+    net_array,
+)
+
+# noinspection PyUnresolvedReferences
+from System import Array, Boolean, DateTime, Double, Int32, Int64, TimeSpan
+# noinspection PyUnresolvedReferences
+from System.Collections import ArrayList
+# noinspection PyUnresolvedReferences
+from System.Collections.Generic import List
+
+
+def create_net_array(net_element_type, items):
+    items = np.asarray(items)
+    result = Array.CreateInstance(net_element_type, *items.shape)
+    for index in np.ndindex(items.shape):
+        result[index if len(index) > 1 else index[0]] = items[index].item()
+    return result
+
+
+class TestNetArray(unittest.TestCase):
+    def test_as_numpy_array_copies_all_items(self):
+        for net_element_type, dtype, items in [
+            (Double, np.float64, [-3.47, 0.0, 76.88, np.nan]),
+            (Int32, np.int32, [18, -2147483648, 2147483647]),
+            (Int64, np.int64, [-9223372036854775807, 0, 41]),
+            (Boolean, np.bool_, [True, False, False, True]),
+            (Double, np.float64, [[2.71, -1.25, 7.0], [3.14, 0.5, -4.4]]),
+        ]:
+            with self.subTest(f'Copy .NET {net_element_type} array of {items}'):
+                actual = net_array.as_numpy_array(create_net_array(net_element_type, items), dtype)
+
+                npt.assert_array_equal(actual, np.asarray(items, dtype=dtype))
+                assert_that(actual.dtype, equal_to(np.dtype(dtype)))
+
+    def test_as_numpy_array_of_empty_net_array_is_empty(self):
+        actual = net_array.as_numpy_array(Array.CreateInstance(Double, 0, 3), np.float64)
+
+        assert_that(actual.shape, equal_to((0, 3)))
+
+    def test_as_numpy_array_with_result_dtype_converts_items(self):
+        items = [[0.1, -2.5], [1e-3, 1234.5678]]
+
+        actual = net_array.as_numpy_array(create_net_array(Double, items), np.float64, np.float32)
+
+        npt.assert_array_equal(actual, np.asarray(items, dtype=np.float32))
+        assert_that(actual.dtype, equal_to(np.dtype(np.float32)))
+
+    def test_slice_as_numpy_array_copies_only_items_of_slice(self):
+        net_items = create_net_array(Double, [8.25, -0.5, 13.75, 2.0, -6.125])
+        for start, stop, expected in [(1, 4, [-0.5, 13.75, 2.0]),
+                                      (0, 5, [8.25, -0.5, 13.75, 2.0, -6.125]),
+                                      (3, 9, [2.0, -6.125]),
+                                      (4, 2, [])]:
+            with self.subTest(f'Copy .NET array items from {start} to {stop}'):
+                actual = net_array.slice_as_numpy_array(net_items, start, stop, np.float64)
+
+                npt.assert_array_equal(actual, np.array(expected, dtype=np.float64))
+
+    def test_as_net_array_copies_all_items(self):
+        items = np.array([7, -13, 0, 2147483647], dtype=np.int32)
+
+        actual = net_array.as_net_array(items, Int32)
+
+        assert_that(list(actual), equal_to([7, -13, 0, 2147483647]))
+
+    def test_select_as_numpy_array_copies_property_of_each_item(self):
+        net_items = List[TimeSpan]()
+        for seconds in [0.5, -12.25, 3600.0]:
+            net_items.Add(TimeSpan.FromSeconds(seconds))
+
+        actual = net_array.select_as_numpy_array(net_items, 'TotalSeconds', Double, np.float64)
+
+        npt.assert_array_equal(actual, np.array([0.5, -12.25, 3600.0]))
+
+    def test_select_as_numpy_array_from_net_array_converts_property(self):
+        net_items = Array[DateTime]([DateTime(2023, 11, 4), DateTime(2023, 11, 5)])
+
+        actual = net_array.select_as_numpy_array(net_items, 'Day', Int64, np.int64)
+
+        npt.assert_array_equal(actual, np.array([4, 5], dtype=np.int64))
+
+    def test_select_as_numpy_array_from_non_generic_enumerable_raises_type_error(self):
+        net_items = ArrayList()
+        net_items.Add(DateTime(2023, 11, 4))
+
+        assert_that(calling(net_array.select_as_numpy_array).with_args(net_items, 'Day', Int64, np.int64),
+                    raises(TypeError, pattern='IEnumerable<T>'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, same_instance, is_not, calling, raises
+import numpy as np
+import pandas as pd
+
+from orchid import (
+    project_context as opc,
+)
+
+
+def make_series(sample_count, name='stub'):
+    return pd.Series(data=np.arange(sample_count, dtype=np.float64),
+                     index=pd.date_range('2024-02-29T22:15:00', periods=sample_count, freq='s', tz='UTC'),
+                     name=name)
+
+
+def series_bytes(sample_count):
+    return int(make_series(sample_count).memory_usage(index=True, deep=False))
+
+
+class StubAdapter:
+    def __init__(self, net_project_object):
+        self.dom_object = net_project_object
+
+
+class OtherStubAdapter(StubAdapter):
+    pass
+
+
+class TestTimeSeriesCache(unittest.TestCase):
+    def test_get_or_add_reads_series_only_on_miss(self):
+        sut = opc.TimeSeriesCache()
+        read_series = unittest.mock.MagicMock(name='read_series', return_value=make_series(10))
+
+        sut.get_or_add('ventus', read_series)
+        actual = sut.get_or_add('ventus', read_series)
+
+        read_series.assert_called_once_with()
+        assert_that(actual.tolist(), equal_to(list(range(10))))
+        assert_that(sut.statistics(), equal_to(opc.CacheStatistics(hits=1, misses=1, evictions=0, entries=1,
+                                                                   size_bytes=series_bytes(10),
+                                                                   max_bytes=opc.DEFAULT_TIME_SERIES_CACHE_BYTES)))
+
+    def test_get_or_add_returns_copy_of_cached_series(self):
+        sut = opc.TimeSeriesCache()
+        first = sut.get_or_add('ventus', lambda: make_series(3))
+        first.iloc[0] = -1.0
+
+        actual = sut.get_or_add('ventus', lambda: make_series(3))
+
+        assert_that(actual, is_not(same_instance(first)))
+        assert_that(actual.iloc[0], equal_to(0.0))
+
+    def test_get_or_add_evicts_least_recently_used_series_when_over_budget(self):
+        sut = opc.TimeSeriesCache(max_bytes=2 * series_bytes(10))
+        sut.get_or_add('prima', lambda: make_series(10))
+        sut.get_or_add('secunda', lambda: make_series(10))
+        sut.get_or_add('prima', lambda: make_series(10))
+        sut.get_or_add('tertia', lambda: make_series(10))
+
+        read_secunda = unittest.mock.MagicMock(name='read_secunda', return_value=make_series(10))
+        read_prima = unittest.mock.MagicMock(name='read_prima', return_value=make_series(10))
+        sut.get_or_add('prima', read_prima)
+        sut.get_or_add('secunda', read_secunda)
+
+        read_prima.assert_not_called()
+        read_secunda.assert_called_once_with()
+        assert_that(sut.statistics().evictions, equal_to(2))
+
+    def test_get_or_add_does_not_cache_series_larger_than_budget(self):
+        sut = opc.TimeSeriesCache(max_bytes=series_bytes(10) - 1)
+
+        sut.get_or_add('magna', lambda: make_series(10))
+
+        assert_that(sut.statistics().entries, equal_to(0))
+
+    def test_set_max_bytes_evicts_series(self):
+        sut = opc.TimeSeriesCache()
+        sut.get_or_add('prima', lambda: make_series(10))
+        sut.get_or_add('secunda', lambda: make_series(10))
+
+        sut.max_bytes = series_bytes(10)
+
+        assert_that(sut.statistics().entries, equal_to(1))
+        assert_that(sut.statistics().size_bytes, equal_to(series_bytes(10)))
+
+    def test_set_negative_max_bytes_raises_value_error(self):
+        sut = opc.TimeSeriesCache()
+
+        assert_that(calling(setattr).with_args(sut, 'max_bytes', -1), raises(ValueError))
+
+    def test_clear_removes_all_series(self):
+        sut = opc.TimeSeriesCache()
+        sut.get_or_add('prima', lambda: make_series(10))
+
+        sut.clear()
+
+        assert_that(sut.statistics().entries, equal_to(0))
+        assert_that(sut.statistics().size_bytes, equal_to(0))
+
+
+class TestAdapterIdentityMap(unittest.TestCase):
+    def test_get_or_add_returns_same_adapter_for_same_object_id(self):
+        sut = opc.AdapterIdentityMap()
+        stub_net_project_object = unittest.mock.MagicMock(name='stub_net_project_object')
+
+        first = sut.get_or_add(StubAdapter, 'ecce', stub_net_project_object)
+        second = sut.get_or_add(StubAdapter, 'ecce', stub_net_project_object)
+
+        assert_that(second, same_instance(first))
+
+    def test_get_or_add_returns_different_adapters_for_different_object_ids(self):
+        sut = opc.AdapterIdentityMap()
+
+        first = sut.get_or_add(StubAdapter, 'ecce', unittest.mock.MagicMock(name='stub_net_project_object_a'))
+        second = sut.get_or_add(StubAdapter, 'homo', unittest.mock.MagicMock(name='stub_net_project_object_b'))
+
+        assert_that(second, is_not(same_instance(first)))
+
+    def test_get_or_add_returns_different_adapters_for_different_make_adapters(self):
+        sut = opc.AdapterIdentityMap()
+        stub_net_project_object = unittest.mock.MagicMock(name='stub_net_project_object')
+
+        first = sut.get_or_add(StubAdapter, 'ecce', stub_net_project_object)
+        second = sut.get_or_add(OtherStubAdapter, 'ecce', stub_net_project_object)
+
+        assert_that(second, is_not(same_instance(first)))
+
+    def test_map_does_not_keep_unused_adapters_alive(self):
+        sut = opc.AdapterIdentityMap()
+        sut.get_or_add(StubAdapter, 'ecce', unittest.mock.MagicMock(name='stub_net_project_object'))
+
+        assert_that(len(sut), equal_to(0))
+
+    def test_clear_removes_all_adapters(self):
+        sut = opc.AdapterIdentityMap()
+        adapter = sut.get_or_add(StubAdapter, 'ecce', unittest.mock.MagicMock(name='stub_net_project_object'))
+
+        sut.clear()
+
+        assert_that(sut.get_or_add(StubAdapter, 'ecce', adapter.dom_object), is_not(same_instance(adapter)))
+
+
+class TestProjectContext(unittest.TestCase):
+    def test_context_for_same_project_returns_same_context(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+
+        assert_that(opc.context_for(stub_net_project), same_instance(opc.context_for(stub_net_project)))
+
+    def test_context_for_different_projects_returns_different_contexts(self):
+        assert_that(opc.context_for(unittest.mock.MagicMock(name='stub_net_project_a')),
+                    is_not(same_instance(opc.context_for(unittest.mock.MagicMock(name='stub_net_project_b')))))
+
+    def test_invalidate_clears_time_series_cache(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        opc.context_for(stub_net_project).time_series_cache.get_or_add('ventus', lambda: make_series(3))
+
+        opc.invalidate(stub_net_project)
+
+        assert_that(opc.context_for(stub_net_project).time_series_cache.statistics().entries, equal_to(0))
+
+    def test_project_value_calculates_value_only_once(self):
+        sut = opc.ProjectContext()
+        calculate = unittest.mock.MagicMock(name='calculate', return_value=1.0)
+
+        sut.project_value('fluid_density', calculate)
+        actual = sut.project_value('fluid_density', calculate)
+
+        calculate.assert_called_once_with()
+        assert_that(actual, equal_to(1.0))
+
+    def test_project_value_does_not_cache_failed_calculation(self):
+        sut = opc.ProjectContext()
+        calculate = unittest.mock.MagicMock(name='calculate', side_effect=[ValueError('ignotus'), 'Metric'])
+
+        assert_that(calling(sut.project_value).with_args('project_units', calculate), raises(ValueError))
+        assert_that(sut.project_value('project_units', calculate), equal_to('Metric'))
+
+    def test_invalidate_clears_project_values(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        opc.context_for(stub_net_project).project_value('azimuth', lambda: 30.0)
+
+        opc.invalidate(stub_net_project)
+        actual = opc.context_for(stub_net_project).project_value('azimuth', lambda: 45.0)
+
+        assert_that(actual, equal_to(45.0))
+
+    def test_invalidate_retains_adapters(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        stub_net_project_object = unittest.mock.MagicMock(name='stub_net_project_object')
+        adapter = opc.context_for(stub_net_project).adapters.get_or_add(StubAdapter, 'ecce', stub_net_project_object)
+
+        opc.invalidate(stub_net_project)
+        actual = opc.context_for(stub_net_project).adapters.get_or_add(StubAdapter, 'ecce', stub_net_project_object)
+
+        assert_that(actual, same_instance(adapter))
+
+    def test_invalidate_changes_generation(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        before_change = opc.context_for(stub_net_project).generation
+
+        opc.invalidate(stub_net_project)
+
+        assert_that(opc.context_for(stub_net_project).generation, is_not(equal_to(before_change)))
+
+    def test_context_created_again_has_new_generation(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        discarded_generation = opc.context_for(stub_net_project).generation
+
+        opc.discard(stub_net_project)
+
+        assert_that(opc.context_for(stub_net_project).generation, is_not(equal_to(discarded_generation)))
+
+    def test_discard_removes_context(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        opc.context_for(stub_net_project)
+
+        opc.discard(stub_net_project)
+
+        assert_that(opc.maybe_context_for(stub_net_project), equal_to(None))
+
+    def test_context_for_retains_only_most_recently_used_contexts(self):
+        stub_net_projects = [unittest.mock.MagicMock(name=f'stub_net_project_{i}')
+                             for i in range(opc.MAX_PROJECT_CONTEXTS + 1)]
+        for stub_net_project in stub_net_projects:
+            opc.context_for(stub_net_project)
+
+        assert_that(opc.maybe_context_for(stub_net_projects[0]), equal_to(None))
+        assert_that(opc.maybe_context_for(stub_net_projects[-1]), is_not(equal_to(None)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, is_, calling, raises
+
+from orchid import (
+    core,
+    script_adapter_context as sac,
+)
+
+
+@unittest.mock.patch('orchid.script_adapter_context.ScriptAdapter', name='stub_script_adapter')
+class TestScriptAdapterContext(unittest.TestCase):
+    def test_single_context_initializes_and_shuts_down_script_adapter(self, stub_script_adapter):
+        with sac.ScriptAdapterContext():
+            assert_that(sac.is_session_active(), is_(True))
+
+        stub_script_adapter.Init.assert_called_once_with()
+        stub_script_adapter.Shutdown.assert_called_once_with()
+        assert_that(sac.is_session_active(), is_(False))
+
+    def test_nested_contexts_initialize_script_adapter_once(self, stub_script_adapter):
+        with sac.ScriptAdapterContext():
+            with sac.ScriptAdapterContext():
+                with sac.ScriptAdapterContext():
+                    pass
+            stub_script_adapter.Shutdown.assert_not_called()
+
+        stub_script_adapter.Init.assert_called_once_with()
+        stub_script_adapter.Shutdown.assert_called_once_with()
+
+    def test_repeated_contexts_in_session_initialize_script_adapter_once(self, stub_script_adapter):
+        with core.session():
+            for _ in range(300):
+                with sac.ScriptAdapterContext():
+                    pass
+
+        assert_that(stub_script_adapter.Init.call_count, equal_to(1))
+        assert_that(stub_script_adapter.Shutdown.call_count, equal_to(1))
+
+    def test_context_shuts_down_script_adapter_if_exception_raised(self, stub_script_adapter):
+        def raise_in_context():
+            with sac.ScriptAdapterContext():
+                raise ValueError('obruo')
+
+        assert_that(calling(raise_in_context), raises(ValueError, pattern='obruo'))
+        stub_script_adapter.Shutdown.assert_called_once_with()
+        assert_that(sac.is_session_active(), is_(False))
+
+    def test_failed_initialization_does_not_start_session(self, stub_script_adapter):
+        stub_script_adapter.Init.side_effect = RuntimeError('defectus')
+
+        def enter_context():
+            with sac.ScriptAdapterContext():
+                pass
+
+        assert_that(calling(enter_context), raises(RuntimeError, pattern='defectus'))
+        stub_script_adapter.Shutdown.assert_not_called()
+        assert_that(sac.is_session_active(), is_(False))
+
+
+if __name__ == '__main__':
+    unittest.main()
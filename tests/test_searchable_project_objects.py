@@ -13,9 +13,10 @@
 #
 
 import unittest
+import unittest.mock
 import uuid
 
-from hamcrest import assert_that, equal_to, contains_exactly, is_, none
+from hamcrest import assert_that, equal_to, contains_exactly, is_, is_not, none
 import toolz.curried as toolz
 
 from orchid import (
@@ -215,6 +216,87 @@ class TestSearchableProjectObjects(unittest.TestCase):
                     lambda df: df.name, sut.find_by_name(name_to_find)))
                 assert_that(matching_data_frame_names, equal_to([expected_name]))
 
+    def test_many_find_by_name_searches_read_each_name_once(self):
+        names = ['natura', 'pluvia', 'natura']
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id)
+                                    for object_id in [tsn.DONT_CARE_ID_A, tsn.DONT_CARE_ID_B, tsn.DONT_CARE_ID_C]]
+        stub_name_properties = [unittest.mock.PropertyMock(return_value=name) for name in names]
+        for stub_net_project_object, stub_name_property in zip(stub_net_project_objects, stub_name_properties):
+            type(stub_net_project_object).Name = stub_name_property
+        sut = create_sut(stub_net_project_objects)
+
+        for name_to_find, match_count in [('natura', 2), ('pluvia', 1), ('nix', 0), ('natura', 2)]:
+            assert_that(len(list(sut.find_by_name(name_to_find))), equal_to(match_count))
+
+        for stub_name_property in stub_name_properties:
+            assert_that(stub_name_property.call_count, equal_to(1))
+
+    def test_lazy_construction_creates_no_adapters(self):
+        stub_make_adapter = unittest.mock.MagicMock(name='stub_make_adapter', side_effect=dpo.DomProjectObject)
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id, name=name)
+                                    for object_id, name in [(tsn.DONT_CARE_ID_A, 'capio'),
+                                                            (tsn.DONT_CARE_ID_B, 'fugio')]]
+        spo.SearchableProjectObjects(stub_make_adapter, stub_net_project_objects, lazy=True)
+
+        stub_make_adapter.assert_not_called()
+
+    def test_lazy_find_by_name_only_creates_adapters_for_matches(self):
+        stub_make_adapter = unittest.mock.MagicMock(name='stub_make_adapter', side_effect=dpo.DomProjectObject)
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id, name=name)
+                                    for object_id, name in [(tsn.DONT_CARE_ID_A, 'capio'),
+                                                            (tsn.DONT_CARE_ID_B, 'fugio'),
+                                                            (tsn.DONT_CARE_ID_C, 'facio')]]
+        sut = spo.SearchableProjectObjects(stub_make_adapter, stub_net_project_objects, lazy=True)
+
+        actual = list(sut.find_by_name('fugio'))
+
+        assert_that(list(toolz.map(lambda po: po.name, actual)), equal_to(['fugio']))
+        stub_make_adapter.assert_called_once_with(stub_net_project_objects[1])
+
+    def test_lazy_collection_creates_single_adapter_for_each_project_object(self):
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id, name=name)
+                                    for object_id, name in [(tsn.DONT_CARE_ID_A, 'capio'),
+                                                            (tsn.DONT_CARE_ID_B, 'fugio')]]
+        sut = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=True)
+
+        found = toolz.first(sut.find_by_name('capio'))
+
+        assert_that(sut.find_by_object_id(uuid.UUID(tsn.DONT_CARE_ID_A)), is_(found))
+
+    def test_collections_of_same_project_share_adapters(self):
+        stub_net_project = unittest.mock.MagicMock(name='stub_net_project')
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id, name=name)
+                                    for object_id, name in [(tsn.DONT_CARE_ID_A, 'capio'),
+                                                            (tsn.DONT_CARE_ID_B, 'fugio')]]
+        first = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=True,
+                                             net_project=stub_net_project)
+        second = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=True,
+                                              net_project=stub_net_project)
+
+        assert_that(second.find_by_object_id(uuid.UUID(tsn.DONT_CARE_ID_B)),
+                    is_(first.find_by_object_id(uuid.UUID(tsn.DONT_CARE_ID_B))))
+
+    def test_collections_without_project_do_not_share_adapters(self):
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=tsn.DONT_CARE_ID_A, name='capio')]
+        first = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=True)
+        second = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=True)
+
+        assert_that(second.find_by_object_id(uuid.UUID(tsn.DONT_CARE_ID_A)),
+                    is_not(first.find_by_object_id(uuid.UUID(tsn.DONT_CARE_ID_A))))
+
+    def test_find_by_dom_predicate_returns_project_objects_whose_dom_object_matches(self):
+        stub_net_project_objects = [tsn.create_stub_net_project_object(object_id=object_id, name=name)
+                                    for object_id, name in [(tsn.DONT_CARE_ID_A, 'Demo_1H'),
+                                                            (tsn.DONT_CARE_ID_B, 'Demo_2H'),
+                                                            (tsn.DONT_CARE_ID_C, 'Alius_1H')]]
+        for lazy in [True, False]:
+            with self.subTest(f'Find by .NET DOM predicate in {"lazy" if lazy else "eager"} collection'):
+                sut = spo.SearchableProjectObjects(dpo.DomProjectObject, stub_net_project_objects, lazy=lazy)
+
+                actual = sut.find_by_dom_predicate(lambda npo: npo.Name.startswith('Demo'))
+
+                assert_that(list(toolz.map(lambda po: po.name, actual)), contains_exactly('Demo_1H', 'Demo_2H'))
+
     def test_find_by_object_id_with_match_returns_project_object_with_object_id(self):
         net_project_object_dtos = ({'object_id': '78999fda-2998-42cb-98df-13a064b3c16f'},
                                    {'object_id': '1185f8ed-2dbb-4cb9-8614-95d2eda6f02b'},
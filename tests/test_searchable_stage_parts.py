@@ -32,7 +32,7 @@ from tests import stub_net as tsn
 #
 # I have chosen *not* to test neither the method `find_by_display_name_with_well` nor the method
 # `find_by_display_name_without_well` because the implementation of these methods simply delegate to
-# `SearchableProjectObject.find()` with no additional logic.
+# `SearchableProjectObject._find_by_index()` with no additional logic.
 class TestSearchableStageParts(unittest.TestCase):
     def test_canary(self):
         self.assertEqual(2 + 2, 4)
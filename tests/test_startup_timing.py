@@ -0,0 +1,62 @@
+#
+# This file is part of Orchid and related technologies.
+#
+# Copyright (c) 2017-2025 KAPPA.  All Rights Reserved.
+#
+# LEGAL NOTICE:
+# Orchid contains trade secrets and otherwise confidential information
+# owned by KAPPA. Access to and use of this information is
+# strictly limited and controlled by the Company. This file may not be copied,
+# distributed, or otherwise disclosed outside of the Company's facilities 
+# except under appropriate precautions to maintain the confidentiality hereof, 
+# and may not be used in any way not expressly authorized by the Company.
+#
+
+import unittest
+import unittest.mock
+
+from hamcrest import assert_that, equal_to, contains_string, close_to
+
+from orchid import startup_timing
+
+
+class TestStartupTiming(unittest.TestCase):
+    def setUp(self):
+        startup_timing.clear()
+
+    def tearDown(self):
+        startup_timing.clear()
+
+    @unittest.mock.patch('orchid.startup_timing.time.perf_counter', side_effect=[10.0, 10.25, 11.0, 11.5])
+    def test_timed_accumulates_time_spent_in_phase(self, _):
+        with startup_timing.timed('resolve_configuration'):
+            pass
+        with startup_timing.timed('resolve_configuration'):
+            pass
+
+        assert_that(startup_timing.breakdown()['resolve_configuration'], close_to(0.75, 1e-9))
+
+    @unittest.mock.patch('orchid.startup_timing.time.perf_counter', side_effect=[10.0, 10.5])
+    def test_timed_records_time_if_exception_raised(self, _):
+        with self.assertRaises(ValueError):
+            with startup_timing.timed('load_runtime'):
+                raise ValueError('abruptus')
+
+        assert_that(startup_timing.breakdown(), equal_to({'load_runtime': 0.5}))
+
+    @unittest.mock.patch('orchid.startup_timing.time.perf_counter', side_effect=[1.0, 1.0125, 2.0, 2.5])
+    def test_report_contains_line_for_each_phase(self, _):
+        with startup_timing.timed('resolve_configuration'):
+            pass
+        with startup_timing.timed('prepare_imports'):
+            pass
+
+        actual = startup_timing.report()
+
+        assert_that(actual.splitlines()[0], contains_string('resolve_configuration'))
+        assert_that(actual.splitlines()[0], contains_string('12.5 ms'))
+        assert_that(actual.splitlines()[1], contains_string('500.0 ms'))
+
+
+if __name__ == '__main__':
+    unittest.main()
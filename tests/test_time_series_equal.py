@@ -44,8 +44,8 @@ def assert_time_series_equal(expected_name, start_time_point, values, create_sut
         toolz.map(lambda dt: int(dt.timestamp())),
         list,
     )
-    stub_python_time_series_arrays_dto = tsn.StubPythonTimesSeriesArraysDto(values,
-                                                                            stub_unix_time_stamps)
+    stub_python_time_series_arrays_dto = tsn.create_stub_python_time_series_arrays_dto(values,
+                                                                                      stub_unix_time_stamps)
     with unittest.mock.patch('orchid.base_time_series_adapter.loader.as_python_time_series_arrays',
                              spec=loader.as_python_time_series_arrays,
                              return_value=stub_python_time_series_arrays_dto):
@@ -54,7 +54,7 @@ def assert_time_series_equal(expected_name, start_time_point, values, create_sut
             lambda st: tsn.create_30_second_time_points(st, len(values)),
             toolz.map(lambda dt: int(dt.timestamp())),
             toolz.map(lambda uts: np.datetime64(uts, 's')),
-            lambda tss: pd.DatetimeIndex(tss, tz='UTC'),
+            lambda tss: pd.DatetimeIndex(tss, tz='UTC').as_unit('ns'),
         )
         expected = pd.Series(data=values, index=expected_time_points, name=expected_name, dtype='float64')
         pdt.assert_series_equal(sut.data_points(), expected)